@@ -2,82 +2,75 @@
 """
 Claude Code 文档爬虫脚本
 将 https://code.claude.com/docs 的文档爬取并转换为 Markdown 文件
+
+页面不再手工维护：从 sitemap.xml（如果有）和入口页出发广度优先爬取，
+沿导航栏和正文中的文档链接发现新页面（URL 规范化去重，限制深度和总数），
+INDEX.md 的分类和顺序取自导航栏。
+
+--merge / --merge-only 把文档按 INDEX.md 顺序流式合并为 claude-code-llms.txt，
+去掉各页面的文档头和重复的样板段落，并估算 token 数，可按上限切分为 llms-part-N.txt。
+
+页面由线程池并发下载（每个 host 一个令牌桶限速，代替固定 sleep），
+HTML 解析与 Markdown 转换在进程池中进行，CPU 计算与网络 I/O 重叠。
+
+增量爬取：docs/manifest.json 记录每个页面的 ETag、Last-Modified、内容哈希和链接，
+请求带条件头（304 直接跳过），只有转换结果真正变化的文件才会重写，
+结束时报告新增/更新/移除的页面。
+
+用法:
+    python crawl_docs.py
+    python crawl_docs.py --workers 8 --rate 4
+    python crawl_docs.py --base-url http://127.0.0.1:8000/docs --output /tmp/docs
+    python crawl_docs.py --full    # 忽略 manifest，重新下载全部页面
+    python crawl_docs.py --max-depth 2 --no-sitemap
+    python crawl_docs.py --merge-only --shard-tokens 50000  # 合并为 claude-code-llms.txt 并分片
 """
 
+import argparse
+import hashlib
+import json
 import os
 import re
+import threading
 import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import requests
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urldefrag, urljoin, urlparse
+from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
+
+try:
+    import lxml  # noqa: F401  可选：更快的 HTML 解析器
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # 配置
 BASE_URL = "https://code.claude.com/docs"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "docs")
+MANIFEST_FILENAME = "manifest.json"  # 与 INDEX.md 放在同一目录
 LANGUAGE = "en"  # 爬取英文文档
 
-# 文档页面列表
-DOC_PAGES = [
-    # Getting started
-    "overview",
-    "quickstart",
-    "common-workflows",
-    "changelog",
-    # Outside of the terminal
-    "claude-code-on-the-web",
-    "desktop",
-    "chrome",
-    "vs-code",
-    "jetbrains",
-    "github-actions",
-    "gitlab-ci-cd",
-    "slack",
-    # Build with Claude Code
-    "sub-agents",
-    "plugins",
-    "discover-plugins",
-    "skills",
-    "output-styles",
-    "hooks-guide",
-    "headless",
-    "mcp",
-    "troubleshooting",
-    # Deployment
-    "third-party-integrations",
-    "amazon-bedrock",
-    "google-vertex-ai",
-    "microsoft-foundry",
-    "network-config",
-    "llm-gateway",
-    "devcontainer",
-    "sandboxing",
-    # Administration
-    "setup",
-    "iam",
-    "security",
-    "data-usage",
-    "monitoring-usage",
-    "costs",
-    "analytics",
-    "plugin-marketplaces",
-    # Configuration
-    "settings",
-    "terminal-config",
-    "model-config",
-    "memory",
-    "statusline",
-    # Reference
-    "cli-reference",
-    "interactive-mode",
-    "slash-commands",
-    "checkpointing",
-    "hooks",
-    "plugins-reference",
-    # Resources
-    "legal-and-compliance",
-]
+# 页面发现：从 sitemap.xml 和入口页出发广度优先爬取，沿导航栏和正文链接发现新页面
+START_PAGE = "overview"  # 入口页（导航栏在每个页面上都有）
+SITEMAP_NAMES = ("sitemap.xml",)  # 依次在 BASE_URL 和站点根目录下查找
+MAX_DEPTH = 3      # 距入口页/sitemap 的最大链接深度
+MAX_PAGES = 500    # 最多爬取的页面数（防止链接失控）
+OTHER_CATEGORY = "Other"  # 不在导航栏中的页面归入此分类
+
+# 合并为供 LLM 读取的单个文件
+LLMS_FILENAME = "claude-code-llms.txt"
+SHARD_FILENAME = "llms-part-{}.txt"  # 分片与合并文件放在同一目录
+SHARD_PATTERN = re.compile(r"llms-part-(\d+)\.txt")
+INDEX_LINK = re.compile(r"^- \[[^\]]*\]\(\./(.+?)\.md\)", re.M)
+CHARS_PER_TOKEN = 4           # token 数估算
+BOILERPLATE_MIN_PAGES = 3     # 在这么多页面中重复出现的段落视为样板
+BOILERPLATE_MIN_CHARS = 40    # 更短的段落不去重
 
 # HTTP 请求头
 HEADERS = {
@@ -87,21 +80,143 @@ HEADERS = {
 }
 
 
-def fetch_page(url: str) -> str | None:
-    """获取页面 HTML 内容"""
+# 超时 (连接, 读取) 与重试策略
+TIMEOUT = (10, 30)
+RETRIES = 3
+
+# 并发与限速
+FETCH_WORKERS = 8          # 并发下载数
+PARSE_WORKERS = min(4, os.cpu_count() or 1)  # 解析进程数
+REQUESTS_PER_SECOND = 4.0  # 每个 host 的平均请求速率
+BURST = 4                  # 每个 host 允许的突发请求数
+
+# 主内容区域的候选位置，按优先级排列
+MAIN_CONTENT = [
+    {"name": "article"},
+    {"name": "main"},
+    {"attrs": {"role": "main"}},
+    {"class_": "docs-content"},
+    {"class_": "content"},
+    {"id": "content"},
+    {"class_": "markdown-body"},
+]
+
+# 需要从正文中移除的元素
+NOISE_TAGS = {"nav", "header", "footer", "script", "style", "button"}
+NOISE_CLASSES = {"sidebar", "toc", "navigation", "copy-button", "ask-ai"}
+
+# 页面中的界面文字和 shiki 代码块标记
+UI_TEXT = re.compile(r"^(Copy|Ask AI)$")
+SHIKI_FENCE = re.compile(r"^```(?:language-)?shiki\b")
+
+CONVERTER = MarkdownConverter(
+    heading_style="ATX",
+    bullets="-",
+    code_language_callback=lambda el: el.get("class", [""])[0].replace("language-", "") if el.get("class") else "",
+)
+
+
+class TokenBucket:
+    """令牌桶限速：平均每秒 rate 个请求，最多连续突发 capacity 个（线程安全）"""
+
+    def __init__(self, rate: float, capacity: int = BURST):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """取一个令牌，没有令牌时等待"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def host_bucket(url: str, rate: float = REQUESTS_PER_SECOND) -> TokenBucket:
+    """获取 URL 所在 host 的令牌桶"""
+    host = urlparse(url).netloc
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(rate)
+        return _buckets[host]
+
+
+def create_session() -> requests.Session:
+    """创建复用连接的 Session：keep-alive 连接池，429/5xx 带抖动退避重试并遵守 Retry-After"""
+    retry_options = dict(
+        total=RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+    )
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        retry = Retry(backoff_jitter=0.5, **retry_options)
+    except TypeError:  # urllib3 < 2 没有 backoff_jitter
+        retry = Retry(**retry_options)
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = create_session()
+
+
+def fetch_page(
+    url: str,
+    rate: float = REQUESTS_PER_SECOND,
+    entry: dict | None = None,
+) -> requests.Response | None:
+    """
+    获取页面（按 host 限速）
+
+    entry 为 manifest 中的记录时发送条件请求，页面未变化时返回 304 响应。
+    """
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    host_bucket(url, rate).acquire()
+    try:
+        response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+        if response.status_code == 304:
+            return response
         response.raise_for_status()
-        return response.text
+        return response
     except requests.RequestException as e:
         print(f"  ❌ 获取失败: {e}")
         return None
 
 
-def extract_main_content(html: str) -> tuple[str, str]:
-    """从 HTML 中提取主要内容区域，返回 (title, content_html)"""
-    soup = BeautifulSoup(html, "html.parser")
+def is_noise(tag: Tag) -> bool:
+    return (
+        tag.name in NOISE_TAGS
+        or tag.has_attr("data-copy")
+        or not NOISE_CLASSES.isdisjoint(tag.get("class") or ())
+    )
+
 
+def extract_main_content(soup: BeautifulSoup) -> tuple[str, Tag | None]:
+    """从解析树中提取主要内容区域并就地清理，返回 (title, content)"""
     # 提取标题
     title = ""
     title_tag = soup.find("h1")
@@ -111,19 +226,8 @@ def extract_main_content(html: str) -> tuple[str, str]:
     # 尝试找到主内容区域 - 通常在 article 或 main 标签中
     main_content = None
 
-    # 尝试不同的选择器
-    selectors = [
-        "article",
-        "main",
-        "[role='main']",
-        ".docs-content",
-        ".content",
-        "#content",
-        ".markdown-body",
-    ]
-
-    for selector in selectors:
-        main_content = soup.select_one(selector)
+    for query in MAIN_CONTENT:
+        main_content = soup.find(**query)
         if main_content:
             break
 
@@ -131,92 +235,249 @@ def extract_main_content(html: str) -> tuple[str, str]:
     if not main_content:
         main_content = soup.find("body")
 
-    if main_content:
-        # 移除不需要的元素
-        for element in main_content.select("nav, header, footer, script, style, .sidebar, .toc, .navigation"):
-            element.decompose()
-
-        return title, str(main_content)
-
-    return title, ""
-
-
-def html_to_markdown(html: str, base_url: str) -> str:
-    """将 HTML 转换为 Markdown"""
-    # 先用 BeautifulSoup 清理 HTML
-    soup = BeautifulSoup(html, "html.parser")
+    if not main_content:
+        return title, None
 
-    # 移除按钮和交互元素
-    for btn in soup.select("button, .copy-button, [data-copy], .ask-ai"):
-        btn.decompose()
+    # 移除不需要的元素、按钮和交互元素（一次遍历）
+    for element in main_content.find_all(is_noise):
+        if not element.decomposed:  # 可能已随父元素一起移除
+            element.decompose()
 
     # 移除 "Copy" 和 "Ask AI" 文本节点
-    for text_node in soup.find_all(string=re.compile(r"^(Copy|Ask AI)$")):
+    for text_node in main_content.find_all(string=UI_TEXT):
         if text_node.parent and text_node.parent.name not in ["code", "pre"]:
             text_node.extract()
 
     # 修复代码块语言
-    for code in soup.select("code"):
+    for code in main_content.find_all("code", class_=True):
         classes = code.get("class", [])
         for cls in classes:
             if "language-shiki" in cls or cls == "shiki":
                 # 尝试从父元素或 data 属性获取真实语言
                 code["class"] = [c.replace("shiki", "bash") for c in classes]
 
-    html = str(soup)
+    return title, main_content
+
+
+def clean_markdown(markdown: str) -> str:
+    """
+    逐行清理 markdownify 输出（单次遍历）:
+    shiki 代码块语言改为 bash、去掉残留的 "Copy"/"Ask AI" 行、
+    去掉行尾空白、合并连续空行
+    """
+    lines = []
+    blank = False
+    for line in markdown.split("\n"):
+        line = line.rstrip()
+        if line in ("Copy", "Ask AI"):
+            continue
+        if line.startswith("```"):
+            line = SHIKI_FENCE.sub("```bash", line, count=1)
+        if not line:
+            if blank:
+                continue
+            blank = True
+        else:
+            blank = False
+        lines.append(line)
+    return "\n".join(lines).strip()
 
-    # 使用 markdownify 转换
-    markdown = md(
-        html,
-        heading_style="ATX",
-        bullets="-",
-        code_language_callback=lambda el: el.get("class", [""])[0].replace("language-", "") if el.get("class") else "",
-    )
 
-    # 清理 shiki 语言标记
-    markdown = re.sub(r"```shiki\b", "```bash", markdown)
-    markdown = re.sub(r"```language-shiki\b", "```bash", markdown)
+def html_to_markdown(content: Tag) -> str:
+    """将已清理的内容节点直接转换为 Markdown（不再序列化后重新解析）"""
+    return clean_markdown(CONVERTER.convert_soup(content))
 
-    # 移除残留的 "Copy" 和 "Ask AI"
-    markdown = re.sub(r"\nCopy\n", "\n", markdown)
-    markdown = re.sub(r"\nAsk AI\n", "\n", markdown)
-    markdown = re.sub(r"^Copy$", "", markdown, flags=re.MULTILINE)
-    markdown = re.sub(r"^Ask AI$", "", markdown, flags=re.MULTILINE)
 
-    # 清理多余的空行
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+def write_if_changed(filename: str, content: str) -> bool:
+    """内容与现有文件不同时才（原子地）写入，返回是否写入"""
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)  # slug 可能包含子目录
+    try:
+        with open(filepath, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
+    return True
 
-    # 清理行首行尾空白
-    lines = [line.rstrip() for line in markdown.split("\n")]
-    markdown = "\n".join(lines)
 
-    return markdown.strip()
+def save_markdown(content: str, filename: str) -> bool:
+    """保存 Markdown 文件，内容未变化时不重写"""
+    if not write_if_changed(content=content, filename=filename):
+        return False
+    print(f"  ✅ 已保存: {filename}")
+    return True
 
 
-def save_markdown(content: str, filename: str):
-    """保存 Markdown 文件"""
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"  ✅ 已保存: {filename}")
+def load_manifest() -> dict:
+    """
+    读取 manifest:
+    {"pages": {slug: {etag, last_modified, sha256, links}}, "nav": [[分类, [slug, ...]], ...]}
+    """
+    try:
+        with open(os.path.join(OUTPUT_DIR, MANIFEST_FILENAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"pages": {}, "nav": []}
+    if not isinstance(manifest.get("pages"), dict):
+        return {"pages": {}, "nav": []}
+    return manifest
 
 
-def crawl_page(page_slug: str) -> bool:
-    """爬取单个页面"""
-    url = f"{BASE_URL}/{LANGUAGE}/{page_slug}"
-    print(f"\n📄 正在爬取: {page_slug}")
-    print(f"   URL: {url}")
+def save_manifest(manifest: dict):
+    """保存 manifest"""
+    write_if_changed(MANIFEST_FILENAME, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
 
-    html = fetch_page(url)
-    if not html:
-        return False
 
-    title, content_html = extract_main_content(html)
-    if not content_html:
-        print("  ⚠️ 未找到内容")
-        return False
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
 
-    markdown = html_to_markdown(content_html, url)
+def page_url(page_slug: str) -> str:
+    """页面 slug 对应的 URL"""
+    return f"{BASE_URL}/{LANGUAGE}/{page_slug}"
+
+
+def docs_prefix() -> str:
+    """当前语言文档页面的 URL 前缀，只有此前缀下的链接会被爬取"""
+    return f"{BASE_URL}/{LANGUAGE}/"
+
+
+def link_slug(href: str | None, base_url: str, prefix: str) -> str | None:
+    """把链接规范化为页面 slug（去掉锚点、查询串和末尾斜杠），站外链接和静态资源返回 None"""
+    if not href:
+        return None
+    url = urldefrag(urljoin(base_url, href))[0].split("?", 1)[0].rstrip("/")
+    if not url.startswith(prefix):
+        return None
+    slug = url[len(prefix):]
+    if not slug or "." in slug.rsplit("/", 1)[-1]:
+        return None
+    return slug
+
+
+def fetch_sitemap(rate: float = REQUESTS_PER_SECOND) -> list[str]:
+    """
+    从 sitemap.xml 读取文档页面（sitemap 索引会逐层展开）
+
+    Returns:
+        当前语言下的页面 slug（按 sitemap 顺序去重），没有 sitemap 时返回空列表
+    """
+    prefix = docs_prefix()
+    root = "{0.scheme}://{0.netloc}/".format(urlparse(BASE_URL))
+    candidates = [urljoin(f"{BASE_URL}/", name) for name in SITEMAP_NAMES]
+    candidates += [urljoin(root, name) for name in SITEMAP_NAMES]
+
+    slugs = {}
+    for sitemap in dict.fromkeys(candidates):
+        queue = [sitemap]
+        seen = set(queue)
+        while queue:
+            url = queue.pop(0)
+            host_bucket(url, rate).acquire()
+            try:
+                response = SESSION.get(url, timeout=TIMEOUT)
+                response.raise_for_status()
+                tree = ET.fromstring(response.content)
+            except (requests.RequestException, ET.ParseError):
+                continue
+
+            locs = [el.text.strip() for el in tree.iter() if el.tag.endswith("loc") and el.text]
+            if tree.tag.endswith("sitemapindex"):
+                for loc in locs:
+                    if loc not in seen:
+                        seen.add(loc)
+                        queue.append(loc)
+                continue
+            for loc in locs:
+                slug = link_slug(loc, url, prefix)
+                if slug:
+                    slugs[slug] = None
+        if slugs:
+            print(f"🗺️  sitemap: {sitemap} ({len(slugs)} 个页面)")
+            break
+
+    return list(slugs)
+
+
+# 导航栏的候选位置，取包含文档链接最多的一个
+NAV_CONTAINERS = [
+    {"id": "sidebar"},
+    {"id": "sidebar-content"},
+    {"class_": "sidebar"},
+    {"name": "nav"},
+    {"name": "aside"},
+]
+NAV_HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+
+def nav_groups(container: Tag, base_url: str, prefix: str) -> list[tuple[str, list[str]]]:
+    """按文档顺序遍历导航栏，每个链接归入它前面最近的分组标题"""
+    groups: dict[str, list[str]] = {}
+    seen = set()
+    category = OTHER_CATEGORY
+    for element in container.descendants:
+        if not isinstance(element, Tag):
+            continue
+        if element.name in NAV_HEADINGS or "sidebar-group-header" in (element.get("class") or ()):
+            category = element.get_text(" ", strip=True) or category
+        elif element.name == "a":
+            slug = link_slug(element.get("href"), base_url, prefix)
+            if slug and slug not in seen:
+                seen.add(slug)
+                groups.setdefault(category, []).append(slug)
+    return list(groups.items())
+
+
+def extract_nav(soup: BeautifulSoup, base_url: str, prefix: str) -> list[tuple[str, list[str]]]:
+    """从导航栏提取分类：[(分类名, [slug, ...]), ...]，没有导航栏时返回空列表"""
+    best, best_count = [], 0
+    for query in NAV_CONTAINERS:
+        for container in soup.find_all(**query):
+            groups = nav_groups(container, base_url, prefix)
+            count = sum(len(slugs) for _, slugs in groups)
+            if count > best_count:
+                best, best_count = groups, count
+    return best
+
+
+def extract_links(soup: BeautifulSoup, base_url: str, prefix: str) -> list[str]:
+    """页面中指向其他文档页面的链接（按出现顺序去重）"""
+    links = {}
+    for a in soup.find_all("a", href=True):
+        slug = link_slug(a["href"], base_url, prefix)
+        if slug:
+            links[slug] = None
+    return list(links)
+
+
+def convert_page(html: str, url: str, prefix: str | None = None) -> dict:
+    """
+    解析页面（在解析进程中运行，只解析一次）
+
+    导航栏和链接在清理正文之前提取。
+
+    Returns:
+        {"content": 带文档头的 Markdown 或 None, "nav": 导航分类, "links": 文档链接}
+    """
+    prefix = prefix or docs_prefix()
+    soup = BeautifulSoup(html, HTML_PARSER)
+    page = {
+        "content": None,
+        "nav": extract_nav(soup, url, prefix),
+        "links": extract_links(soup, url, prefix),
+    }
+
+    title, content = extract_main_content(soup)
+    if content is None:
+        return page
+
+    markdown = html_to_markdown(content)
 
     # 添加文档头信息
     header = f"""---
@@ -226,17 +487,184 @@ title: {title}
 
 """
 
-    full_content = header + markdown
+    page["content"] = header + markdown
+    return page
+
+
+def crawl_page(page_slug: str) -> bool:
+    """爬取单个页面"""
+    url = page_url(page_slug)
+    print(f"\n📄 正在爬取: {page_slug}")
+    print(f"   URL: {url}")
+
+    response = fetch_page(url)
+    if response is None:
+        return False
+
+    content = convert_page(response.text, url)["content"]
+    if content is None:
+        print("  ⚠️ 未找到内容")
+        return False
 
     # 保存文件
-    filename = f"{page_slug}.md"
-    save_markdown(full_content, filename)
+    save_markdown(content, f"{page_slug}.md")
 
     return True
 
 
-def create_index(successful_pages: list[str]):
-    """创建索引文件"""
+def crawl_pages(
+    seeds: list[str],
+    manifest: dict | None = None,
+    fetch_workers: int = FETCH_WORKERS,
+    parse_workers: int = PARSE_WORKERS,
+    rate: float = REQUESTS_PER_SECOND,
+    max_depth: int = MAX_DEPTH,
+    max_pages: int = MAX_PAGES,
+) -> tuple[list[str], list[str], dict[str, str], bool]:
+    """
+    从 seeds 出发广度优先并发爬取页面
+
+    下载在线程池中进行（每个 host 令牌桶限速），每个页面下载完成后立即
+    提交到解析进程池，解析与后续下载并行。解析出的导航栏和正文链接中
+    未见过的页面以深度 +1 加入下载队列（队列先进先出，即广度优先），
+    超过 max_depth 或 max_pages 的页面不再加入。
+
+    manifest 中已有且文件存在的页面发送条件请求；返回 304 的页面用
+    manifest 中记录的链接和导航栏继续发现页面。manifest 会被就地更新，
+    manifest["nav"] 为本次的导航分类。
+
+    Returns:
+        (成功的 slug 列表, 失败的 slug 列表, {slug: "new" | "changed"}, 是否因 max_pages 截断)，
+        前两个按发现顺序；未变化的页面也算成功
+    """
+    manifest = {} if manifest is None else manifest
+    entries = manifest.setdefault("pages", {})
+    old_nav = manifest.get("nav") or []
+    nav = None
+    prefix = docs_prefix()
+
+    depths: dict[str, int] = {}  # 已发现的页面及其深度（去重）
+    successful = set()
+    failed = set()
+    changes = {}
+    truncated = False
+
+    def cached_entry(slug: str) -> dict | None:
+        if os.path.exists(os.path.join(OUTPUT_DIR, f"{slug}.md")):
+            return entries.get(slug)
+        return None
+
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 1 else None
+    try:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+            pending = {}  # future -> (阶段, slug, 数据)
+
+            def discover(slug: str, depth: int):
+                nonlocal truncated
+                if slug in depths or depth > max_depth:
+                    return
+                if len(depths) >= max_pages:
+                    truncated = True
+                    return
+                depths[slug] = depth
+                future = fetch_pool.submit(fetch_page, page_url(slug), rate, cached_entry(slug))
+                pending[future] = ("fetch", slug, None)
+
+            def follow(slug: str, links: list[str], groups: list):
+                for linked in [s for _, slugs in groups for s in slugs] + links:
+                    discover(linked, depths[slug] + 1)
+
+            for slug in seeds:
+                discover(slug, 0)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, slug, validators = pending.pop(future)
+
+                    if stage == "fetch":
+                        response = future.result()
+                        if response is None:
+                            print(f"  ❌ {slug}")
+                            failed.add(slug)
+                        elif response.status_code == 304:
+                            successful.add(slug)
+                            follow(slug, entries[slug].get("links", []), old_nav)
+                        else:
+                            validators = {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            }
+                            pool = parse_pool if parse_pool is not None else fetch_pool
+                            future = pool.submit(convert_page, response.text, page_url(slug), prefix)
+                            pending[future] = ("parse", slug, validators)
+                        continue
+
+                    page = future.result()
+                    # 导航栏在各页面上相同：优先用入口页的，其次用第一个解析出导航栏的页面
+                    if page["nav"] and (nav is None or slug == seeds[0]):
+                        nav = page["nav"]
+                    nav_slugs = {s for _, slugs in page["nav"] for s in slugs}
+                    links = [s for s in page["links"] if s not in nav_slugs]
+                    follow(slug, links, page["nav"])
+
+                    content = page["content"]
+                    if content is None:
+                        print(f"  ⚠️ 未找到内容: {slug}")
+                        failed.add(slug)
+                        continue
+
+                    existed = os.path.exists(os.path.join(OUTPUT_DIR, f"{slug}.md"))
+                    if save_markdown(content, f"{slug}.md"):
+                        changes[slug] = "changed" if existed else "new"
+                    entry = {k: v for k, v in validators.items() if v}
+                    entries[slug] = {**entry, "sha256": content_hash(content), "links": links}
+                    successful.add(slug)
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    manifest["nav"] = nav if nav is not None else old_nav
+    if truncated:
+        print(f"  ⚠️ 已达到页面上限 {max_pages}，其余链接未爬取")
+
+    return (
+        [slug for slug in depths if slug in successful],
+        [slug for slug in depths if slug in failed],
+        changes,
+        truncated,
+    )
+
+
+def remove_stale_pages(pages: list[str], manifest: dict) -> list[str]:
+    """删除 manifest 中本次未发现的文档，返回被移除的 slug"""
+    entries = manifest.setdefault("pages", {})
+    removed = sorted(set(entries) - set(pages))
+    for slug in removed:
+        try:
+            os.remove(os.path.join(OUTPUT_DIR, f"{slug}.md"))
+        except FileNotFoundError:
+            pass
+        del entries[slug]
+    return removed
+
+
+def print_changes(changes: dict[str, str], removed: list[str], total: int):
+    """打印本次爬取的变更"""
+    new = [slug for slug, kind in changes.items() if kind == "new"]
+    changed = [slug for slug, kind in changes.items() if kind == "changed"]
+    print(f"变更: 新增 {len(new)}, 更新 {len(changed)}, 移除 {len(removed)}, "
+          f"未变化 {total - len(new) - len(changed)}")
+    for slug in sorted(new):
+        print(f"  + {slug}")
+    for slug in sorted(changed):
+        print(f"  ~ {slug}")
+    for slug in removed:
+        print(f"  - {slug}")
+
+
+def create_index(successful_pages: list[str], nav: list | None = None):
+    """创建索引文件，按导航栏分类和顺序列出页面"""
     index_content = """---
 title: Claude Code Documentation Index
 ---
@@ -249,18 +677,17 @@ title: Claude Code Documentation Index
 
 """
 
-    categories = {
-        "Getting Started": ["overview", "quickstart", "common-workflows", "changelog"],
-        "Outside of the Terminal": ["claude-code-on-the-web", "desktop", "chrome", "vs-code", "jetbrains", "github-actions", "gitlab-ci-cd", "slack"],
-        "Build with Claude Code": ["sub-agents", "plugins", "discover-plugins", "skills", "output-styles", "hooks-guide", "headless", "mcp", "troubleshooting"],
-        "Deployment": ["third-party-integrations", "amazon-bedrock", "google-vertex-ai", "microsoft-foundry", "network-config", "llm-gateway", "devcontainer", "sandboxing"],
-        "Administration": ["setup", "iam", "security", "data-usage", "monitoring-usage", "costs", "analytics", "plugin-marketplaces"],
-        "Configuration": ["settings", "terminal-config", "model-config", "memory", "statusline"],
-        "Reference": ["cli-reference", "interactive-mode", "slash-commands", "checkpointing", "hooks", "plugins-reference"],
-        "Resources": ["legal-and-compliance"],
-    }
+    # 分类来自导航栏；不在导航栏中的页面归入 OTHER_CATEGORY
+    categories = {category: list(pages) for category, pages in nav or []}
+    listed = {page for pages in categories.values() for page in pages}
+    unlisted = [page for page in successful_pages if page not in listed]
+    successful_pages = set(successful_pages)
+    if unlisted:
+        categories.setdefault(OTHER_CATEGORY, []).extend(unlisted)
 
     for category, pages in categories.items():
+        if not any(page in successful_pages for page in pages):
+            continue
         index_content += f"### {category}\n\n"
         for page in pages:
             if page in successful_pages:
@@ -270,8 +697,230 @@ title: Claude Code Documentation Index
     save_markdown(index_content, "INDEX.md")
 
 
+def split_frontmatter(text: str) -> tuple[dict[str, str], str]:
+    """拆出文档头（简单的 key: value 行），返回 (字段, 正文)"""
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return {}, text
+    fields = {}
+    for line in text[4:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields, text[end + 5:]
+
+
+def markdown_blocks(body: str) -> list[str]:
+    """按空行把正文切成块，代码块（``` 围起来的部分）不会被切开"""
+    blocks, lines = [], []
+    in_fence = False
+    for line in body.strip().split("\n"):
+        if line.startswith("```"):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if lines:
+                blocks.append("\n".join(lines))
+                lines = []
+            continue
+        lines.append(line)
+    if lines:
+        blocks.append("\n".join(lines))
+    return blocks
+
+
+def block_key(block: str) -> str | None:
+    """可去重的块的指纹；标题、代码块和短块不参与去重，返回 None"""
+    if len(block) < BOILERPLATE_MIN_CHARS or block.startswith("#") or "```" in block:
+        return None
+    return hashlib.sha1(" ".join(block.split()).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """粗略估算 token 数（约 4 个字符一个 token）"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def index_order() -> list[str]:
+    """按 INDEX.md 中的分类顺序列出页面，不在索引中的页面按名称排在最后"""
+    slugs = {}
+    try:
+        with open(os.path.join(OUTPUT_DIR, "INDEX.md"), encoding="utf-8") as f:
+            for match in INDEX_LINK.finditer(f.read()):
+                slugs[match.group(1)] = None
+    except FileNotFoundError:
+        pass
+
+    found = []
+    for root, _, files in os.walk(OUTPUT_DIR):
+        for name in files:
+            if name.endswith(".md"):
+                rel = os.path.relpath(os.path.join(root, name), OUTPUT_DIR)
+                found.append(rel[:-3].replace(os.sep, "/"))
+    found = set(found) - {"INDEX"}
+
+    return [slug for slug in slugs if slug in found] + sorted(found - set(slugs))
+
+
+def read_page(slug: str) -> str:
+    with open(os.path.join(OUTPUT_DIR, f"{slug}.md"), encoding="utf-8") as f:
+        return f.read()
+
+
+def render_page(slug: str, boilerplate: set[str], seen: set[str]) -> tuple[str, int]:
+    """
+    生成合并文件中的一个页面：文档头换成标题和来源行，
+    已经出现过的样板块（在多个页面中重复的段落）被去掉
+
+    Returns:
+        (页面文本, 去掉的块数)
+    """
+    fields, body = split_frontmatter(read_page(slug))
+    kept, dropped = [], 0
+    for block in markdown_blocks(body):
+        key = block_key(block)
+        if key in boilerplate:
+            if key in seen:
+                dropped += 1
+                continue
+            seen.add(key)
+        kept.append(block)
+
+    title = fields.get("title") or slug
+    header = [] if kept and kept[0] == f"# {title}" else [f"# {title}"]
+    if fields.get("source"):
+        header.append(f"Source: {fields['source']}")
+    return "\n\n".join(header + kept) + "\n\n---\n\n", dropped
+
+
+def merge_header(part: int | None = None) -> str:
+    title = "# Claude Code Documentation" + (f" (Part {part})" if part else "")
+    generated = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    return f"{title}\n\nSource: {BASE_URL}\nGenerated: {generated}\n\n---\n\n"
+
+
+def merge_docs(output_path: str, shard_tokens: int | None = None) -> dict:
+    """
+    把文档合并成一个供 LLM 读取的文本文件（流式写入，不在内存中拼接全部内容）
+
+    页面按 INDEX.md 的顺序排列，去掉各自的文档头；在至少
+    BOILERPLATE_MIN_PAGES 个页面中重复出现的段落只保留第一次。
+    指定 shard_tokens 时另外按估算的 token 数切分为 llms-part-N.txt，
+    只在页面之间切分（单个超大页面独占一个分片）。
+
+    Returns:
+        {"pages", "tokens", "dropped", "shards"} 统计信息
+    """
+    slugs = index_order()
+
+    # 第一遍：统计每个块出现在多少个页面中
+    counts = Counter()
+    for slug in slugs:
+        _, body = split_frontmatter(read_page(slug))
+        counts.update({key for key in map(block_key, markdown_blocks(body)) if key})
+    boilerplate = {key for key, n in counts.items() if n >= BOILERPLATE_MIN_PAGES}
+
+    # 第二遍：逐页写出
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    shards = []  # [(临时路径, 最终路径)]
+    shard, shard_used, shard_pages = None, 0, 0
+    stats = {"pages": len(slugs), "tokens": 0, "dropped": 0, "shards": 0}
+    seen = set()
+
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            header = merge_header()
+            out.write(header)
+            stats["tokens"] += estimate_tokens(header)
+
+            for slug in slugs:
+                text, dropped = render_page(slug, boilerplate, seen)
+                tokens = estimate_tokens(text)
+                out.write(text)
+                stats["tokens"] += tokens
+                stats["dropped"] += dropped
+
+                if not shard_tokens:
+                    continue
+                if shard is None or (shard_used + tokens > shard_tokens and shard_pages):
+                    if shard is not None:
+                        shard.close()
+                    final = os.path.join(output_dir, SHARD_FILENAME.format(len(shards) + 1))
+                    shards.append((f"{final}.tmp", final))
+                    shard = open(shards[-1][0], "w", encoding="utf-8")
+                    shard_header = merge_header(len(shards))
+                    shard.write(shard_header)
+                    shard_used, shard_pages = estimate_tokens(shard_header), 0
+                shard.write(text)
+                shard_used += tokens
+                shard_pages += 1
+        if shard is not None:
+            shard.close()
+            shard = None
+
+        os.replace(tmp_path, output_path)
+        for tmp, final in shards:
+            os.replace(tmp, final)
+    finally:
+        if shard is not None:
+            shard.close()
+        for path in [tmp_path] + [tmp for tmp, _ in shards]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    # 删除上次生成、本次已不需要的分片
+    for name in os.listdir(output_dir):
+        match = SHARD_PATTERN.fullmatch(name)
+        if match and int(match.group(1)) > len(shards):
+            os.remove(os.path.join(output_dir, name))
+
+    stats["shards"] = len(shards)
+    return stats
+
+
+def merge(output_path: str, shard_tokens: int | None = None):
+    """合并文档并打印统计"""
+    print(f"\n📦 合并文档到 {output_path}...")
+    stats = merge_docs(output_path, shard_tokens)
+    print(f"  页面: {stats['pages']}, 去掉重复段落: {stats['dropped']}, 约 {stats['tokens']:,} tokens")
+    if stats["shards"]:
+        print(f"  分片: {stats['shards']} 个 {SHARD_FILENAME.format('N')} (每个不超过约 {shard_tokens:,} tokens)")
+
+
 def main():
     """主函数"""
+    global BASE_URL, OUTPUT_DIR
+
+    parser = argparse.ArgumentParser(description="爬取 Claude Code 文档并转换为 Markdown")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"文档站点根 URL (默认: {BASE_URL})")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="输出目录 (默认: ./docs)")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, help=f"并发下载数 (默认: {FETCH_WORKERS})")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS,
+                        help=f"解析进程数，1 表示在下载线程中解析 (默认: {PARSE_WORKERS})")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                        help=f"每个 host 每秒请求数 (默认: {REQUESTS_PER_SECOND})")
+    parser.add_argument("--max-depth", type=int, default=MAX_DEPTH,
+                        help=f"距入口页/sitemap 的最大链接深度 (默认: {MAX_DEPTH})")
+    parser.add_argument("--max-pages", type=int, default=MAX_PAGES, help=f"最多爬取的页面数 (默认: {MAX_PAGES})")
+    parser.add_argument("--no-sitemap", action="store_true", help="不读取 sitemap.xml，只沿链接发现页面")
+    parser.add_argument("--full", action="store_true", help="忽略 manifest，重新下载全部页面")
+    parser.add_argument("--merge", action="store_true", help=f"爬取后合并为 {LLMS_FILENAME}")
+    parser.add_argument("--merge-only", action="store_true", help="不爬取，只合并已有文档")
+    parser.add_argument("--llms-output", default=os.path.join(SCRIPT_DIR, LLMS_FILENAME),
+                        help=f"合并文件路径 (默认: ./{LLMS_FILENAME})")
+    parser.add_argument("--shard-tokens", type=int,
+                        help="另外按估算 token 数切分为 llms-part-N.txt（每个分片的上限）")
+    args = parser.parse_args()
+
+    BASE_URL = args.base_url.rstrip("/")
+    OUTPUT_DIR = args.output
+
+    if args.merge_only:
+        merge(args.llms_output, args.shard_tokens)
+        return
+
     # 确保输出目录存在
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -279,34 +928,40 @@ def main():
     print("Claude Code 文档爬虫")
     print("=" * 60)
     print(f"输出目录: {OUTPUT_DIR}")
-    print(f"文档数量: {len(DOC_PAGES)}")
-
-    successful = []
-    failed = []
 
-    for page_slug in DOC_PAGES:
-        if crawl_page(page_slug):
-            successful.append(page_slug)
-        else:
-            failed.append(page_slug)
-
-        # 礼貌性延迟，避免请求过快
-        time.sleep(0.5)
+    started = time.monotonic()
+    seeds = [START_PAGE] + ([] if args.no_sitemap else fetch_sitemap(args.rate))
+    manifest = {} if args.full else load_manifest()
+    successful, failed, changes, truncated = crawl_pages(
+        seeds, manifest, args.workers, args.parse_workers, args.rate, args.max_depth, args.max_pages
+    )
+    # 有页面失败或被截断时发现的页面不完整，不删除旧文档
+    if failed or truncated:
+        removed = []
+    else:
+        removed = remove_stale_pages(successful, manifest)
+    save_manifest(manifest)
 
     # 创建索引
     print("\n📑 创建索引文件...")
-    create_index(successful)
+    create_index(successful, manifest["nav"])
 
     # 打印统计
+    total = len(successful) + len(failed)
     print("\n" + "=" * 60)
     print("爬取完成!")
-    print(f"成功: {len(successful)}/{len(DOC_PAGES)}")
+    print(f"成功: {len(successful)}/{total} (用时 {time.monotonic() - started:.1f}s)")
 
     if failed:
         print(f"失败: {failed}")
 
+    print_changes(changes, removed, len(successful))
+
     print("=" * 60)
 
+    if args.merge:
+        merge(args.llms_output, args.shard_tokens)
+
 
 if __name__ == "__main__":
     main()
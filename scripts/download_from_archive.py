@@ -1,29 +1,65 @@
 #!/usr/bin/env python3
 """
-Download and extract a skill from compressed archive.
+Download and extract skills from a compressed archive.
 
-Supported formats: .zip, .tar.gz, .tgz, .skill (renamed zip)
+Supported formats: .zip, .skill (renamed zip), .tar, .tar.gz/.tgz,
+.tar.bz2/.tbz2, .tar.xz/.txz, .tar.zst/.tzst (zstd needs Python 3.14+ or the
+zstandard package). The format is sniffed from the file's magic bytes, so
+URLs without an extension work too.
+
+By default the shallowest skill is installed. With --path (repeatable,
+globs allowed) or --all, the archive is fetched once and every matching
+skill is installed, followed by a per-skill report.
 
 Usage:
     python download_from_archive.py <url-or-path> --output <output-dir>
+    python download_from_archive.py <url-or-path> --path 'skills/*' --output <output-dir>
 
 Examples:
     python download_from_archive.py https://example.com/my-skill.zip --output ./.claude/skills/
     python download_from_archive.py ./downloads/my-skill.tar.gz --output ./.claude/skills/
     python download_from_archive.py https://skillhub.club/download/skill.skill --output ./.claude/skills/
+    python download_from_archive.py ./bundle.zip --all --output ./.claude/skills/
 """
 
 import argparse
+import bz2
+import gzip
+import hashlib
+import http.client
+import json
+import lzma
 import os
 import shutil
 import sys
 import tarfile
 import tempfile
-import urllib.request
+import time
+import urllib.error
 import zipfile
-from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, ContextManager, Iterator
 from urllib.parse import urlparse
 
+from http_client import request as http_request, retry_delay
+from repo_cache import file_lock
+from skill_install import InstallResult, make_staging_dir, print_install_report, replace_dir
+from skill_metadata import SKILL_FILENAME, load_skill_metadata
+from skill_store import SkillStore
+
+
+DEFAULT_MAX_SIZE = 200 * 1024 * 1024  # 200 MB
+DEFAULT_RETRIES = 3
+CHUNK_SIZE = 64 * 1024
+MAX_SKILL_DEPTH = 3  # How deep below the archive root to look for SKILL.md
+
+# Directories that never hold a skill root but can be huge (bundled deps, data)
+SKIP_DIRS = frozenset({
+    '.git', '__MACOSX', 'node_modules', 'bower_components', '__pycache__',
+    '.venv', 'venv', 'site-packages', '.tox', '.mypy_cache', 'datasets',
+})
+
 
 def is_url(source: str) -> bool:
     """Check if source is a URL."""
@@ -31,125 +67,743 @@ def is_url(source: str) -> bool:
     return parsed.scheme in ('http', 'https')
 
 
+ARCHIVE_EXTENSIONS = {
+    '.zip': 'zip',
+    '.skill': 'zip',
+    '.tar.gz': 'tar.gz',
+    '.tgz': 'tar.gz',
+    '.tar.bz2': 'tar.bz2',
+    '.tbz2': 'tar.bz2',
+    '.tar.xz': 'tar.xz',
+    '.txz': 'tar.xz',
+    '.tar.zst': 'tar.zst',
+    '.tzst': 'tar.zst',
+    '.tar': 'tar',
+}
+
+CONTENT_TYPES = {
+    'application/zip': 'zip',
+    'application/x-zip-compressed': 'zip',
+    'application/gzip': 'tar.gz',
+    'application/x-gzip': 'tar.gz',
+    'application/x-tgz': 'tar.gz',
+    'application/x-gtar': 'tar.gz',
+    'application/x-bzip2': 'tar.bz2',
+    'application/x-xz': 'tar.xz',
+    'application/zstd': 'tar.zst',
+    'application/x-tar': 'tar',
+}
+
+# (offset, magic bytes, archive type)
+MAGIC_BYTES = [
+    (0, b'PK\x03\x04', 'zip'),
+    (0, b'PK\x05\x06', 'zip'),  # Empty zip
+    (0, b'\x1f\x8b', 'tar.gz'),
+    (0, b'BZh', 'tar.bz2'),
+    (0, b'\xfd7zXZ\x00', 'tar.xz'),
+    (0, b'\x28\xb5\x2f\xfd', 'tar.zst'),
+    (257, b'ustar', 'tar'),
+]
+
+TAR_MODES = {
+    'tar': 'r',
+    'tar.gz': 'r:gz',
+    'tar.bz2': 'r:bz2',
+    'tar.xz': 'r:xz',
+}
+
+# Compressed tars are unpacked once to a seekable file (see unpack_to_buffer)
+TAR_DECOMPRESSORS = {
+    'tar.gz': gzip.open,
+    'tar.bz2': bz2.open,
+    'tar.xz': lzma.open,
+}
+MAX_UNPACKED_SIZE = 2 * 1024 * 1024 * 1024  # 2 GB
+
+
 def get_archive_type(path: str) -> str:
     """Determine archive type from path/extension."""
     path_lower = path.lower()
 
-    if path_lower.endswith('.zip') or path_lower.endswith('.skill'):
-        return 'zip'
-    elif path_lower.endswith('.tar.gz') or path_lower.endswith('.tgz'):
-        return 'tar.gz'
-    elif path_lower.endswith('.tar'):
-        return 'tar'
-    else:
-        # Try to detect by content
-        return 'unknown'
+    for ext, archive_type in ARCHIVE_EXTENSIONS.items():
+        if path_lower.endswith(ext):
+            return archive_type
 
+    # Try to detect by content
+    return 'unknown'
 
-def download_file(url: str, target_path: Path) -> None:
-    """Download file from URL."""
-    print(f"📥 Downloading from {url}...")
 
-    # Create request with User-Agent
-    request = urllib.request.Request(
-        url,
-        headers={'User-Agent': 'Mozilla/5.0 (skill-downloader)'}
-    )
+def sniff_archive_type(archive_path: Path) -> str:
+    """Determine archive type from the file's leading magic bytes."""
+    with open(archive_path, 'rb') as f:
+        head = f.read(512)
 
-    with urllib.request.urlopen(request, timeout=60) as response:
-        with open(target_path, 'wb') as f:
-            shutil.copyfileobj(response, f)
+    for offset, magic, archive_type in MAGIC_BYTES:
+        if head[offset:offset + len(magic)] == magic:
+            return archive_type
 
-    print(f"   Downloaded to {target_path}")
+    return 'unknown'
 
 
-def extract_archive(archive_path: Path, extract_dir: Path, archive_type: str) -> Path:
+def detect_archive_type(archive_path: Path, headers: dict[str, str | None] | None = None) -> str:
+    """
+    Pick the archive type once, before opening the archive.
+
+    Magic bytes win; HTTP Content-Disposition filename, Content-Type and
+    finally the file extension are used when the content is inconclusive.
     """
-    Extract archive and return path to skill directory.
+    archive_type = sniff_archive_type(archive_path)
+    if archive_type != 'unknown':
+        return archive_type
+
+    headers = headers or {}
+    if headers.get('filename'):
+        archive_type = get_archive_type(headers['filename'])
+        if archive_type != 'unknown':
+            return archive_type
+
+    content_type = (headers.get('content_type') or '').split(';')[0].strip().lower()
+    if content_type in CONTENT_TYPES:
+        return CONTENT_TYPES[content_type]
+
+    return get_archive_type(str(archive_path))
+
+
+def format_size(num_bytes: float) -> str:
+    """Format a byte count for progress output."""
+    if num_bytes < 1024:
+        return f"{int(num_bytes)} B"
+    for unit in ('KB', 'MB'):
+        num_bytes /= 1024
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+    return f"{num_bytes / 1024:.1f} GB"
+
+
+def default_download_dir() -> Path:
+    """Get the partial download directory, honouring AI_WORKFLOW_DOWNLOAD_DIR and XDG_CACHE_HOME."""
+    if os.environ.get('AI_WORKFLOW_DOWNLOAD_DIR'):
+        return Path(os.environ['AI_WORKFLOW_DOWNLOAD_DIR']).expanduser()
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'ai-workflow' / 'downloads'
+
+
+def partial_download_path(url: str) -> Path:
+    """Get the persistent .part file for a URL, so later runs can resume it."""
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return default_download_dir() / f"{digest}.part"
+
+
+def download_file(
+    url: str,
+    target_path: Path,
+    max_size: int = DEFAULT_MAX_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    timeout: int = 60,
+    part_path: Path | None = None
+) -> dict[str, str | None]:
+    """
+    Download file from URL, streaming it to disk in chunks.
+
+    Data is written to part_path (default: a .part file next to target_path)
+    and moved to target_path once complete. If the connection drops, the
+    download is retried with exponential backoff and resumed from where it
+    stopped using an HTTP Range request.
+
+    The ETag/Last-Modified of the first response are saved in a .json file
+    beside the .part file, so a .part left behind by an earlier run is
+    resumed too, as long as the server still sends the same version
+    (If-Range). A .part file without them is discarded.
+
+    Args:
+        url: URL to download
+        target_path: Where to save the file
+        max_size: Abort if the file is larger than this many bytes
+        retries: Number of retries after a failed attempt
+        timeout: Socket timeout in seconds
+        part_path: Where to keep the partial download
 
     Returns:
-        Path to the extracted skill directory containing SKILL.md
+        Response metadata: {'etag', 'last_modified', 'content_type', 'filename'}
     """
-    print(f"📦 Extracting {archive_type} archive...")
+    print(f"📥 Downloading from {url}...")
+
+    part_path = part_path or target_path.with_name(target_path.name + '.part')
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    # Two processes must not append to the same .part file
+    with file_lock(part_path.with_suffix('.lock')):
+        validators = resume_download(
+            url, part_path, part_path.with_suffix('.json'), max_size, retries, timeout
+        )
+        shutil.move(part_path, target_path)
+        part_path.with_suffix('.json').unlink(missing_ok=True)
 
-    if archive_type == 'zip':
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            zf.extractall(extract_dir)
-    elif archive_type in ('tar.gz', 'tar'):
-        mode = 'r:gz' if archive_type == 'tar.gz' else 'r'
-        with tarfile.open(archive_path, mode) as tf:
-            tf.extractall(extract_dir)
-    else:
-        # Try zip first, then tar
+    print(f"   Downloaded to {target_path}")
+    return validators
+
+
+def resume_download(
+    url: str,
+    part_path: Path,
+    meta_path: Path,
+    max_size: int,
+    retries: int,
+    timeout: int
+) -> dict[str, str | None]:
+    """Complete part_path from url, resuming what is already there (see download_file)."""
+    validators: dict[str, str | None] = {
+        'etag': None,
+        'last_modified': None,
+        'content_type': None,
+        'filename': None,
+    }
+    try:
+        validators.update(json.loads(meta_path.read_text()))
+    except (OSError, ValueError):
+        pass
+    if part_path.exists() and not (validators['etag'] or validators['last_modified']):
+        # Cannot tell whether the remote file changed since, start over
+        part_path.unlink()
+    elif part_path.exists():
+        print(f"   Resuming partial download ({format_size(part_path.stat().st_size)})")
+    attempt = 0
+
+    while True:
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        headers = {}
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            # Only resume if the file has not changed since the first attempt
+            if validators['etag'] or validators['last_modified']:
+                headers['If-Range'] = validators['etag'] or validators['last_modified']
         try:
-            with zipfile.ZipFile(archive_path, 'r') as zf:
-                zf.extractall(extract_dir)
-        except zipfile.BadZipFile:
+            # Retries are handled here so interrupted transfers resume
+            with http_request('GET', url, headers=headers, timeout=timeout, retries=0) as response:
+                validators['etag'] = response.headers.get('ETag')
+                validators['last_modified'] = response.headers.get('Last-Modified')
+                validators['content_type'] = response.headers.get('Content-Type')
+                validators['filename'] = response.headers.get_filename()
+
+                if response.status != 206:
+                    offset = 0  # Server ignored the Range header, start over
+                    meta_path.write_text(json.dumps(validators))
+
+                length = response.headers.get('Content-Length')
+                total = offset + int(length) if length and length.isdigit() else None
+                if total is not None and total > max_size:
+                    raise ValueError(
+                        f"Archive is {format_size(total)}, larger than the "
+                        f"{format_size(max_size)} limit"
+                    )
+
+                with open(part_path, 'ab' if offset else 'wb') as f:
+                    stream_to_file(response, f, offset, total, max_size)
+            break
+
+        except ValueError:
+            part_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+            raise
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                break  # Range starts at the end: the .part file is complete
+            if (e.code < 500 and e.code != 429) or attempt >= retries:
+                part_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                raise
+            retry_after = e.headers.get('Retry-After') if e.headers else None
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+            if attempt >= retries:
+                raise
+            print(f"   ⚠️  Download interrupted ({e}), retrying...")
+            retry_after = None
+
+        attempt += 1
+        time.sleep(retry_delay(attempt, retry_after))
+
+    return validators
+
+
+def stream_to_file(response, f, offset: int, total: int | None, max_size: int) -> None:
+    """Copy response to f chunk by chunk, enforcing max_size and reporting progress."""
+    downloaded = offset
+    started = time.monotonic()
+    last_report = started
+    interactive = sys.stdout.isatty()
+
+    while True:
+        chunk = response.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        f.write(chunk)
+        downloaded += len(chunk)
+
+        if downloaded > max_size:
+            raise ValueError(f"Archive exceeds the {format_size(max_size)} limit")
+
+        now = time.monotonic()
+        if interactive and now - last_report >= 0.5:
+            last_report = now
+            rate = (downloaded - offset) / max(now - started, 1e-6)
+            progress = f"{format_size(downloaded)}"
+            if total:
+                progress += f" / {format_size(total)} ({downloaded * 100 // total}%)"
+            print(f"\r   {progress} at {format_size(rate)}/s   ", end='', flush=True)
+
+    if interactive:
+        print()
+    if total is not None and downloaded < total:
+        raise http.client.IncompleteRead(b'', total - downloaded)
+
+    elapsed = max(time.monotonic() - started, 1e-6)
+    print(f"   {format_size(downloaded)} in {elapsed:.1f}s "
+          f"({format_size((downloaded - offset) / elapsed)}/s)")
+
+
+class SkillArchive:
+    """
+    Read-only view of a zip or tar archive.
+
+    Works from the member list (zip central directory or tar headers) so
+    the skill can be located and validated without extracting anything.
+    Compressed tars are decompressed once, when opened, into a temporary
+    file: listing the members and extracting from them are then only seeks,
+    where a compressed stream would be decompressed again from the start.
+    """
+
+    def __init__(self, archive_path: Path, archive_type: str):
+        self.archive_path = archive_path
+        self.archive_type = archive_type
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+
+        if archive_type == 'zip':
+            self._zip = zipfile.ZipFile(archive_path, 'r')
+        elif archive_type in TAR_DECOMPRESSORS:
+            with TAR_DECOMPRESSORS[archive_type](archive_path, 'rb') as f:
+                self._tar = tarfile.open(fileobj=unpack_to_buffer(f), mode='r')
+        elif archive_type in TAR_MODES:
+            self._tar = tarfile.open(archive_path, TAR_MODES[archive_type])
+        elif archive_type == 'tar.zst':
+            self._tar = open_zstd_tar(archive_path)
+        elif zipfile.is_zipfile(archive_path):
+            self._zip = zipfile.ZipFile(archive_path, 'r')
+        else:
             try:
-                with tarfile.open(archive_path, 'r:*') as tf:
-                    tf.extractall(extract_dir)
+                self._tar = tarfile.open(archive_path, 'r:*')
             except tarfile.TarError:
                 raise ValueError("Unable to extract archive. Unsupported format.")
 
-    # Find SKILL.md in extracted content
-    skill_md_path = find_skill_md(extract_dir)
-    if not skill_md_path:
-        raise FileNotFoundError("SKILL.md not found in archive")
+    def __enter__(self) -> 'SkillArchive':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+            self._tar.fileobj.close()  # The unpacked buffer, if any
+
+    def names(self) -> list[str]:
+        """Paths of all regular files in the archive."""
+        if self._zip is not None:
+            return [i.filename for i in self._zip.infolist() if not i.is_dir()]
+        return [m.name for m in self._tar.getmembers() if m.isfile()]
+
+    def open(self, name: str) -> BinaryIO:
+        """Open one member as a stream without extracting it."""
+        if self._zip is not None:
+            return self._zip.open(name)
+        f = self._tar.extractfile(name)
+        if f is None:
+            raise FileNotFoundError(f"{name} not found in archive")
+        return f
+
+    def extract(self, prefix: str, target_dir: Path) -> int:
+        """
+        Extract only the members under prefix into target_dir.
+
+        The prefix is stripped, .git directories are skipped, and members
+        that would escape target_dir or are not regular files are ignored.
+
+        Returns:
+            Number of files written
+        """
+        return self.extract_many({prefix: [target_dir]})[prefix]
+
+    def extract_many(self, targets: dict[str, list[Path]]) -> dict[str, int]:
+        """
+        Extract several subtrees in a single pass over the members.
+
+        Members are read in archive order, so however many skills are
+        extracted the archive (or unpacked tar) is read once, front to back
+        (see extract for how members are filtered).
+
+        Args:
+            targets: Prefix -> directories to extract its members into
+
+        Returns:
+            Number of files written per prefix (counted once per prefix)
+        """
+        counts = dict.fromkeys(targets, 0)
+        for dirs in targets.values():
+            for target_dir in dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+
+        if self._zip is not None:
+            members = [
+                (info.filename, (info.external_attr >> 16) & 0o777, info)
+                for info in self._zip.infolist() if not info.is_dir()
+            ]
+        else:
+            members = [
+                (member.name, member.mode & 0o777, member)
+                for member in self._tar.getmembers() if member.isfile()
+            ]
+
+        for name, mode, member in members:
+            dests = []
+            for prefix, dirs in targets.items():
+                rel = member_relpath(name, prefix)
+                if rel is not None:
+                    dests.extend(target_dir.joinpath(*rel) for target_dir in dirs)
+                    counts[prefix] += 1
+            if not dests:
+                continue
+
+            if self._zip is not None:
+                src = self._zip.open(member)
+            else:
+                src = self._tar.extractfile(member)
+            with src:
+                first = dests[0]
+                first.parent.mkdir(parents=True, exist_ok=True)
+                with open(first, 'wb') as out:
+                    shutil.copyfileobj(src, out, CHUNK_SIZE)
+            # The same subtree installed into several workflows is read once
+            for dest in dests[1:]:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(first, dest)
+            if mode & 0o111:
+                for dest in dests:
+                    os.chmod(dest, mode)
+
+        return counts
+
+
+def open_zstd_tar(archive_path: Path) -> tarfile.TarFile:
+    """Open a .tar.zst archive with native tarfile support or the zstandard package."""
+    try:
+        return tarfile.open(archive_path, 'r:zst')
+    except tarfile.CompressionError:
+        pass  # Python < 3.14 has no built-in zstd
 
-    return skill_md_path.parent
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError(
+            "Extracting .tar.zst archives needs Python 3.14+ or the zstandard "
+            "package (pip install zstandard)"
+        )
 
+    # tarfile needs random access, so decompress once to a seekable buffer
+    with open(archive_path, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+        return tarfile.open(fileobj=unpack_to_buffer(reader), mode='r')
 
-def find_skill_md(directory: Path) -> Path | None:
-    """Recursively find SKILL.md in directory."""
-    # Check current directory first
-    skill_md = directory / "SKILL.md"
-    if skill_md.exists():
-        return skill_md
-
-    # Search subdirectories (max depth 3)
-    for root, dirs, files in os.walk(directory):
-        depth = len(Path(root).relative_to(directory).parts)
-        if depth > 3:
+
+def unpack_to_buffer(stream: BinaryIO) -> BinaryIO:
+    """
+    Copy a decompressing stream into a seekable temporary file.
+
+    Raises:
+        ValueError: The unpacked data exceeds MAX_UNPACKED_SIZE
+    """
+    buffer = tempfile.TemporaryFile()
+    size = 0
+    try:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+            size += len(chunk)
+            if size > MAX_UNPACKED_SIZE:
+                raise ValueError(
+                    f"Archive unpacks to more than {format_size(MAX_UNPACKED_SIZE)}"
+                )
+            buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
+
+
+def member_relpath(name: str, prefix: str) -> tuple[str, ...] | None:
+    """
+    Path parts of an archive member relative to prefix.
+
+    Returns:
+        The parts, or None if the member is outside prefix, inside .git,
+        or unsafe (absolute or containing '..')
+    """
+    name = name.replace('\\', '/')
+    if not name.startswith(prefix):
+        return None
+    parts = tuple(p for p in name[len(prefix):].split('/') if p and p != '.')
+    if not parts or name.startswith('/') or '..' in parts or '.git' in parts:
+        return None
+    return parts
+
+
+def find_skill_roots(names: list[str], max_depth: int = MAX_SKILL_DEPTH) -> list[str]:
+    """
+    Find every directory prefix holding a SKILL.md in an archive member list.
+
+    Members under SKIP_DIRS are ignored, and a SKILL.md nested inside
+    another skill belongs to that skill rather than being a skill itself.
+
+    Returns:
+        Prefixes ('' for the archive root, otherwise ending in '/'),
+        shallowest first
+    """
+    candidates = []
+    for name in names:
+        parts = name.replace('\\', '/').split('/')
+        if parts[-1] != SKILL_FILENAME or len(parts) - 1 > max_depth:
+            continue
+        if not SKIP_DIRS.isdisjoint(parts[:-1]):
+            continue
+        candidates.append((len(parts) - 1, name[:-len(SKILL_FILENAME)]))
+
+    roots: list[str] = []
+    for _, prefix in sorted(candidates):
+        if not any(prefix.startswith(root) for root in roots):
+            roots.append(prefix)
+    return roots
+
+
+def find_skill_root(names: list[str], max_depth: int = MAX_SKILL_DEPTH) -> str | None:
+    """
+    Find the directory prefix holding SKILL.md in an archive member list.
+
+    Returns:
+        Prefix of the shallowest skill ('' for the archive root), or None
+    """
+    roots = find_skill_roots(names, max_depth)
+    return roots[0] if roots else None
+
+
+def extract_archive(archive_path: Path, extract_dir: Path, archive_type: str) -> Path:
+    """
+    Extract the skill subtree of an archive.
+
+    Only the directory containing SKILL.md is extracted, straight into
+    extract_dir.
+
+    Returns:
+        Path to the extracted skill directory containing SKILL.md
+    """
+    if archive_type == 'unknown':
+        archive_type = detect_archive_type(archive_path)
+
+    print(f"📦 Extracting {archive_type} archive...")
+
+    with SkillArchive(archive_path, archive_type) as archive:
+        prefix = find_skill_root(archive.names())
+        if prefix is None:
+            raise FileNotFoundError("SKILL.md not found in archive")
+        archive.extract(prefix, extract_dir)
+
+    return extract_dir
+
+
+def find_skill_dirs(directory: Path, max_depth: int = MAX_SKILL_DEPTH) -> list[Path]:
+    """
+    Find every skill directory (one containing SKILL.md) under directory in one walk.
+
+    Directories past max_depth, known-heavy directories (SKIP_DIRS) and
+    the insides of skills already found are pruned, so they are never listed.
+
+    Returns:
+        Skill directories, shallowest first
+    """
+    found = []
+    base = str(directory).rstrip(os.sep)
+    base_depth = base.count(os.sep)
+    for root, dirs, files in os.walk(base):
+        depth = root.count(os.sep) - base_depth
+        if SKILL_FILENAME in files:
+            found.append((depth, root))
+            dirs[:] = []  # Subdirectories belong to this skill
             continue
-        if "SKILL.md" in files:
-            return Path(root) / "SKILL.md"
+        if depth >= max_depth:
+            dirs[:] = []
+        else:
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    return [Path(root) for _, root in sorted(found)]
 
-    return None
+
+def find_skill_md(directory: Path) -> Path | None:
+    """Find the shallowest SKILL.md in directory (max depth MAX_SKILL_DEPTH)."""
+    skill_dirs = find_skill_dirs(directory)
+    return skill_dirs[0] / SKILL_FILENAME if skill_dirs else None
 
 
 def validate_skill_md(skill_md_path: Path) -> str:
     """Validate SKILL.md and return skill name."""
-    content = skill_md_path.read_text()
+    return load_skill_metadata(skill_md_path).name
+
+
+@contextmanager
+def open_archive(source: str, max_size: int = DEFAULT_MAX_SIZE) -> Iterator[SkillArchive]:
+    """
+    Fetch an archive once (if it is a URL) and open it.
+
+    Downloads go to a temporary directory that is removed on exit. An
+    interrupted download stays in the download cache (see
+    partial_download_path) and is resumed by the next call for the same URL.
+
+    Args:
+        source: URL or local path to archive
+        max_size: Maximum download size in bytes
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        # Get archive to local path
+        if is_url(source):
+            # Extract filename from URL
+            url_path = urlparse(source).path
+            filename = os.path.basename(url_path) or 'skill.zip'
+            archive_path = temp_path / filename
+            headers = download_file(
+                source, archive_path, max_size, part_path=partial_download_path(source)
+            )
+        else:
+            archive_path = Path(source)
+            headers = None
+            if not archive_path.exists():
+                raise FileNotFoundError(f"Archive not found: {source}")
 
-    if not content.startswith('---'):
-        raise ValueError("SKILL.md missing YAML frontmatter")
+        # Determine archive type once, from content then headers
+        archive_type = detect_archive_type(archive_path, headers)
 
-    # Extract frontmatter
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        raise ValueError("SKILL.md has invalid frontmatter format")
+        with SkillArchive(archive_path, archive_type) as archive:
+            yield archive
 
-    frontmatter = parts[1]
 
-    if 'name:' not in frontmatter:
-        raise ValueError("SKILL.md missing required 'name' field")
-    if 'description:' not in frontmatter:
-        raise ValueError("SKILL.md missing required 'description' field")
+def match_skill_roots(roots: list[str], patterns: list[str] | None) -> list[str]:
+    """
+    Select skill roots by path or glob (e.g. 'skills/docx', 'skills/*').
 
-    # Extract name
-    for line in frontmatter.split('\n'):
-        if line.strip().startswith('name:'):
-            name = line.split(':', 1)[1].strip().strip('"\'')
-            return name
+    Patterns match from the right, so 'skills/*' also selects skills below
+    a wrapper directory such as 'repo-main/skills/'. '.' selects a skill at
+    the archive root.
 
-    raise ValueError("Could not parse skill name from SKILL.md")
+    Returns:
+        Matching roots in archive order (all roots if patterns is empty)
+    """
+    if not patterns:
+        return roots
+    selected = []
+    for root in roots:
+        path = PurePosixPath(root.rstrip('/') or '.')
+        for pattern in patterns:
+            pattern = pattern.strip('/') or '.'
+            if path == PurePosixPath(pattern) or (str(path) != '.' and path.match(pattern)):
+                selected.append(root)
+                break
+    return selected
+
+
+def install_from_archive(
+    archive: SkillArchive,
+    installs: list[tuple[str, Path, str | None]],
+    force: bool = False,
+    store: SkillStore | None = None,
+    lock: Callable[[Path], ContextManager] | None = None
+) -> list[InstallResult]:
+    """
+    Install skills from an open archive, extracting them in one pass.
+
+    Each skill is extracted into a staging directory in its output
+    directory, validated, and then swapped into place atomically.
+
+    Args:
+        archive: Open archive
+        installs: (prefix, output_path, skill_name) per skill to install;
+            skill_name overrides the SKILL.md name, and one prefix may be
+            installed into several output directories
+        force: Overwrite existing skills
+        store: Optional content-addressed store to deduplicate files into
+        lock: Optional factory of a lock held while a target is replaced
+
+    Returns:
+        One result per install, in order; a failed skill does not stop the others
+    """
+    results: list[InstallResult | None] = [None] * len(installs)
+    staged: dict[int, Path] = {}
+    targets: dict[str, list[Path]] = {}
+
+    try:
+        for i, (prefix, output_path, skill_name) in enumerate(installs):
+            # With a known name an existing skill is skipped before extracting
+            if skill_name and not force and (output_path / skill_name).exists():
+                results[i] = skip_existing(output_path / skill_name)
+                continue
+            staging = make_staging_dir(output_path, skill_name or Path(prefix).name or 'skill')
+            staged[i] = staging
+            targets.setdefault(prefix, []).append(staging)
+
+        archive.extract_many(targets)
+
+        for i, staging in list(staged.items()):
+            prefix, output_path, skill_name = installs[i]
+            name = skill_name or Path(prefix).name or '.'
+            try:
+                # Validate and get skill name (reads only the frontmatter)
+                meta = load_skill_metadata(staging)
+                name = skill_name or meta.name
+                target_dir = output_path / name
+
+                if target_dir.exists():
+                    if not force:
+                        results[i] = skip_existing(target_dir)
+                        continue
+                    print(f"⚠️  Replacing existing skill '{name}'...")
+
+                print(f"📦 Installing skill to {target_dir}...")
+                if store is not None:
+                    store.absorb(staging)
+                with lock(target_dir) if lock else nullcontext():
+                    replace_dir(staging, target_dir)
+                del staged[i]
+                print(f"✅ Installed skill '{name}' to {target_dir}")
+                results[i] = InstallResult(name, target_dir)
+            except Exception as e:
+                print(f"❌ Failed to install {prefix or '.'}: {e}")
+                results[i] = InstallResult(name, status='failed', error=str(e))
+    finally:
+        for staging in staged.values():
+            shutil.rmtree(staging, ignore_errors=True)
+
+    return results
+
+
+def skip_existing(target_dir: Path) -> InstallResult:
+    print(f"⚠️  Skill '{target_dir.name}' already exists at {target_dir}")
+    print("   Use --force to overwrite")
+    return InstallResult(target_dir.name, target_dir, 'skipped')
 
 
 def download_from_archive(
     source: str,
     output_dir: str,
     force: bool = False,
-    skill_name: str | None = None
+    skill_name: str | None = None,
+    max_size: int = DEFAULT_MAX_SIZE,
+    store: SkillStore | None = None
 ) -> Path:
     """
     Download and extract skill from archive.
@@ -159,6 +813,8 @@ def download_from_archive(
         output_dir: Directory to install skill
         force: Overwrite if exists
         skill_name: Override skill name
+        max_size: Maximum download size in bytes
+        store: Optional content-addressed store to deduplicate files into
 
     Returns:
         Path to installed skill directory
@@ -166,56 +822,61 @@ def download_from_archive(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    with open_archive(source, max_size) as archive:
+        # Locate the skill from the member list, nothing is extracted yet
+        prefix = find_skill_root(archive.names())
+        if prefix is None:
+            raise FileNotFoundError("SKILL.md not found in archive")
+        [result] = install_from_archive(archive, [(prefix, output_path, skill_name)], force, store)
 
-        # Get archive to local path
-        if is_url(source):
-            # Extract filename from URL
-            url_path = urlparse(source).path
-            filename = os.path.basename(url_path) or 'skill.zip'
-            archive_path = temp_path / filename
-            download_file(source, archive_path)
-        else:
-            archive_path = Path(source)
-            if not archive_path.exists():
-                raise FileNotFoundError(f"Archive not found: {source}")
+    if result.status == 'failed':
+        raise ValueError(result.error)
+    return result.path
 
-        # Determine archive type
-        archive_type = get_archive_type(str(archive_path))
-
-        # Extract archive
-        extract_dir = temp_path / "extracted"
-        extract_dir.mkdir()
-        skill_source = extract_archive(archive_path, extract_dir, archive_type)
-
-        # Validate and get skill name
-        skill_md = skill_source / "SKILL.md"
-        extracted_name = validate_skill_md(skill_md)
-        final_name = skill_name or extracted_name
-
-        # Check if exists
-        target_dir = output_path / final_name
-        if target_dir.exists():
-            if force:
-                print(f"⚠️  Removing existing skill '{final_name}'...")
-                shutil.rmtree(target_dir)
-            else:
-                print(f"⚠️  Skill '{final_name}' already exists at {target_dir}")
-                print("   Use --force to overwrite")
-                return target_dir
 
-        # Copy to output
-        print(f"📦 Installing skill to {target_dir}...")
-        shutil.copytree(skill_source, target_dir)
+def download_skills_from_archive(
+    source: str,
+    output_dir: str,
+    patterns: list[str] | None = None,
+    force: bool = False,
+    max_size: int = DEFAULT_MAX_SIZE,
+    store: SkillStore | None = None
+) -> list[InstallResult]:
+    """
+    Download an archive once and install every skill in it that matches.
+
+    Args:
+        source: URL or local path to archive
+        output_dir: Directory to install skills
+        patterns: Skill paths or globs within the archive (None = all skills);
+            skills they select are named after their directory, as on GitHub,
+            otherwise after the name in their SKILL.md
+        force: Overwrite existing skills
+        max_size: Maximum download size in bytes
+        store: Optional content-addressed store to deduplicate files into
+
+    Returns:
+        One result per matching skill; a failed skill does not stop the others
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
 
-        # Remove any .git directory
-        git_dir = target_dir / ".git"
-        if git_dir.exists():
-            shutil.rmtree(git_dir)
+    with open_archive(source, max_size) as archive:
+        roots = find_skill_roots(archive.names())
+        if not roots:
+            raise FileNotFoundError("SKILL.md not found in archive")
+        selected = match_skill_roots(roots, patterns)
+        if not selected:
+            raise FileNotFoundError(
+                f"No skill matches {', '.join(patterns)} (found: "
+                f"{', '.join(r.rstrip('/') or '.' for r in roots)})"
+            )
 
-    print(f"✅ Installed skill '{final_name}' to {target_dir}")
-    return target_dir
+        installs = [
+            (prefix, output_path, (Path(prefix).name or None) if patterns else None)
+            for prefix in selected
+        ]
+        return install_from_archive(archive, installs, force, store)
 
 
 def main():
@@ -224,7 +885,7 @@ def main():
     )
     parser.add_argument(
         "source",
-        help="URL or local path to archive (.zip, .tar.gz, .skill)"
+        help="URL or local path to archive (.zip, .skill, .tar[.gz|.bz2|.xz|.zst])"
     )
     parser.add_argument(
         "--output", "-o",
@@ -240,11 +901,40 @@ def main():
         "--name", "-n",
         help="Override skill name"
     )
+    parser.add_argument(
+        "--path", "-p",
+        action="append",
+        dest="paths",
+        metavar="PATH",
+        help="Install the skill at PATH in the archive; globs such as 'skills/*' "
+             "allowed, repeat for several"
+    )
+    parser.add_argument(
+        "--all", "-a",
+        action="store_true",
+        help="Install every skill in the archive"
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        help=f"Maximum download size in MB (default: {DEFAULT_MAX_SIZE // (1024 * 1024)})"
+    )
 
     args = parser.parse_args()
+    max_size = args.max_size * 1024 * 1024
+    if args.name and (args.paths or args.all):
+        parser.error("--name only applies to a single skill")
 
     try:
-        download_from_archive(args.source, args.output, args.force, args.name)
+        if args.paths or args.all:
+            results = download_skills_from_archive(
+                args.source, args.output, args.paths, args.force, max_size
+            )
+            if not print_install_report(results):
+                sys.exit(1)
+        else:
+            download_from_archive(args.source, args.output, args.force, args.name, max_size)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
 """
-Download a skill from GitHub repository.
+Download skills from a GitHub repository.
+
+Several skill paths, or globs such as 'skills/*', can be given at once:
+the repository is cloned once and every matching skill is installed,
+followed by a per-skill report.
 
 Usage:
-    python download_from_github.py <repo-url> <skill-path> --output <output-dir>
+    python download_from_github.py <repo-url> <skill-path> [<skill-path> ...] --output <output-dir>
 
 Examples:
     python download_from_github.py https://github.com/anthropics/skills skills/docx --output ./.claude/skills/
     python download_from_github.py https://github.com/gked2121/claude-skills social-repurposer --output ./.claude/skills/
+    python download_from_github.py https://github.com/anthropics/skills 'skills/*' --output ./.claude/skills/
 """
 
 import argparse
+import glob
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import Iterator
+
+from repo_cache import RepoCache, sparse_checkout_args
+from skill_install import STAGING_MARKER, InstallResult, install_tree, print_install_report
+from skill_metadata import SKILL_FILENAME, load_skill_metadata
+from skill_store import SkillStore
 
 
 def parse_github_url(url: str) -> tuple[str, str | None]:
@@ -56,133 +69,315 @@ def parse_github_url(url: str) -> tuple[str, str | None]:
     raise ValueError(f"Invalid GitHub URL: {url}")
 
 
-def download_skill(repo_url: str, skill_path: str, output_dir: str, force: bool = False) -> Path:
+def glob_base(pattern: str) -> str:
     """
-    Download a skill folder from a GitHub repository.
+    Leading part of a skill path without glob characters.
+
+    This is what a sparse checkout needs to cover for the pattern:
+    'skills/*' -> 'skills', 'skills/docx' -> 'skills/docx', '*' -> ''.
+    """
+    parts = []
+    for part in pattern.strip('/').split('/'):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return '/'.join(parts)
+
+
+def expand_skill_paths(repo_path: Path, patterns: list[str]) -> list[str]:
+    """
+    Expand skill paths and globs against a checkout.
+
+    Plain paths are kept as given (find_skill_source resolves them); glob
+    matches are kept if they are directories containing SKILL.md.
+
+    Returns:
+        Skill paths relative to repo_path, in pattern order, without duplicates
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if not glob.has_magic(pattern):
+            matches = [pattern]
+        else:
+            matches = sorted(
+                Path(match).relative_to(repo_path).as_posix()
+                for match in glob.glob(str(repo_path / pattern.strip('/')))
+                if Path(match, SKILL_FILENAME).is_file()
+            )
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def sparse_clone(repo_url: str, skill_paths: list[str], dest: Path, ref: str | None = None) -> Path:
+    """
+    Clone a repository into dest, checking out only the given paths.
 
     Args:
-        repo_url: GitHub repository URL
+        repo_url: Git repository URL
+        skill_paths: Paths within the repository to check out ('' = all)
+        dest: Directory to clone into (must not exist)
+        ref: Branch or tag to check out (default branch if None)
+
+    Returns:
+        Path to the cloned repository
+    """
+    branch = ["--branch", ref] if ref else []
+
+    # Clone repository with depth 1 for speed
+    print(f"📥 Cloning {repo_url}{f' @ {ref}' if ref else ''}...")
+    try:
+        subprocess.run(
+            ["git", "clone", "--depth", "1", "--filter=blob:none", "--sparse", *branch, repo_url, str(dest)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        # Fallback to full clone if sparse checkout fails
+        print("   Sparse checkout not supported, using full clone...")
+        if dest.exists():
+            shutil.rmtree(dest)
+        subprocess.run(
+            ["git", "clone", "--depth", "1", *branch, repo_url, str(dest)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+    # Try sparse checkout for efficiency, one call for all paths
+    try:
+        subprocess.run(
+            ["git", *sparse_checkout_args(skill_paths)],
+            cwd=dest,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        pass  # Sparse checkout optional, continue with full clone
+
+    return dest
+
+
+@contextmanager
+def checkout(
+    repo_url: str,
+    skill_paths: list[str],
+    cache: RepoCache | None = None,
+    work_dir: Path | None = None,
+    ref: str | None = None
+) -> Iterator[Path]:
+    """
+    Clone a repository once for several skill paths.
+
+    With a cache, the checkout comes from a persistent local mirror that
+    is only fetched incrementally; otherwise a fresh shallow clone is used.
+    Placing work_dir on the output filesystem lets skills be installed by
+    rename instead of copy. The checkout directory carries the staging
+    marker, so collect_garbage removes it if the run is killed.
+
+    Yields the path to a temporary checkout that is removed on exit.
+    """
+    if work_dir is not None:
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix=f'.checkout{STAGING_MARKER}', dir=work_dir) as temp_dir, ExitStack() as stack:
+        dest = Path(temp_dir) / "repo"
+        repo_path = None
+
+        if cache is not None:
+            try:
+                repo_path = stack.enter_context(cache.checkout(repo_url, skill_paths, dest, ref))
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                # FileNotFoundError: another process evicted the mirror after update()
+                reason = getattr(e, 'stderr', None) or str(e)
+                print(f"   Repo cache unavailable ({reason.strip()}), cloning directly...")
+                shutil.rmtree(dest, ignore_errors=True)
+
+        if repo_path is None:
+            repo_path = sparse_clone(repo_url, skill_paths, dest, ref)
+
+        yield repo_path
+
+
+def find_skill_source(repo_path: Path, skill_path: str) -> Path:
+    """Locate a skill directory inside a checkout, trying common layouts."""
+    skill_name = Path(skill_path).name
+
+    skill_source = repo_path / skill_path
+    if skill_source.exists():
+        return skill_source
+
+    # Try alternative paths
+    alternatives = [
+        repo_path / skill_name,
+        repo_path / f".claude/skills/{skill_name}",
+        repo_path / f"skills/{skill_name}",
+    ]
+    for alt in alternatives:
+        if alt.exists():
+            return alt
+
+    raise FileNotFoundError(
+        f"Skill not found at {skill_path}\n"
+        f"Tried: {skill_path}, {skill_name}, .claude/skills/{skill_name}, skills/{skill_name}"
+    )
+
+
+def install_from_checkout(
+    repo_path: Path,
+    skill_path: str,
+    output_dir: str,
+    force: bool = False,
+    move: bool = False,
+    store: SkillStore | None = None,
+    key: str | None = None
+) -> Path:
+    """
+    Install a skill from an existing checkout into output_dir.
+
+    The skill is swapped into place atomically; the previous version stays
+    installed if anything fails.
+
+    Args:
+        repo_path: Path to a checkout containing skill_path
         skill_path: Path to skill within repository
         output_dir: Local directory to save the skill
         force: Overwrite if exists
+        move: Move the skill out of the checkout instead of copying it
+        store: Optional content-addressed store to install through
+        key: Content key of the skill tree for the store (e.g. git tree hash)
 
     Returns:
-        Path to the downloaded skill directory
+        Path to the installed skill directory
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Extract skill name from path
     skill_name = Path(skill_path).name
-
-    # Check if skill already exists
     target_dir = output_path / skill_name
+
+    # Find the skill directory
+    skill_source = find_skill_source(repo_path, skill_path)
+
+    # Verify SKILL.md exists
+    skill_md = skill_source / "SKILL.md"
+    if not skill_md.exists():
+        raise FileNotFoundError(f"SKILL.md not found in {skill_source}")
+
+    # Validate SKILL.md has required frontmatter
+    validate_skill_md(skill_md)
+
     if target_dir.exists():
         if force:
-            print(f"⚠️  Removing existing skill '{skill_name}'...")
-            shutil.rmtree(target_dir)
+            print(f"⚠️  Replacing existing skill '{skill_name}'...")
         else:
             print(f"⚠️  Skill '{skill_name}' already exists at {target_dir}")
             print("   Use --force to overwrite")
             return target_dir
 
-    # Create temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Clone repository with depth 1 for speed
-        print(f"📥 Cloning {repo_url}...")
-        try:
-            subprocess.run(
-                ["git", "clone", "--depth", "1", "--filter=blob:none", "--sparse", repo_url, "repo"],
-                cwd=temp_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        except subprocess.CalledProcessError:
-            # Fallback to full clone if sparse checkout fails
-            print("   Sparse checkout not supported, using full clone...")
-            subprocess.run(
-                ["git", "clone", "--depth", "1", repo_url, "repo"],
-                cwd=temp_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-        repo_path = temp_path / "repo"
-
-        # Try sparse checkout for efficiency
-        try:
-            subprocess.run(
-                ["git", "sparse-checkout", "set", skill_path],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        except subprocess.CalledProcessError:
-            pass  # Sparse checkout optional, continue with full clone
-
-        # Find the skill directory
-        skill_source = repo_path / skill_path
-        if not skill_source.exists():
-            # Try alternative paths
-            alternatives = [
-                repo_path / skill_name,
-                repo_path / f".claude/skills/{skill_name}",
-                repo_path / f"skills/{skill_name}",
-            ]
-            for alt in alternatives:
-                if alt.exists():
-                    skill_source = alt
-                    break
-            else:
-                raise FileNotFoundError(
-                    f"Skill not found at {skill_path}\n"
-                    f"Tried: {skill_path}, {skill_name}, .claude/skills/{skill_name}, skills/{skill_name}"
-                )
-
-        # Verify SKILL.md exists
-        skill_md = skill_source / "SKILL.md"
-        if not skill_md.exists():
-            raise FileNotFoundError(f"SKILL.md not found in {skill_source}")
-
-        # Validate SKILL.md has required frontmatter
-        validate_skill_md(skill_md)
-
-        # Copy skill to output directory
-        print(f"📦 Copying skill to {target_dir}...")
-        shutil.copytree(skill_source, target_dir)
-
-        # Remove .git if present
-        git_dir = target_dir / ".git"
-        if git_dir.exists():
-            shutil.rmtree(git_dir)
+    # Stage next to the target and swap it into place (.git is left out)
+    print(f"📦 Installing skill to {target_dir}...")
+    install_tree(skill_source, target_dir, move, store, key)
 
     print(f"✅ Downloaded skill '{skill_name}' to {target_dir}")
     return target_dir
 
 
-def validate_skill_md(skill_md_path: Path) -> None:
-    """Validate SKILL.md has required YAML frontmatter."""
-    content = skill_md_path.read_text()
+def download_skill(
+    repo_url: str,
+    skill_path: str,
+    output_dir: str,
+    force: bool = False,
+    cache: RepoCache | None = None
+) -> Path:
+    """
+    Download a skill folder from a GitHub repository.
+
+    Args:
+        repo_url: GitHub repository URL
+        skill_path: Path to skill within repository
+        output_dir: Local directory to save the skill
+        force: Overwrite if exists
+        cache: Optional mirror cache to fetch through
+
+    Returns:
+        Path to the downloaded skill directory
+    """
+    # Check if skill already exists before paying for a clone
+    skill_name = Path(skill_path).name
+    target_dir = Path(output_dir) / skill_name
+    if target_dir.exists() and not force:
+        print(f"⚠️  Skill '{skill_name}' already exists at {target_dir}")
+        print("   Use --force to overwrite")
+        return target_dir
+
+    work_dir = Path(output_dir).resolve()
+    with checkout(repo_url, [skill_path], cache, work_dir) as repo_path:
+        return install_from_checkout(repo_path, skill_path, output_dir, force, move=True)
+
+
+def download_skills(
+    repo_url: str,
+    patterns: list[str],
+    output_dir: str,
+    force: bool = False,
+    cache: RepoCache | None = None,
+    ref: str | None = None
+) -> list[InstallResult]:
+    """
+    Download several skills from a GitHub repository with one clone.
 
-    if not content.startswith('---'):
-        raise ValueError("SKILL.md missing YAML frontmatter (must start with ---)")
+    Args:
+        repo_url: GitHub repository URL
+        patterns: Skill paths or globs within the repository (e.g. 'skills/*')
+        output_dir: Local directory to save the skills
+        force: Overwrite existing skills
+        cache: Optional mirror cache to fetch through
+        ref: Branch or tag to check out (default branch if None)
 
-    # Extract frontmatter
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        raise ValueError("SKILL.md has invalid frontmatter format")
+    Returns:
+        One result per skill; a failed skill does not stop the others
+    """
+    # Plain paths that are already installed need no checkout
+    results = []
+    wanted = []
+    for pattern in patterns:
+        target_dir = Path(output_dir) / Path(pattern).name
+        if not glob.has_magic(pattern) and target_dir.exists() and not force:
+            print(f"⚠️  Skill '{target_dir.name}' already exists at {target_dir}")
+            results.append(InstallResult(target_dir.name, target_dir, 'skipped'))
+        else:
+            wanted.append(pattern)
+    if not wanted:
+        return results
+
+    work_dir = Path(output_dir).resolve()
+    bases = [glob_base(pattern) for pattern in wanted]
+    with checkout(repo_url, bases, cache, work_dir, ref) as repo_path:
+        skill_paths = expand_skill_paths(repo_path, wanted)
+        if not skill_paths:
+            raise FileNotFoundError(f"No skill matches {', '.join(wanted)}")
+
+        for skill_path in skill_paths:
+            name = Path(skill_path).name
+            target_dir = Path(output_dir) / name
+            if target_dir.exists() and not force:
+                print(f"⚠️  Skill '{name}' already exists at {target_dir}")
+                results.append(InstallResult(name, target_dir, 'skipped'))
+                continue
+            try:
+                path = install_from_checkout(repo_path, skill_path, output_dir, force, move=True)
+                results.append(InstallResult(name, path))
+            except Exception as e:
+                print(f"❌ Failed to install {skill_path}: {e}")
+                results.append(InstallResult(name, status='failed', error=str(e)))
+    return results
 
-    frontmatter = parts[1]
 
-    if 'name:' not in frontmatter:
-        raise ValueError("SKILL.md missing required 'name' field")
-    if 'description:' not in frontmatter:
-        raise ValueError("SKILL.md missing required 'description' field")
+def validate_skill_md(skill_md_path: Path) -> None:
+    """Validate SKILL.md has required YAML frontmatter."""
+    load_skill_metadata(skill_md_path)
 
 
 def main():
@@ -194,8 +389,11 @@ def main():
         help="GitHub repository URL"
     )
     parser.add_argument(
-        "skill_path",
-        help="Path to skill within repository (e.g., 'skills/docx')"
+        "skill_paths",
+        nargs="+",
+        metavar="skill_path",
+        help="Path to skill within repository (e.g., 'skills/docx'); "
+             "globs such as 'skills/*' allowed, several paths install several skills"
     )
     parser.add_argument(
         "--output", "-o",
@@ -207,6 +405,11 @@ def main():
         action="store_true",
         help="Overwrite existing skill"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Fetch through the persistent repo mirror cache"
+    )
 
     args = parser.parse_args()
 
@@ -215,11 +418,17 @@ def main():
         repo_url, url_path = parse_github_url(args.repo_url)
 
         # Use path from URL if skill_path not explicitly provided
-        skill_path = args.skill_path
-        if url_path and args.skill_path == '.':
-            skill_path = url_path
+        skill_paths = args.skill_paths
+        if url_path and skill_paths == ['.']:
+            skill_paths = [url_path]
 
-        download_skill(repo_url, skill_path, args.output, args.force)
+        cache = RepoCache() if args.cache else None
+        if len(skill_paths) == 1 and not glob.has_magic(skill_paths[0]):
+            download_skill(repo_url, skill_paths[0], args.output, args.force, cache)
+        else:
+            results = download_skills(repo_url, skill_paths, args.output, args.force, cache)
+            if not print_install_report(results):
+                sys.exit(1)
     except Exception as e:
         print(f"❌ Error downloading skill: {e}", file=sys.stderr)
         sys.exit(1)
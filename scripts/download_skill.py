@@ -4,12 +4,16 @@ Unified skill downloader - auto-detects source type.
 
 Supports:
 - GitHub repositories (full URL or tree URL)
-- Compressed archives (.zip, .tar.gz, .tgz, .skill)
+- Compressed archives (.zip, .skill, .tar, .tar.gz/.tgz, .tar.bz2, .tar.xz, .tar.zst)
 - Direct URLs to archives
 - Local archive files
 
+Several skill paths, or globs such as 'skills/*', can be given at once: the
+source is fetched once and every matching skill is installed, followed by a
+per-skill report.
+
 Usage:
-    python download_skill.py <source> [skill-path] --output <output-dir>
+    python download_skill.py <source> [skill-path ...] --output <output-dir>
 
 Examples:
     # GitHub (auto-detect)
@@ -19,17 +23,35 @@ Examples:
     # Archive (auto-detect)
     python download_skill.py https://example.com/my-skill.zip --output ./.claude/skills/
     python download_skill.py ./downloads/my-skill.tar.gz --output ./.claude/skills/
+
+    # Many skills from one fetch
+    python download_skill.py https://github.com/anthropics/skills 'skills/*' --output ./.claude/skills/
+    python download_skill.py ./bundle.zip skills/docx skills/pdf --output ./.claude/skills/
 """
 
 import argparse
+import glob
 import re
 import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
 # Import the specialized downloaders
-from download_from_github import download_skill as download_github, parse_github_url
-from download_from_archive import download_from_archive, is_url, get_archive_type
+from download_from_github import (
+    download_skill as download_github,
+    download_skills as download_github_skills,
+    parse_github_url,
+)
+from download_from_archive import (
+    ARCHIVE_EXTENSIONS,
+    download_from_archive,
+    download_skills_from_archive,
+    find_skill_dirs,
+    is_url,
+    get_archive_type,
+)
+from skill_install import InstallResult, install_tree, print_install_report
+from skill_metadata import SKILL_FILENAME, find_skill_metadata
 
 
 def detect_source_type(source: str) -> str:
@@ -46,7 +68,7 @@ def detect_source_type(source: str) -> str:
     # Check for archive URL
     if is_url(source):
         path = urlparse(source).path.lower()
-        if any(path.endswith(ext) for ext in ['.zip', '.tar.gz', '.tgz', '.tar', '.skill']):
+        if any(path.endswith(ext) for ext in ARCHIVE_EXTENSIONS):
             return 'archive'
         # Might still be an archive with no extension
         return 'archive'
@@ -62,6 +84,30 @@ def detect_source_type(source: str) -> str:
     return 'unknown'
 
 
+def install_local_dir(source_path: Path, output_path: Path, force: bool = False) -> InstallResult:
+    """Copy a local skill directory into output_path."""
+    skill_md = source_path / SKILL_FILENAME
+
+    if not skill_md.exists():
+        raise FileNotFoundError(f"SKILL.md not found in {source_path}")
+
+    # Read skill name, falling back to the directory name
+    meta = find_skill_metadata(skill_md)
+    name = meta.name if meta else source_path.name
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    target_dir = output_path / name
+
+    if target_dir.exists() and not force:
+        print(f"⚠️  Skill '{name}' already exists at {target_dir}")
+        return InstallResult(name, target_dir, 'skipped')
+
+    # Stage and swap atomically, the previous version survives failures
+    install_tree(source_path, target_dir)
+    print(f"✅ Copied skill '{name}' to {target_dir}")
+    return InstallResult(name, target_dir)
+
+
 def download_skill(
     source: str,
     skill_path: str | None = None,
@@ -105,46 +151,75 @@ def download_skill(
         return download_from_archive(source, output_dir, force)
 
     elif source_type == 'local_dir':
-        # Copy local directory
-        import shutil
+        return install_local_dir(Path(source), Path(output_dir), force).path
+
+    else:
+        raise ValueError(
+            f"Unable to determine source type for: {source}\n"
+            "Supported: GitHub URLs, archive URLs/files (.zip, .skill, .tar.gz, .tar.xz, ...)"
+        )
+
+
+def download_skills(
+    source: str,
+    skill_paths: list[str] | None = None,
+    output_dir: str = "./.claude/skills/",
+    force: bool = False
+) -> list[InstallResult]:
+    """
+    Download several skills from one source, fetching it only once.
 
+    Args:
+        source: GitHub URL, archive URL, or local path
+        skill_paths: Skill paths or globs within the source (e.g. 'skills/*');
+            None installs every skill of an archive or local directory
+        output_dir: Directory to install skills
+        force: Overwrite existing skills
+
+    Returns:
+        One result per skill
+    """
+    source_type = detect_source_type(source)
+
+    if source_type == 'github':
+        repo_url, url_path = parse_github_url(source)
+        if url_path:
+            # Paths are relative to the tree URL's directory
+            skill_paths = [f"{url_path}/{p}" for p in skill_paths] if skill_paths else [url_path]
+        if not skill_paths:
+            raise ValueError("For GitHub repositories, provide skill paths or globs (e.g. 'skills/*')")
+        return download_github_skills(repo_url, skill_paths, output_dir, force)
+
+    elif source_type in ('archive', 'local_archive'):
+        return download_skills_from_archive(source, output_dir, skill_paths, force)
+
+    elif source_type == 'local_dir':
         source_path = Path(source)
-        skill_md = source_path / "SKILL.md"
-
-        if not skill_md.exists():
-            raise FileNotFoundError(f"SKILL.md not found in {source_path}")
-
-        # Read skill name
-        content = skill_md.read_text()
-        name = None
-        if content.startswith('---'):
-            for line in content.split('---')[1].split('\n'):
-                if line.strip().startswith('name:'):
-                    name = line.split(':', 1)[1].strip().strip('"\'')
-                    break
-
-        if not name:
-            name = source_path.name
-
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        target_dir = output_path / name
-
-        if target_dir.exists():
-            if force:
-                shutil.rmtree(target_dir)
-            else:
-                print(f"⚠️  Skill '{name}' already exists at {target_dir}")
-                return target_dir
-
-        shutil.copytree(source_path, target_dir)
-        print(f"✅ Copied skill '{name}' to {target_dir}")
-        return target_dir
+        if skill_paths:
+            skill_dirs = sorted({
+                Path(match)
+                for pattern in skill_paths
+                for match in glob.glob(str(source_path / pattern))
+                if Path(match, SKILL_FILENAME).is_file()
+            })
+        else:
+            skill_dirs = find_skill_dirs(source_path)
+        if not skill_dirs:
+            raise FileNotFoundError(f"No SKILL.md found in {source_path}")
+
+        results = []
+        for skill_dir in skill_dirs:
+            try:
+                results.append(install_local_dir(skill_dir, Path(output_dir), force))
+            except Exception as e:
+                print(f"❌ Failed to install {skill_dir}: {e}")
+                results.append(InstallResult(skill_dir.name, status='failed', error=str(e)))
+        return results
 
     else:
         raise ValueError(
             f"Unable to determine source type for: {source}\n"
-            "Supported: GitHub URLs, archive URLs/files (.zip, .tar.gz, .skill)"
+            "Supported: GitHub URLs, archive URLs/files (.zip, .skill, .tar.gz, .tar.xz, ...)"
         )
 
 
@@ -157,10 +232,16 @@ def main():
         help="GitHub URL, archive URL, or local path"
     )
     parser.add_argument(
-        "skill_path",
-        nargs="?",
-        default=None,
-        help="Path to skill within repository (for GitHub sources)"
+        "skill_paths",
+        nargs="*",
+        metavar="skill_path",
+        help="Path to skill within the repository or archive; globs such as "
+             "'skills/*' allowed, several paths install several skills"
+    )
+    parser.add_argument(
+        "--all", "-a",
+        action="store_true",
+        help="Install every skill in an archive or local directory"
     )
     parser.add_argument(
         "--output", "-o",
@@ -175,8 +256,14 @@ def main():
 
     args = parser.parse_args()
 
+    paths = args.skill_paths
     try:
-        download_skill(args.source, args.skill_path, args.output, args.force)
+        if args.all or len(paths) > 1 or any(glob.has_magic(p) for p in paths):
+            results = download_skills(args.source, paths or None, args.output, args.force)
+            if not print_install_report(results):
+                sys.exit(1)
+        else:
+            download_skill(args.source, paths[0] if paths else None, args.output, args.force)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
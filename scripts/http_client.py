@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the skill scripts.
+
+Keeps idle keep-alive connections per host so bulk runs (validating or
+updating every workflow) pay DNS + TCP + TLS once per host rather than
+once per request, and applies the same timeouts and retry policy
+everywhere: idempotent requests are retried on connection errors, 429 and
+5xx with jittered exponential backoff, honouring Retry-After.
+
+Errors are reported like urllib.request.urlopen: non-2xx responses raise
+urllib.error.HTTPError (so 304 and 416 can be inspected via e.code) and
+connection failures raise urllib.error.URLError.
+
+Usage:
+    from http_client import request
+
+    with request('GET', url, headers={'Accept': 'application/json'}) as response:
+        data = json.load(response)
+"""
+
+import base64
+import email.utils
+import http.client
+import io
+import random
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import unquote, urljoin, urlsplit
+
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+MAX_BACKOFF = 30
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 8
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+USER_AGENT = 'Mozilla/5.0 (skill-downloader)'
+
+
+def retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Seconds to wait before retry number attempt (1-based).
+
+    Uses Retry-After (seconds or HTTP date) when the server sent one,
+    otherwise exponential backoff with full jitter, capped at MAX_BACKOFF.
+    """
+    if retry_after:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(when.timestamp() - time.time(), 0.0), MAX_BACKOFF)
+        except (TypeError, ValueError):
+            pass
+    return random.uniform(0, min(2 ** attempt, MAX_BACKOFF))
+
+
+class Response:
+    """
+    A response whose connection returns to the pool once it is closed.
+
+    Behaves like the object urlopen returns: status, headers, url, read(),
+    and usable as a context manager.
+    """
+
+    def __init__(self, client: 'HTTPClient', key: tuple, conn, raw: http.client.HTTPResponse, url: str):
+        self._client = client
+        self._key = key
+        self._conn = conn
+        self._raw = raw
+        self.url = url
+        self.status = raw.status
+        self.reason = raw.reason
+        self.headers = raw.headers
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._raw.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        # Drain short leftovers (HEAD, error pages) so the connection can be reused
+        if not self._raw.isclosed() and self._raw.length is not None and self._raw.length <= 65536:
+            try:
+                self._raw.read()
+            except (OSError, http.client.HTTPException):
+                pass
+        # Only a fully read response leaves the connection reusable
+        if self._raw.isclosed() and not self._raw.will_close:
+            self._client._release(self._key, conn)
+        else:
+            self._raw.close()
+            conn.close()
+
+    def __enter__(self) -> 'Response':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HTTPClient:
+    """Thread-safe HTTP client with a keep-alive connection pool per host."""
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        max_idle: int = MAX_IDLE_PER_HOST
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.max_idle = max_idle
+        self._idle: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    def _connect(self, key: tuple, timeout: float):
+        scheme, host, port = key
+        proxy = self._proxy(scheme, host)
+        if proxy:
+            proxy_host, proxy_port, auth = proxy
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(
+                    proxy_host, proxy_port, timeout=timeout, context=self._ssl
+                )
+                conn.set_tunnel(host, port, headers={'Proxy-Authorization': auth} if auth else None)
+                return conn
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    @staticmethod
+    def _proxy(scheme: str, host: str) -> tuple[str, int, str | None] | None:
+        """
+        Proxy from the environment (HTTP(S)_PROXY / NO_PROXY), like urllib.
+
+        Returns:
+            (host, port, Proxy-Authorization value for user:pass@ credentials)
+        """
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+        parts = urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+        auth = None
+        if parts.username is not None:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            auth = f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"
+        return parts.hostname, parts.port or 80, auth
+
+    def _acquire(self, key: tuple, timeout: float) -> tuple[object, bool]:
+        """Get an idle connection for key, or a new one; returns (conn, reused)."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(key, timeout), False
+
+    def _release(self, key: tuple, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    def _send(self, method: str, url: str, headers: dict[str, str], body: bytes | None,
+              timeout: float) -> Response:
+        """Send one request, transparently retrying once if a pooled connection went stale."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        target = parts.path or '/'
+        if parts.query:
+            target += f"?{parts.query}"
+        headers = {'User-Agent': USER_AGENT, **headers}
+        proxy = self._proxy(parts.scheme, parts.hostname) if parts.scheme == 'http' else None
+        if proxy:
+            target = url  # Plain HTTP proxies take the absolute URL
+            if proxy[2]:
+                headers['Proxy-Authorization'] = proxy[2]
+
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                raw = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # Server closed the idle connection; try a fresh one
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            return Response(self, key, conn, raw, url)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+        retries: int | None = None
+    ) -> Response:
+        """
+        Send a request, following redirects and retrying transient failures.
+
+        Args:
+            method: HTTP method
+            url: http(s) URL
+            headers: Extra request headers
+            body: Request body
+            timeout: Socket timeout in seconds (default: client timeout)
+            retries: Retries for idempotent methods (default: client retries)
+
+        Returns:
+            Response with status 2xx; close it (or use `with`) when done
+
+        Raises:
+            urllib.error.HTTPError: Non-2xx final response
+            urllib.error.URLError: Connection failure after all retries
+        """
+        if urlsplit(url).scheme not in ('http', 'https'):
+            raise urllib.error.URLError(f"unsupported URL scheme: {url}")
+
+        method = method.upper()
+        headers = dict(headers or {})
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+        if method not in IDEMPOTENT_METHODS:
+            retries = 0
+
+        attempt = 0
+        redirects = 0
+        while True:
+            try:
+                response = self._send(method, url, headers, body, timeout)
+            except (OSError, http.client.HTTPException) as e:
+                if attempt >= retries or isinstance(e, ssl.SSLCertVerificationError):
+                    if isinstance(e, urllib.error.URLError):
+                        raise
+                    raise urllib.error.URLError(e) from e
+                attempt += 1
+                time.sleep(retry_delay(attempt))
+                continue
+
+            status = response.status
+            if status in (301, 302, 303, 307, 308) and response.headers.get('Location'):
+                location = urljoin(url, response.headers['Location'])
+                response.read()
+                response.close()
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    raise urllib.error.HTTPError(url, status, "Too many redirects", response.headers, None)
+                if status == 303 and method != 'HEAD':
+                    method, body = 'GET', None
+                if urlsplit(location).scheme not in ('http', 'https'):
+                    raise urllib.error.HTTPError(url, status, "Redirect to unsupported URL", response.headers, None)
+                url = location
+                continue
+
+            if status in RETRY_STATUSES and attempt < retries:
+                retry_after = response.headers.get('Retry-After')
+                response.read()
+                response.close()
+                attempt += 1
+                time.sleep(retry_delay(attempt, retry_after))
+                continue
+
+            if 200 <= status < 300:
+                return response
+
+            error_body = response.read()
+            response.close()
+            raise urllib.error.HTTPError(
+                url, status, response.reason, response.headers, io.BytesIO(error_body)
+            )
+
+
+_default_client: HTTPClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> HTTPClient:
+    """Process-wide client shared by all scripts."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
+
+
+def request(method: str, url: str, **kwargs) -> Response:
+    """Send a request with the shared client (see HTTPClient.request)."""
+    return default_client().request(method, url, **kwargs)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Persistent mirror cache for git skill sources.
+
+Each repository is kept as a blobless bare mirror (commits and trees only)
+under ~/.cache/ai-workflow/repos/ (override with AI_WORKFLOW_CACHE_DIR).
+The first use clones the mirror, later runs only `git fetch` the commits
+that changed. Checkouts are cheap local clones that borrow objects from the
+mirror and fetch just the blobs of their sparse paths.
+
+Mirrors are protected by per-repo file locks so parallel jobs can share the
+cache, and the least recently used mirrors are evicted once the cache grows
+past its size cap (AI_WORKFLOW_CACHE_MAX_MB, default 2048).
+
+Usage:
+    python scripts/repo_cache.py --list
+    python scripts/repo_cache.py --prune
+    python scripts/repo_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is best effort
+    fcntl = None
+
+
+DEFAULT_MAX_SIZE_MB = 2048
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory, honouring AI_WORKFLOW_CACHE_DIR and XDG_CACHE_HOME."""
+    if os.environ.get('AI_WORKFLOW_CACHE_DIR'):
+        return Path(os.environ['AI_WORKFLOW_CACHE_DIR']).expanduser()
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'ai-workflow' / 'repos'
+
+
+def default_max_size() -> int:
+    """Get the cache size cap in bytes."""
+    max_mb = int(os.environ.get('AI_WORKFLOW_CACHE_MAX_MB', DEFAULT_MAX_SIZE_MB))
+    return max_mb * 1024 * 1024
+
+
+def normalize_repo_url(repo_url: str) -> str:
+    """Normalize a repo URL so equivalent spellings share one mirror."""
+    url = repo_url.strip().rstrip('/')
+    if url.endswith('.git'):
+        url = url[:-4]
+    if 'github.com' in url:
+        url = url.lower()
+    return url
+
+
+def cache_key(repo_url: str) -> str:
+    """Build a readable, collision-free directory name for a repo URL."""
+    url = normalize_repo_url(repo_url)
+    digest = hashlib.sha256(url.encode()).hexdigest()[:12]
+    slug = '-'.join(url.split('/')[-2:])
+    slug = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in slug)
+    return f"{slug}-{digest}"
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an advisory lock on path for the duration of the block.
+
+    Yields:
+        True if the lock was acquired (always True when blocking)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        if fcntl is None:
+            yield True
+            return
+
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(f, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def dir_size(path: Path) -> int:
+    """Total size in bytes of all files under path."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def sparse_checkout_args(paths: list[str]) -> list[str]:
+    """git sparse-checkout arguments covering paths ('' means the whole tree)."""
+    paths = sorted({path.strip('/') for path in paths})
+    if '' in paths or '.' in paths:
+        return ['sparse-checkout', 'disable']
+    return ['sparse-checkout', 'set', *paths]
+
+
+def git(*args: str, cwd: Path | None = None) -> subprocess.CompletedProcess:
+    """Run a git command, raising CalledProcessError on failure."""
+    return subprocess.run(
+        ['git', *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+class RepoCache:
+    """Shared on-disk cache of bare repository mirrors."""
+
+    def __init__(self, root: Path | None = None, max_size: int | None = None):
+        self.root = Path(root) if root else default_cache_dir()
+        self.max_size = default_max_size() if max_size is None else max_size
+
+    def mirror_path(self, repo_url: str) -> Path:
+        return self.root / f"{cache_key(repo_url)}.git"
+
+    def _lock_path(self, repo_url: str) -> Path:
+        return self.root / f"{cache_key(repo_url)}.lock"
+
+    def _meta_path(self, repo_url: str) -> Path:
+        return self.root / f"{cache_key(repo_url)}.json"
+
+    def _write_meta(self, repo_url: str, mirror: Path) -> None:
+        meta = {
+            'url': repo_url,
+            'size': dir_size(mirror),
+            'last_used': time.time(),
+        }
+        self._save_meta(repo_url, meta)
+
+    def _save_meta(self, repo_url: str, meta: dict[str, Any]) -> None:
+        meta_path = self._meta_path(repo_url)
+        tmp = meta_path.with_name(f"{meta_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, meta_path)
+
+    def _touch(self, repo_url: str) -> None:
+        try:
+            meta = json.loads(self._meta_path(repo_url).read_text())
+        except (OSError, ValueError):
+            return
+        meta['last_used'] = time.time()
+        self._save_meta(repo_url, meta)
+
+    def update(self, repo_url: str) -> Path:
+        """
+        Create or refresh the mirror for repo_url.
+
+        Returns:
+            Path to the bare mirror
+        """
+        mirror = self.mirror_path(repo_url)
+
+        with file_lock(self._lock_path(repo_url)):
+            if mirror.exists():
+                print(f"🔄 Fetching {repo_url} into cache...")
+                git('fetch', '--prune', '--quiet', '--filter=blob:none', 'origin', cwd=mirror)
+            else:
+                print(f"📥 Mirroring {repo_url} into cache...")
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp = mirror.with_name(f"{mirror.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+                if tmp.exists():
+                    shutil.rmtree(tmp)
+                try:
+                    git('clone', '--mirror', '--filter=blob:none', '--quiet', repo_url, str(tmp))
+                    os.replace(tmp, mirror)
+                finally:
+                    if tmp.exists():
+                        shutil.rmtree(tmp, ignore_errors=True)
+            self._write_meta(repo_url, mirror)
+
+        self.evict(keep=repo_url)
+        return mirror
+
+    @contextmanager
+    def checkout(
+        self,
+        repo_url: str,
+        paths: list[str],
+        dest: Path,
+        ref: str | None = None
+    ) -> Iterator[Path]:
+        """
+        Check out paths from the cached mirror of repo_url into dest.
+
+        ref selects a branch or tag; the mirror's HEAD is used by default.
+
+        The checkout shares objects with the mirror, so the mirror stays
+        read-locked (and safe from eviction) until the block exits. The
+        mirror is blobless: the blobs under paths are fetched from repo_url
+        into the checkout only, and are dropped with it.
+        """
+        self.update(repo_url)
+        mirror = self.mirror_path(repo_url)
+
+        with file_lock(self._lock_path(repo_url), shared=True):
+            if not mirror.exists():
+                raise FileNotFoundError(f"Cached mirror was evicted: {mirror}")
+            branch = ['--branch', ref] if ref else []
+            git('clone', '--quiet', '--shared', '--sparse', '--no-checkout', *branch, str(mirror), str(dest))
+            # Missing blobs are fetched lazily from upstream, not the mirror
+            git('remote', 'set-url', 'origin', repo_url, cwd=dest)
+            git('config', 'remote.origin.promisor', 'true', cwd=dest)
+            git('config', 'remote.origin.partialclonefilter', 'blob:none', cwd=dest)
+            git(*sparse_checkout_args(paths), cwd=dest)
+            git('checkout', '--quiet', cwd=dest)
+            self._touch(repo_url)
+            yield dest
+
+    def entries(self) -> list[dict[str, Any]]:
+        """List cached mirrors with their metadata."""
+        entries = []
+        if not self.root.exists():
+            return entries
+        for meta_path in self.root.glob('*.json'):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                continue
+            meta['key'] = meta_path.stem
+            entries.append(meta)
+        return sorted(entries, key=lambda e: e.get('last_used', 0))
+
+    def remove(self, key: str) -> bool:
+        """Remove one mirror unless another process is using it."""
+        with file_lock(self.root / f"{key}.lock", blocking=False) as locked:
+            if not locked:
+                return False
+            shutil.rmtree(self.root / f"{key}.git", ignore_errors=True)
+            (self.root / f"{key}.json").unlink(missing_ok=True)
+        return True
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """
+        Evict least recently used mirrors until the cache fits its size cap.
+
+        Mirrors that are locked by another process are skipped.
+
+        Returns:
+            Keys of evicted mirrors
+        """
+        evicted = []
+        with file_lock(self.root / '.cache.lock', blocking=False) as locked:
+            if not locked:
+                return evicted  # Another process is already evicting
+
+            entries = self.entries()
+            total = sum(e.get('size', 0) for e in entries)
+            keep_key = cache_key(keep) if keep else None
+
+            for entry in entries:
+                if total <= self.max_size:
+                    break
+                if entry['key'] == keep_key:
+                    continue
+                if self.remove(entry['key']):
+                    total -= entry.get('size', 0)
+                    evicted.append(entry['key'])
+
+        return evicted
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage the local git mirror cache for skill sources"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        help=f"Cache directory (default: {default_cache_dir()})"
+    )
+    parser.add_argument(
+        '--list', '-l',
+        action='store_true',
+        help="List cached repositories"
+    )
+    parser.add_argument(
+        '--prune',
+        action='store_true',
+        help="Evict least recently used mirrors over the size cap"
+    )
+    parser.add_argument(
+        '--clear',
+        action='store_true',
+        help="Remove all cached mirrors"
+    )
+
+    args = parser.parse_args()
+    cache = RepoCache(args.cache_dir)
+
+    if args.clear:
+        removed = sum(1 for e in cache.entries() if cache.remove(e['key']))
+        print(f"🧹 Removed {removed} cached repositories")
+    elif args.prune:
+        evicted = cache.evict()
+        print(f"🧹 Evicted {len(evicted)} cached repositories")
+    else:
+        entries = cache.entries()
+        total = sum(e.get('size', 0) for e in entries)
+        print(f"\n📋 Repo cache: {cache.root}\n")
+        for entry in reversed(entries):
+            size_mb = entry.get('size', 0) / 1024 / 1024
+            print(f"  {entry.get('url')} ({size_mb:.1f} MB)")
+        print(f"\n  Total: {total / 1024 / 1024:.1f} MB / {cache.max_size / 1024 / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
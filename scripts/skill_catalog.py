@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Catalog index of all workflows and their skills.
+
+workflows/skill-catalog.json maps each workflow to its skills with their
+configured source, the installed version (from skill-lock.json), file
+count, size and SKILL.md description:
+
+    {
+      "version": 1,
+      "workflows": {
+        "content-creator-workflow": {
+          "stamp": [...],
+          "skills": {
+            "docx": {"type": "github", "source": "https://github.com/...",
+                     "path": "skills/docx", "installed": true,
+                     "version": "<commit>", "files": 12, "size": 48213,
+                     "description": "..."}
+          }
+        }
+      }
+    }
+
+The catalog is refreshed incrementally. Every refresh stats each skill's
+directory and SKILL.md (a few stat calls per skill, no reads); a workflow
+is only re-read when the mtime of its skill-source.json, skill-lock.json
+or skills directory changed or one of those skill stamps did, and a skill
+directory is only re-walked when its own stamp changed. Installers swap
+whole skill directories into place, which moves the directory mtimes,
+and in-place SKILL.md edits move the SKILL.md stamp.
+
+Usage:
+    python scripts/skill_catalog.py                 # Refresh and summarize
+    python scripts/skill_catalog.py --which docx    # Workflows using a skill
+    python scripts/skill_catalog.py --json          # Print the catalog
+    python scripts/skill_catalog.py --rebuild       # Rebuild from scratch
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from skill_lock import LOCK_FILENAME
+from skill_metadata import SKILL_FILENAME, find_skill_metadata
+
+
+CATALOG_FILENAME = 'skill-catalog.json'
+CATALOG_VERSION = 1
+SOURCE_FILENAME = 'skill-source.json'
+
+
+def default_workflows_root() -> Path:
+    """Get the workflows root directory (same rules as update_skills.py)."""
+    root = Path(__file__).parent.parent
+    workflows_root = root / 'workflows'
+    return workflows_root if workflows_root.exists() else root
+
+
+def mtime(path: Path) -> int:
+    """mtime in ns, or 0 if path does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def tree_stats(path: Path) -> tuple[int, int]:
+    """Count files and total bytes under path (.git is skipped)."""
+    files = size = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '.git':
+                        stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    files += 1
+                    size += entry.stat(follow_symlinks=False).st_size
+    return files, size
+
+
+def skill_source(skill: dict[str, Any]) -> str:
+    """Where a skill comes from: repo URL for GitHub, archive URL/path otherwise."""
+    return skill.get('repo') or skill.get('url') or skill.get('path', '')
+
+
+def install_dir(skills_dir: Path, skill: dict[str, Any]) -> Path:
+    """Directory a skill is installed to (mirrors SkillJob.target_dir)."""
+    name = skill.get('name', '')
+    if skill.get('type', 'github') == 'github':
+        return skills_dir / Path(skill.get('path', name)).name
+    return skills_dir / name
+
+
+def expand_skill(skill: dict[str, Any], lock: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """
+    (name, config) pairs for a skill-source.json entry.
+
+    A glob path (e.g. 'skills/*') stands for the skills it matched on the
+    last install, as recorded in the lockfile.
+    """
+    name = skill.get('name', '')
+    names = lock.get(name, {}).get('skills') if glob.has_magic(skill.get('path', '')) else None
+    if not names:
+        return [(name, skill)]
+    return [
+        (n, {**skill, 'name': n, 'path': lock.get(n, {}).get('path', n)})
+        for n in names
+    ]
+
+
+def skill_stamp(target: Path) -> list[int] | None:
+    """[directory mtime, SKILL.md mtime, SKILL.md size], or None if not installed."""
+    try:
+        st = os.stat(target / SKILL_FILENAME)
+    except OSError:
+        return None
+    return [mtime(target), st.st_mtime_ns, st.st_size]
+
+
+def locked_version(entry: dict[str, Any]) -> str | None:
+    """Version recorded in skill-lock.json: commit, archive hash or ETag."""
+    return entry.get('commit') or entry.get('sha256') or entry.get('etag') or entry.get('last_modified')
+
+
+class SkillCatalog:
+    """Incrementally maintained index of workflows -> skills."""
+
+    def __init__(self, root: Path | None = None, path: Path | None = None):
+        self.root = Path(root) if root else default_workflows_root()
+        self.path = Path(path) if path else self.root / CATALOG_FILENAME
+        self.data: dict[str, Any] = {'version': CATALOG_VERSION, 'workflows': {}}
+        self._saved = None
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get('version') == CATALOG_VERSION:
+                self.data = data
+                self._saved = json.dumps(data)
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def workflows(self) -> dict[str, dict[str, Any]]:
+        return self.data['workflows']
+
+    def _workflow_dirs(self) -> list[Path]:
+        dirs = []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name.endswith('-workflow'):
+                    if (Path(entry.path) / '.claude' / SOURCE_FILENAME).exists():
+                        dirs.append(Path(entry.path))
+        return sorted(dirs)
+
+    def _index_workflow(self, workflow_path: Path, previous: dict[str, Any]) -> dict[str, Any]:
+        claude_dir = workflow_path / '.claude'
+        skills_dir = claude_dir / 'skills'
+        with open(claude_dir / SOURCE_FILENAME) as f:
+            config = json.load(f)
+        try:
+            lock = json.loads((claude_dir / LOCK_FILENAME).read_text()).get('skills', {})
+        except (OSError, ValueError):
+            lock = {}
+
+        old_skills = previous.get('skills', {})
+        skills = {}
+        configured = [pair for skill in config.get('skills', []) for pair in expand_skill(skill, lock)]
+        for name, skill in configured:
+            target = install_dir(skills_dir, skill)
+            skill_md = target / SKILL_FILENAME
+            stamp = skill_stamp(target)
+
+            entry = {
+                'type': skill.get('type', 'github'),
+                'source': skill_source(skill),
+                'path': skill.get('path'),
+                'ref': skill.get('ref'),
+                'installed': stamp is not None,
+                'version': locked_version(lock.get(name, {})),
+            }
+            old = old_skills.get(name, {})
+            if stamp is not None and old.get('stamp') == stamp:
+                entry.update({k: old.get(k) for k in ('files', 'size', 'description')})
+            elif stamp is not None:
+                meta = find_skill_metadata(skill_md)
+                files, size = tree_stats(target)
+                entry.update({
+                    'files': files,
+                    'size': size,
+                    'description': meta.description if meta else None,
+                })
+            entry['stamp'] = stamp
+            skills[name] = {k: v for k, v in entry.items() if v is not None}
+        return {'skills': skills}
+
+    def _skills_changed(self, workflow_path: Path, previous: dict[str, Any]) -> bool:
+        """Whether any indexed skill's directory or SKILL.md stamp moved."""
+        skills_dir = workflow_path / '.claude' / 'skills'
+        for name, entry in previous.get('skills', {}).items():
+            target = install_dir(skills_dir, {**entry, 'name': name})
+            if skill_stamp(target) != entry.get('stamp'):
+                return True
+        return False
+
+    def refresh(self, rebuild: bool = False) -> 'SkillCatalog':
+        """Re-index workflows whose sources, lockfile or skills changed."""
+        old = {} if rebuild else self.workflows
+        workflows = {}
+        for workflow_path in self._workflow_dirs():
+            claude_dir = workflow_path / '.claude'
+            stamp = [
+                mtime(claude_dir / SOURCE_FILENAME),
+                mtime(claude_dir / LOCK_FILENAME),
+                mtime(claude_dir / 'skills'),
+            ]
+            previous = old.get(workflow_path.name, {})
+            if previous.get('stamp') == stamp and not self._skills_changed(workflow_path, previous):
+                workflows[workflow_path.name] = previous
+                continue
+            try:
+                entry = self._index_workflow(workflow_path, previous)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Skipping {workflow_path.name}: {e}", file=sys.stderr)
+                continue
+            entry['stamp'] = stamp
+            workflows[workflow_path.name] = entry
+        self.data['workflows'] = workflows
+        return self
+
+    def save(self) -> bool:
+        """
+        Write the catalog if anything changed.
+
+        Returns:
+            True if the file was written
+        """
+        current = json.dumps(self.data)
+        if current == self._saved:
+            return False
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.data, indent=2) + '\n')
+        os.replace(tmp, self.path)
+        self._saved = current
+        return True
+
+    def skills(self, workflow: str) -> dict[str, dict[str, Any]]:
+        """Skills of one workflow ('content-creator' or 'content-creator-workflow')."""
+        if not workflow.endswith('-workflow'):
+            workflow = f"{workflow}-workflow"
+        return self.workflows.get(workflow, {}).get('skills', {})
+
+    def which(self, skill_name: str) -> list[str]:
+        """Workflows that use a skill."""
+        return [name for name, workflow in self.workflows.items() if skill_name in workflow['skills']]
+
+
+def load_catalog(root: Path | None = None) -> SkillCatalog:
+    """Load the catalog, refresh what changed and save it."""
+    catalog = SkillCatalog(root).refresh()
+    catalog.save()
+    return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build and query the workflow skill catalog"
+    )
+    parser.add_argument(
+        '--which',
+        metavar='SKILL',
+        help="List the workflows that use a skill"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Print the catalog as JSON"
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help="Re-index everything instead of only what changed"
+    )
+
+    args = parser.parse_args()
+    catalog = SkillCatalog().refresh(rebuild=args.rebuild)
+    catalog.save()
+
+    if args.which:
+        workflows = catalog.which(args.which)
+        if not workflows:
+            print(f"❌ No workflow uses '{args.which}'")
+            sys.exit(1)
+        for name in workflows:
+            entry = catalog.workflows[name]['skills'][args.which]
+            print(f"{name}: {entry.get('source')} {entry.get('version') or ''}".rstrip())
+    elif args.json:
+        print(json.dumps(catalog.data, indent=2))
+    else:
+        skills = [s for w in catalog.workflows.values() for s in w['skills'].values()]
+        installed = [s for s in skills if s.get('installed')]
+        size_mb = sum(s.get('size', 0) for s in installed) / 1024 / 1024
+        print(f"📋 {catalog.path}")
+        print(f"   {len(catalog.workflows)} workflows, {len(skills)} skills "
+              f"({len(installed)} installed, {size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Atomic skill installation.
+
+Skills are built in a staging directory next to the target (so on the same
+filesystem) and swapped into place with a rename. Readers of .claude/skills
+see either the old skill or the new one, never a half-copied tree, and a
+failed install leaves the previous version untouched. Replaced versions are
+deleted in the background.
+"""
+
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+STAGING_MARKER = '.staging-'
+TRASH_MARKER = '.old-'
+GARBAGE_MAX_AGE = 3600  # Leftovers older than this are from dead runs
+
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+# mkdtemp creates 0700 directories; installed skills get normal permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@dataclass
+class InstallResult:
+    """Outcome of installing one skill from a source holding several."""
+    name: str
+    path: Path | None = None
+    status: str = 'installed'  # 'installed', 'skipped' (already present) or 'failed'
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != 'failed'
+
+
+def print_install_report(results: list[InstallResult]) -> bool:
+    """
+    Print one line per skill and a summary.
+
+    Returns:
+        True if no skill failed
+    """
+    icons = {'installed': '✅', 'skipped': '⚠️ ', 'failed': '❌'}
+    print(f"\n📋 {len(results)} skills:")
+    for result in results:
+        detail = result.error if result.status == 'failed' else result.path
+        print(f"  {icons[result.status]} {result.name}: {result.status} ({detail})")
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in icons}
+    print(f"   {counts['installed']} installed, {counts['skipped']} skipped, {counts['failed']} failed")
+    return counts['failed'] == 0
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    """
+    Atomically swap two paths with renameat2(RENAME_EXCHANGE) on Linux.
+
+    Returns:
+        True if swapped, False if the platform does not support it
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+
+    result = renameat2(
+        _AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE
+    )
+    return result == 0
+
+
+def discard_dir(path: Path, background: bool = True) -> None:
+    """Delete a replaced skill directory, by default on a background thread."""
+    if not background:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={'ignore_errors': True},
+        name=f"discard-{path.name}",
+    ).start()
+
+
+def replace_dir(new_dir: Path, target_dir: Path) -> None:
+    """
+    Move new_dir to target_dir, replacing any existing directory there.
+
+    Both paths must be on the same filesystem. The old directory is renamed
+    aside (or atomically exchanged on Linux) and discarded afterwards; if the
+    swap fails the old directory is restored.
+    """
+    if not target_dir.exists():
+        os.replace(new_dir, target_dir)
+        return
+
+    if _exchange(new_dir, target_dir):
+        # new_dir now holds the previous version
+        trash = target_dir.with_name(f".{target_dir.name}{TRASH_MARKER}{uuid.uuid4().hex[:8]}")
+        os.replace(new_dir, trash)
+        discard_dir(trash)
+        return
+
+    trash = target_dir.with_name(f".{target_dir.name}{TRASH_MARKER}{uuid.uuid4().hex[:8]}")
+    os.replace(target_dir, trash)
+    try:
+        os.replace(new_dir, target_dir)
+    except OSError:
+        os.replace(trash, target_dir)
+        raise
+    discard_dir(trash)
+
+
+def make_staging_dir(parent: Path, name: str) -> Path:
+    """
+    Create an empty staging directory in parent for a skill called name.
+
+    The caller moves it into place with replace_dir or removes it; stale
+    ones are cleaned up by collect_garbage.
+    """
+    parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{name}{STAGING_MARKER}", dir=parent))
+    os.chmod(staging, 0o777 & ~_UMASK)
+    return staging
+
+
+@contextmanager
+def staging_dir(target_dir: Path) -> Iterator[Path]:
+    """
+    Yield an empty staging directory next to target_dir.
+
+    When the block completes the staging directory replaces target_dir;
+    if it raises, the staging directory is removed and target_dir is left
+    as it was.
+    """
+    staging = make_staging_dir(target_dir.parent, target_dir.name)
+    try:
+        yield staging
+        replace_dir(staging, target_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def same_filesystem(a: Path, b: Path) -> bool:
+    """Check whether two existing paths live on the same device."""
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+
+def install_tree(
+    source: Path,
+    target_dir: Path,
+    move: bool = False,
+    store=None,
+    key: str | None = None
+) -> Path:
+    """
+    Install a skill directory at target_dir atomically.
+
+    Args:
+        source: Skill directory to install
+        target_dir: Final location of the skill
+        move: Source is disposable; rename it instead of copying when it is
+            on the same filesystem as target_dir
+        store: Optional SkillStore; files are added to it and target_dir is
+            populated with reflinks or copies of the stored objects
+        key: Content key of source (e.g. git tree hash) for the store to
+            reuse a known manifest instead of re-hashing
+
+    Returns:
+        target_dir
+    """
+    target_dir.parent.mkdir(parents=True, exist_ok=True)
+
+    if store is not None:
+        manifest = store.load_manifest(key) if key else None
+        if manifest is None:
+            manifest = store.add_tree(source, move, key)
+        with staging_dir(target_dir) as staging:
+            store.materialize(manifest, staging)
+        return target_dir
+
+    if move and same_filesystem(source, target_dir.parent):
+        shutil.rmtree(source / '.git', ignore_errors=True)
+        replace_dir(source, target_dir)
+        return target_dir
+
+    with staging_dir(target_dir) as staging:
+        shutil.copytree(
+            source,
+            staging,
+            ignore=shutil.ignore_patterns('.git'),
+            dirs_exist_ok=True
+        )
+    return target_dir
+
+
+def collect_garbage(output_dir: Path, max_age: float = GARBAGE_MAX_AGE) -> int:
+    """
+    Remove staging, replaced and checkout directories left behind by
+    interrupted runs.
+
+    Only entries older than max_age are removed, so installs running in
+    other processes are not disturbed.
+
+    Returns:
+        Number of directories removed
+    """
+    if not output_dir.is_dir():
+        return 0
+
+    removed = 0
+    cutoff = time.time() - max_age
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.'):
+                continue
+            if STAGING_MARKER not in entry.name and TRASH_MARKER not in entry.name:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    removed += 1
+            except OSError:
+                pass
+    return removed
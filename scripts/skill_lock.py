@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Lockfile recording what each installed skill was built from.
+
+Each workflow keeps a skill-lock.json next to its skill-source.json:
+
+    {
+      "version": 1,
+      "skills": {
+        "docx": {"type": "github", "repo": "...", "path": "skills/docx",
+                 "commit": "<sha>", "tree": "<tree sha>"},
+        "my-skill": {"type": "archive", "url": "...", "etag": "...",
+                     "last_modified": "...", "sha256": "..."}
+      }
+    }
+
+update_skills.py compares these records against a cheap upstream probe
+(`git ls-remote` for GitHub, a conditional HEAD for archives) and skips
+skills whose source has not changed.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import urllib.error
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from http_client import request as http_request
+
+
+LOCK_FILENAME = 'skill-lock.json'
+LOCK_VERSION = 1
+
+
+class SkillLock:
+    """Thread-safe view of one workflow's skill-lock.json."""
+
+    def __init__(self, workflow_path: Path):
+        self.path = workflow_path / '.claude' / LOCK_FILENAME
+        self._lock = threading.Lock()
+        self._skills: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self._skills = data.get('skills', {})
+            except (OSError, ValueError):
+                self._skills = {}
+        self._saved = json.dumps(self._skills, sort_keys=True)
+
+    def get(self, name: str) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._skills.get(name, {}))
+
+    def set(self, name: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._skills[name] = {k: v for k, v in entry.items() if v}
+
+    def save(self) -> bool:
+        """
+        Write the lockfile if anything changed.
+
+        Returns:
+            True if the file was written
+        """
+        with self._lock:
+            current = json.dumps(self._skills, sort_keys=True)
+            if current == self._saved:
+                return False
+
+            data = {'version': LOCK_VERSION, 'skills': dict(sorted(self._skills.items()))}
+            tmp = self.path.with_name(f"{self.path.name}.tmp")
+            tmp.write_text(json.dumps(data, indent=2) + '\n')
+            os.replace(tmp, self.path)
+            self._saved = current
+            return True
+
+
+_remote_heads: dict[tuple[str, str | None], str | None] = {}
+_remote_heads_lock = threading.Lock()
+
+
+def remote_head(repo_url: str, ref: str | None = None) -> str | None:
+    """
+    Resolve the commit of a remote branch/tag (HEAD by default) with git ls-remote.
+
+    Results are memoized for the lifetime of the process.
+
+    Returns:
+        Commit SHA, or None if the remote could not be queried
+    """
+    key = (repo_url, ref)
+    with _remote_heads_lock:
+        if key in _remote_heads:
+            return _remote_heads[key]
+
+    sha = None
+    try:
+        result = subprocess.run(
+            # '<ref>^{}' makes annotated tags also list the commit they point to
+            ['git', 'ls-remote', repo_url, *([ref, f'{ref}^{{}}'] if ref else ['HEAD'])],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        lines = [line.split() for line in result.stdout.splitlines() if line.strip()]
+        if result.returncode == 0 and lines:
+            # Annotated tags list the tag object, then the commit as <tag>^{}
+            peeled = [sha for sha, name in lines if name.endswith('^{}')]
+            sha = peeled[0] if peeled else lines[0][0]
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
+    with _remote_heads_lock:
+        _remote_heads[key] = sha
+    return sha
+
+
+def checkout_revision(repo_path: Path, rel_path: str | None = None) -> str | None:
+    """Get the commit of a checkout, or the tree hash of rel_path within it."""
+    rev = f"HEAD:{rel_path}" if rel_path else 'HEAD'
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', rev],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the sha256 of a file without loading it into memory."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def probe_archive(url: str, entry: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Check whether an archive source changed since it was locked.
+
+    Remote archives get a conditional HEAD request using the recorded
+    ETag/Last-Modified; local archives are compared by sha256.
+
+    Args:
+        url: Archive URL or local path
+        entry: Current lock entry for the skill (may be empty)
+
+    Returns:
+        None if unchanged, otherwise the new fingerprint to record
+    """
+    if urlparse(url).scheme not in ('http', 'https'):
+        path = Path(url)
+        if not path.exists():
+            return {'url': url}
+        sha256 = file_sha256(path)
+        if entry.get('url') == url and entry.get('sha256') == sha256:
+            return None
+        return {'url': url, 'sha256': sha256}
+
+    headers = {}
+    if entry.get('url') == url:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        with http_request('HEAD', url, headers=headers, timeout=15) as response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        return {'url': url}
+    except (urllib.error.URLError, OSError):
+        return {'url': url}
+
+    if entry.get('url') == url:
+        if etag and etag == entry.get('etag'):
+            return None
+        if not etag and last_modified and last_modified == entry.get('last_modified'):
+            return None
+
+    return {'url': url, 'etag': etag, 'last_modified': last_modified}
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Shared SKILL.md frontmatter parsing.
+
+Only the leading `---` block is read, line by line and bounded by
+MAX_FRONTMATTER_BYTES, so skills with large bodies cost the same as small
+ones. The block is parsed as YAML (PyYAML when installed, otherwise a small
+parser for the subset SKILL.md files use) into a SkillMetadata, and parsed
+files are cached by (path, mtime, size) so installers, the validator and
+listings share one read per file.
+
+Usage:
+    from skill_metadata import load_skill_metadata
+
+    meta = load_skill_metadata(skill_dir)
+    print(meta.name, meta.description)
+"""
+
+import io
+import os
+import textwrap
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import yaml
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml when available
+except ImportError:  # Fall back to the built-in subset parser
+    yaml = None
+
+
+SKILL_FILENAME = 'SKILL.md'
+MAX_FRONTMATTER_BYTES = 64 * 1024
+REQUIRED_FIELDS = ('name', 'description')
+
+
+class FrontmatterError(ValueError):
+    """SKILL.md has missing or malformed frontmatter."""
+
+
+@dataclass(frozen=True)
+class SkillMetadata:
+    """Parsed SKILL.md frontmatter."""
+
+    name: str
+    description: str
+    license: str | None = None
+    allowed_tools: tuple[str, ...] = ()
+    fields: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, Any]) -> 'SkillMetadata':
+        """Build metadata from parsed frontmatter, checking required fields."""
+        for key in REQUIRED_FIELDS:
+            if key not in fields:
+                raise FrontmatterError(f"SKILL.md missing required '{key}' field")
+            if fields[key] is None or str(fields[key]).strip() == '':
+                raise FrontmatterError(f"SKILL.md has an empty '{key}' field")
+
+        tools = fields.get('allowed-tools') or ()
+        if isinstance(tools, str):
+            tools = [t.strip() for t in tools.replace(',', ' ').split()]
+        license = fields.get('license')
+        return cls(
+            name=str(fields['name']).strip(),
+            description=' '.join(str(fields['description']).split()),
+            license=str(license) if license is not None else None,
+            allowed_tools=tuple(str(t) for t in tools),
+            fields=fields,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {'name': self.name, 'description': self.description}
+        if self.license:
+            data['license'] = self.license
+        if self.allowed_tools:
+            data['allowed_tools'] = list(self.allowed_tools)
+        return data
+
+
+def read_frontmatter(stream: BinaryIO, limit: int = MAX_FRONTMATTER_BYTES) -> str:
+    """
+    Read the frontmatter block from the start of a SKILL.md stream.
+
+    Stops at the closing `---` line; the body is never read.
+
+    Raises:
+        FrontmatterError: No opening/closing `---`, or the block exceeds limit
+    """
+    first = stream.readline(limit)
+    if first.startswith(b'\xef\xbb\xbf'):
+        first = first[3:]
+    if first.rstrip(b'\r\n') != b'---':
+        raise FrontmatterError("SKILL.md missing YAML frontmatter (must start with ---)")
+
+    lines = []
+    size = len(first)
+    while size < limit:
+        line = stream.readline(limit - size)
+        if not line:
+            break
+        size += len(line)
+        if line.rstrip(b'\r\n') == b'---':
+            try:
+                return b''.join(lines).decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise FrontmatterError(f"SKILL.md frontmatter is not valid UTF-8: {e}") from e
+        lines.append(line)
+
+    if size >= limit:
+        raise FrontmatterError(f"SKILL.md frontmatter exceeds {limit} bytes")
+    raise FrontmatterError("SKILL.md has invalid frontmatter format (no closing ---)")
+
+
+def _scalar(value: str) -> Any:
+    """Convert a plain or quoted YAML scalar."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        inner = value[1:-1]
+        return inner.replace("''", "'") if value[0] == "'" else inner.replace('\\"', '"')
+    if ' #' in value:
+        value = value.split(' #', 1)[0].rstrip()
+    if value in ('', '~', 'null'):
+        return None
+    if value in ('true', 'false'):
+        return value == 'true'
+    if value.startswith('[') and value.endswith(']'):
+        return [_scalar(item) for item in value[1:-1].split(',') if item.strip()]
+    return value
+
+
+def parse_simple_yaml(text: str) -> dict[str, Any]:
+    """
+    Parse the YAML subset used in SKILL.md frontmatter.
+
+    Supports top-level `key: value` pairs with plain or quoted scalars,
+    plain scalars continued on indented lines, `|` / `>` block scalars and
+    `- item` lists. Nested mappings are kept as raw text.
+    """
+    fields: dict[str, Any] = {}
+    key = None
+    style = None  # '|' or '>' while collecting a block scalar
+    keep_newline = True  # False for the '|-' / '>-' chomping indicator
+    lines: list[str] = []
+
+    def finish():
+        if key is None or isinstance(fields[key], list) or not lines:
+            return
+        if style == '|':
+            fields[key] = textwrap.dedent('\n'.join(lines)).strip('\n')
+        else:
+            fields[key] = ' '.join(line.strip() for line in lines if line.strip())
+        if style and keep_newline:
+            fields[key] += '\n'
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        indented = raw[:1] in (' ', '\t')
+        if style and (indented or not line):
+            lines.append(line)
+            continue
+        if not line or line.lstrip().startswith('#'):
+            continue
+
+        if indented or line.startswith('- '):
+            if key is None:
+                raise FrontmatterError(f"SKILL.md frontmatter has an invalid line: {line!r}")
+            item = line.strip()
+            if item.startswith('- ') and (fields[key] is None or isinstance(fields[key], list)):
+                fields[key] = fields[key] or []
+                fields[key].append(_scalar(item[2:]))
+            else:
+                lines.append(item)
+            continue
+
+        name, sep, value = line.partition(':')
+        if not sep or not name.strip():
+            raise FrontmatterError(f"SKILL.md frontmatter has an invalid line: {line!r}")
+
+        finish()
+        key = name.strip().strip('"\'')
+        value = value.strip()
+        style = None
+        lines = []
+        if value[:1] in ('|', '>'):
+            style = value[0]
+            keep_newline = not value.endswith('-')
+            fields[key] = ''
+        elif value:
+            fields[key] = _scalar(value)
+            if isinstance(fields[key], str):
+                lines = [fields[key]]
+        else:
+            fields[key] = None
+
+    finish()
+    return fields
+
+
+def parse_frontmatter(text: str) -> dict[str, Any]:
+    """Parse frontmatter text into a dict (strict YAML first, then the subset parser)."""
+    if yaml is not None:
+        try:
+            data = yaml.load(text, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            # Hand-written frontmatter is often not strict YAML (e.g. an
+            # unquoted description containing ": "); read it leniently
+            return parse_simple_yaml(text)
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise FrontmatterError("SKILL.md frontmatter must be a mapping")
+        return data
+    return parse_simple_yaml(text)
+
+
+def read_skill_metadata(stream: BinaryIO) -> SkillMetadata:
+    """Parse SKILL.md metadata from a binary stream (e.g. an archive member)."""
+    return SkillMetadata.from_fields(parse_frontmatter(read_frontmatter(stream)))
+
+
+def parse_skill_md(data: bytes | str) -> SkillMetadata:
+    """Parse SKILL.md content that is already in memory."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return read_skill_metadata(io.BytesIO(data))
+
+
+_cache: dict[str, tuple[int, int, SkillMetadata | FrontmatterError]] = {}
+_cache_lock = threading.Lock()
+
+
+def skill_md_path(path: str | os.PathLike) -> Path:
+    """Accept a skill directory or a SKILL.md path."""
+    path = Path(path)
+    return path if path.name == SKILL_FILENAME else path / SKILL_FILENAME
+
+
+def load_skill_metadata(path: str | os.PathLike) -> SkillMetadata:
+    """
+    Read and parse a skill's SKILL.md frontmatter.
+
+    Args:
+        path: Skill directory or path to its SKILL.md
+
+    Returns:
+        Parsed metadata; cached until the file's mtime or size changes
+
+    Raises:
+        FileNotFoundError: SKILL.md does not exist
+        FrontmatterError: Missing or malformed frontmatter
+    """
+    skill_md = skill_md_path(path)
+    st = os.stat(skill_md)  # FileNotFoundError propagates
+    key = os.path.abspath(skill_md)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        result = cached[2]
+    else:
+        try:
+            with open(skill_md, 'rb') as f:
+                result = read_skill_metadata(f)
+        except FrontmatterError as e:
+            result = e
+        with _cache_lock:
+            _cache[key] = (st.st_mtime_ns, st.st_size, result)
+
+    if isinstance(result, FrontmatterError):
+        raise FrontmatterError(*result.args)
+    return result
+
+
+def find_skill_metadata(path: str | os.PathLike) -> SkillMetadata | None:
+    """Like load_skill_metadata, but None for missing or invalid SKILL.md."""
+    try:
+        return load_skill_metadata(path)
+    except (OSError, FrontmatterError):
+        return None
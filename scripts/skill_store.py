@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for installed skill files.
+
+Every file is stored once under objects/<sha256>, and tree manifests
+remember which objects make up a known skill tree (e.g. a git tree hash),
+so reinstalling it needs no re-hashing. Workflows' skill directories are
+populated with reflinks to the objects (btrfs, xfs: copy-on-write, so the
+disk blocks are shared and disk use scales with unique content).
+
+Installed files are never hardlinked to store objects: skills live in the
+git working tree, and an in-place edit through a hardlink would change the
+object (and every other workflow's copy) behind its sha256 name. Objects
+are still checked against their name before they are reused.
+
+The store is opt-in (update_skills.py --store), and only used when the
+store and the workflows sit on one filesystem that supports reflinks (see
+SkillStore.supports_reflinks). Elsewhere an install through the store would
+be a plain copy plus hashing and a second copy, so skills are installed
+directly instead.
+
+Usage:
+    python scripts/skill_store.py          # Show store statistics
+    python scripts/skill_store.py --gc     # Drop objects no skill tree uses
+"""
+
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks
+    fcntl = None
+
+
+FICLONE = 0x40049409  # Linux ioctl to clone file extents (btrfs, xfs)
+HASH_CHUNK = 1024 * 1024
+
+# Installed files get normal permissions, whatever the store object has
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def default_store_dir() -> Path:
+    """Get the store directory, honouring AI_WORKFLOW_STORE_DIR and XDG_CACHE_HOME."""
+    if os.environ.get('AI_WORKFLOW_STORE_DIR'):
+        return Path(os.environ['AI_WORKFLOW_STORE_DIR']).expanduser()
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'ai-workflow' / 'store'
+
+
+def hash_file(path: Path) -> str:
+    """sha256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reflink(src: Path, dst: Path) -> bool:
+    """
+    Clone src to dst sharing extents (copy-on-write), if the filesystem allows.
+
+    Returns:
+        True if dst was created as a reflink
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """
+    Create dst as a hardlink to src, falling back to reflink, then copy.
+
+    Only for files nobody edits afterwards (store objects made from a
+    disposable checkout), never for installed skill files.
+
+    Returns:
+        'link', 'reflink' or 'copy'
+    """
+    try:
+        os.link(src, dst)
+        return 'link'
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+    return clone_or_copy(src, dst)
+
+
+def clone_or_copy(src: Path, dst: Path) -> str:
+    """
+    Create dst as an independent file with src's content: a reflink if the
+    filesystem allows, otherwise a copy.
+
+    Returns:
+        'reflink' or 'copy'
+    """
+    if reflink(src, dst):
+        return 'reflink'
+    shutil.copyfile(src, dst)
+    return 'copy'
+
+
+def install_mode(executable: bool) -> int:
+    """Permissions for an installed file (store objects are read-only)."""
+    return (0o777 if executable else 0o666) & ~_UMASK
+
+
+class SkillStore:
+    """On-disk content-addressed store of skill files and tree manifests."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root) if root else default_store_dir()
+        self.objects = self.root / 'objects'
+        self.trees = self.root / 'trees'
+        self._verified: dict[Path, tuple[int, int, int]] = {}
+        self._verified_lock = threading.Lock()
+
+    def supports_reflinks(self, directory: Path) -> bool:
+        """Check whether store objects can be reflinked into directory."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        probe = self.root / '.reflink-probe'
+        if not probe.exists():
+            probe.write_bytes(b'reflink probe\n')
+        directory.mkdir(parents=True, exist_ok=True)
+        clone = directory / f".reflink-probe.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            return reflink(probe, clone)
+        finally:
+            clone.unlink(missing_ok=True)
+
+    def object_path(self, digest: str, executable: bool = False) -> Path:
+        name = f"{digest}.x" if executable else digest
+        return self.objects / digest[:2] / name
+
+    def verify(self, obj: Path) -> bool:
+        """
+        Check that an object's content still matches its sha256 name.
+
+        Objects that do not match (e.g. edited through an old hardlink) are
+        deleted so they are re-added from the source. Results are remembered
+        per (inode, mtime, size), so each object is hashed once per run.
+
+        Returns:
+            True if obj exists and is intact
+        """
+        try:
+            st = os.stat(obj)
+        except OSError:
+            return False
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._verified_lock:
+            if self._verified.get(obj) == stamp:
+                return True
+
+        if hash_file(obj) != obj.name.split('.')[0]:
+            obj.unlink(missing_ok=True)
+            return False
+        with self._verified_lock:
+            self._verified[obj] = stamp
+        return True
+
+    def _tree_path(self, key: str) -> Path:
+        safe = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in key)
+        return self.trees / f"{safe}.json"
+
+    def add_file(self, path: Path, move: bool = False) -> str:
+        """
+        Add one file to the store.
+
+        Args:
+            path: File to add
+            move: path is disposable (e.g. in a temporary checkout), so it
+                may be hardlinked into the store (and made read-only)
+                instead of copied
+
+        Returns:
+            Object name relative to objects/ (e.g. 'ab/abcd...')
+        """
+        executable = bool(os.stat(path).st_mode & 0o111)
+        obj = self.object_path(hash_file(path), executable)
+
+        if not self.verify(obj):
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_name(f"{obj.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+            if move:
+                link_or_copy(path, tmp)
+            else:
+                clone_or_copy(path, tmp)
+            os.chmod(tmp, 0o555 if executable else 0o444)
+            os.replace(tmp, obj)
+
+        return f"{obj.parent.name}/{obj.name}"
+
+    def add_tree(self, source: Path, move: bool = False, key: str | None = None) -> list[list[str]]:
+        """
+        Add every file under source (skipping .git) to the store.
+
+        Args:
+            source: Directory to add
+            move: source is disposable (see add_file)
+            key: Optional content key (e.g. a git tree hash) to remember the
+                resulting manifest under, so the tree is not re-hashed later
+
+        Returns:
+            Manifest: sorted [relative_path, object] pairs
+        """
+        manifest = []
+        for root, dirs, files in os.walk(source):
+            dirs[:] = [d for d in dirs if d != '.git']
+            for name in files:
+                path = Path(root) / name
+                if path.is_symlink():
+                    continue
+                rel = path.relative_to(source).as_posix()
+                manifest.append([rel, self.add_file(path, move)])
+        manifest.sort()
+
+        if key:
+            self.save_manifest(key, manifest)
+        return manifest
+
+    def absorb(self, directory: Path) -> list[list[str]]:
+        """
+        Add a freshly built directory's files to the store.
+
+        The files stay independent of the store; where the filesystem
+        supports reflinks they are replaced by clones of the objects, so
+        identical files share disk blocks.
+
+        Returns:
+            Manifest of the directory
+        """
+        manifest = self.add_tree(directory)
+        for rel, obj in manifest:
+            path = directory.joinpath(*rel.split('/'))
+            mode = os.stat(path).st_mode & 0o7777
+            tmp = path.with_name(f".{path.name}.clone.tmp")
+            if not reflink(self.objects / obj, tmp):
+                break  # No reflinks here, keep the plain files
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        return manifest
+
+    def save_manifest(self, key: str, manifest: list[list[str]]) -> None:
+        tree_path = self._tree_path(key)
+        tree_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tree_path.with_name(f"{tree_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, tree_path)
+
+    def load_manifest(self, key: str) -> list[list[str]] | None:
+        """Manifest remembered for key, if all of its objects are present and intact."""
+        try:
+            manifest = json.loads(self._tree_path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        if all(self.verify(self.objects / obj) for _, obj in manifest):
+            return manifest
+        return None
+
+    def materialize(self, manifest: list[list[str]], dest: Path) -> dict[str, int]:
+        """
+        Populate dest with reflinks or copies of the objects in manifest.
+
+        Raises:
+            ValueError: An object is missing or does not match its hash
+
+        Returns:
+            Count of files per method ('reflink', 'copy')
+        """
+        stats = {'reflink': 0, 'copy': 0}
+        for rel, obj in manifest:
+            obj_path = self.objects / obj
+            if not self.verify(obj_path):
+                raise ValueError(f"Store object {obj} is missing or corrupt")
+            target = dest.joinpath(*rel.split('/'))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            stats[clone_or_copy(obj_path, target)] += 1
+            os.chmod(target, install_mode(obj.endswith('.x')))
+        return stats
+
+    def gc(self) -> tuple[int, int]:
+        """
+        Remove objects no tree manifest references, and stale manifests.
+
+        Installed skills are independent files (reflinks or copies), so
+        dropping an unreferenced object never affects a workflow. Objects
+        still hardlinked from installs made by older versions are kept.
+
+        Returns:
+            Tuple of (objects_removed, bytes_freed)
+        """
+        referenced = set()
+        if self.trees.exists():
+            for tree_path in self.trees.glob('*.json'):
+                try:
+                    manifest = json.loads(tree_path.read_text())
+                except (OSError, ValueError):
+                    manifest = None
+                if manifest is None or not all((self.objects / obj).exists() for _, obj in manifest):
+                    tree_path.unlink(missing_ok=True)
+                    continue
+                referenced.update(obj for _, obj in manifest)
+
+        removed = 0
+        freed = 0
+        if self.objects.exists():
+            for obj in self.objects.glob('*/*'):
+                st = obj.lstat()
+                if f"{obj.parent.name}/{obj.name}" not in referenced and st.st_nlink <= 1:
+                    obj.unlink(missing_ok=True)
+                    removed += 1
+                    freed += st.st_size
+
+        return removed, freed
+
+    def stats(self) -> dict[str, int]:
+        """Object count, stored bytes and remembered tree manifests."""
+        count = 0
+        stored = 0
+        if self.objects.exists():
+            for obj in self.objects.glob('*/*'):
+                count += 1
+                stored += obj.lstat().st_size
+        trees = len(list(self.trees.glob('*.json'))) if self.trees.exists() else 0
+        return {'objects': count, 'bytes': stored, 'trees': trees}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage the content-addressed skill store"
+    )
+    parser.add_argument(
+        '--store-dir',
+        type=Path,
+        help=f"Store directory (default: {default_store_dir()})"
+    )
+    parser.add_argument(
+        '--gc',
+        action='store_true',
+        help="Remove objects that no remembered skill tree uses"
+    )
+
+    args = parser.parse_args()
+    store = SkillStore(args.store_dir)
+
+    if args.gc:
+        removed, freed = store.gc()
+        print(f"🧹 Removed {removed} objects ({freed / 1024 / 1024:.1f} MB)")
+        return
+
+    stats = store.stats()
+    print(f"\n📋 Skill store: {store.root}\n")
+    print(f"  Objects: {stats['objects']}")
+    print(f"  Stored:  {stats['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"  Trees:   {stats['trees']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,17 +24,264 @@ Examples:
 
     # Dry run (show what would be updated)
     python scripts/update_skills.py -w content-creator --all --dry-run
+
+    # Fetch up to 8 repositories/archives at once
+    python scripts/update_skills.py --all-workflows --jobs 8
+
+    # Reinstall everything, even skills whose upstream has not changed
+    python scripts/update_skills.py --all-workflows --full
+
+    # Show the de-duplicated fetch plan across all workflows
+    python scripts/update_skills.py --all-workflows --dry-run
+
+A skill-source.json entry whose "path" is a glob (e.g. "skills/*") installs
+every skill in the repository or archive that matches, from one fetch.
 """
 
 import argparse
+import glob
+import io
 import json
 import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # Import existing downloaders
-from download_from_github import download_skill as download_github, parse_github_url
-from download_from_archive import download_from_archive
+from download_from_github import (
+    checkout,
+    download_skill as download_github,
+    expand_skill_paths,
+    find_skill_source,
+    glob_base,
+    install_from_checkout,
+    parse_github_url,
+)
+from download_from_archive import (
+    download_from_archive,
+    find_skill_roots,
+    install_from_archive,
+    match_skill_roots,
+    open_archive,
+)
+from repo_cache import RepoCache
+from skill_install import collect_garbage
+from skill_store import SkillStore
+from skill_lock import SkillLock, checkout_revision, probe_archive, remote_head
+from skill_catalog import load_catalog
+
+
+@dataclass
+class SkillJob:
+    """A skill entry from skill-source.json and where to install it."""
+    skill: dict[str, Any]
+    output_dir: Path
+    lock: SkillLock | None = None
+
+    @property
+    def name(self) -> str:
+        return self.skill.get('name', '')
+
+    @property
+    def path(self) -> str:
+        return self.skill.get('path', self.name)
+
+    @property
+    def ref(self) -> str | None:
+        """Branch or tag to fetch (None = default branch)."""
+        return self.skill.get('ref') or None
+
+    @property
+    def workflow(self) -> str:
+        return self.output_dir.parent.parent.name
+
+    def locked(self) -> dict[str, Any]:
+        """Lock entry for this skill, if it still matches its configured source."""
+        if self.lock is None:
+            return {}
+        entry = self.lock.get(self.name)
+        if entry.get('repo') != self.skill.get('repo') or entry.get('path') != self.path \
+                or entry.get('ref') != self.ref:
+            return {}
+        return entry
+
+    @property
+    def target_dir(self) -> Path:
+        """Directory the installer will write this skill to."""
+        if self.skill.get('type', 'github') == 'github':
+            return self.output_dir / Path(self.path).name
+        return self.output_dir / self.name
+
+    @property
+    def is_glob(self) -> bool:
+        """Path is a glob (e.g. 'skills/*') standing for several skills."""
+        return glob.has_magic(self.skill.get('path', ''))
+
+    def locked_skills(self) -> list[str]:
+        """Skills a glob matched on its last install (recorded in the lockfile)."""
+        if self.skill.get('type', 'github') == 'github':
+            entry = self.locked()
+        else:
+            entry = self.lock.get(self.name) if self.lock is not None else {}
+        return entry.get('skills') or []
+
+    @property
+    def skill_count(self) -> int:
+        """Skills this entry stands for: its last matches for a glob, else 1."""
+        return max(len(self.locked_skills()), 1) if self.is_glob else 1
+
+    def installed(self) -> bool:
+        """
+        Check whether the skill is installed.
+
+        For a glob, every skill it matched on the last install must be
+        present.
+        """
+        if not self.is_glob:
+            return self.target_dir.exists()
+        names = self.locked_skills()
+        return bool(names) and all((self.output_dir / name).exists() for name in names)
+
+    def expand(self, paths: list[str]) -> list['SkillJob']:
+        """One job per skill path matched by this job's glob."""
+        return [
+            SkillJob({**self.skill, 'name': Path(path).name, 'path': path}, self.output_dir, self.lock)
+            for path in paths
+        ]
+
+
+@dataclass
+class FetchPlan:
+    """
+    De-duplicated fetches for a set of skills, possibly across workflows.
+
+    Each GitHub (repo, ref) is fetched once with one sparse checkout of all
+    its paths and each archive URL is downloaded once; the result is then
+    installed into every workflow that uses it.
+    """
+    repos: dict[tuple[str, str | None], list[SkillJob]] = field(default_factory=dict)
+    archives: dict[str, list[SkillJob]] = field(default_factory=dict)
+    others: list[SkillJob] = field(default_factory=list)
+
+    @property
+    def skills(self) -> int:
+        jobs = [job for group in [*self.repos.values(), *self.archives.values(), self.others]
+                for job in group]
+        return sum(job.skill_count for job in jobs)
+
+    @property
+    def fetches(self) -> int:
+        return len(self.repos) + len(self.archives) + len(self.others)
+
+    def print(self) -> None:
+        """Print the plan and the fetches it saves over one fetch per skill."""
+        workflows = {job.workflow for jobs in [*self.repos.values(), *self.archives.values(), self.others]
+                     for job in jobs}
+        print(f"\n📋 Fetch plan: {self.fetches} fetches for {self.skills} skills "
+              f"in {len(workflows)} workflows")
+
+        for (repo_url, ref), jobs in self.repos.items():
+            print(f"\n  🔗 {repo_url}{f' @ {ref}' if ref else ''}")
+            by_path: dict[str, list[str]] = {}
+            for job in jobs:
+                by_path.setdefault(job.path, []).append(job.workflow)
+            for path, users in by_path.items():
+                print(f"     {path} → {', '.join(users)}")
+
+        for url, jobs in self.archives.items():
+            print(f"\n  📦 {url}")
+            print(f"     → {', '.join(f'{job.workflow} ({job.name})' for job in jobs)}")
+
+        for job in self.others:
+            print(f"\n  ⚠️  {job.workflow}: {job.name} ({job.skill.get('type', 'github')}) cannot be planned")
+
+        saved = self.skills - self.fetches
+        percent = 100 * saved / self.skills if self.skills else 0
+        print(f"\n  Saves {saved} of {self.skills} fetches ({percent:.0f}%)")
+
+
+def plan_fetches(skill_jobs: list[SkillJob]) -> FetchPlan:
+    """
+    Build a fetch plan keyed by (type, repo/url, ref).
+
+    Skills with an invalid or unknown source are left in plan.others and
+    go through update_skill, which reports the problem.
+    """
+    plan = FetchPlan()
+    for job in skill_jobs:
+        source_type = job.skill.get('type', 'github')
+        if source_type == 'github' and job.skill.get('repo'):
+            try:
+                repo_url, _ = parse_github_url(job.skill['repo'])
+            except ValueError:
+                plan.others.append(job)
+                continue
+            plan.repos.setdefault((repo_url, job.ref), []).append(job)
+        elif source_type == 'archive' and job.skill.get('url'):
+            plan.archives.setdefault(job.skill['url'], []).append(job)
+        else:
+            plan.others.append(job)
+    return plan
+
+
+class BufferedStdout(io.TextIOBase):
+    """
+    sys.stdout proxy that buffers output per worker thread.
+
+    Each task's lines are written out in one piece when it finishes, so
+    output from skills running in parallel never interleaves. Use it as a
+    context manager: it replaces sys.stdout on entry and always restores
+    it on exit.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'BufferedStdout':
+        sys.stdout = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        sys.stdout = self.stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            with self._lock:
+                return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def run(self, task: Callable[[], tuple[int, int]]) -> tuple[int, int]:
+        """Run task with its output buffered, then emit it atomically."""
+        self._local.buffer = io.StringIO()
+        try:
+            return task()
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+            with self._lock:
+                self.stream.write(output)
+                self.stream.flush()
+
+
+_target_locks: dict[Path, threading.Lock] = {}
+_target_locks_guard = threading.Lock()
+
+
+def target_lock(target_dir: Path) -> threading.Lock:
+    """Get the lock serializing writes to one installed skill directory."""
+    key = target_dir.resolve()
+    with _target_locks_guard:
+        return _target_locks.setdefault(key, threading.Lock())
 
 
 def get_project_root() -> Path:
@@ -75,7 +322,11 @@ def update_skill(
     skill_config: dict[str, Any],
     output_dir: Path,
     force: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    cache: RepoCache | None = None,
+    lock: SkillLock | None = None,
+    incremental: bool = True,
+    store: SkillStore | None = None
 ) -> bool:
     """
     Update a single skill based on its configuration.
@@ -85,6 +336,10 @@ def update_skill(
         output_dir: Directory to install skill (.claude/skills/)
         force: Overwrite existing
         dry_run: Just print what would happen
+        cache: Optional mirror cache for GitHub sources
+        lock: Workflow lockfile to check and record the installed source in
+        incremental: Skip archive skills whose source has not changed
+        store: Optional content-addressed store to install through
 
     Returns:
         True if successful, False otherwise
@@ -109,7 +364,8 @@ def update_skill(
 
             # Parse and download
             repo_url, _ = parse_github_url(repo)
-            download_github(repo_url, path, str(output_dir), force)
+            with target_lock(output_dir / Path(path).name):
+                download_github(repo_url, path, str(output_dir), force, cache)
 
         elif source_type == 'archive':
             url = skill_config.get('url')
@@ -118,7 +374,18 @@ def update_skill(
                 print(f"    ❌ Missing 'url' for archive skill: {name}")
                 return False
 
-            download_from_archive(url, str(output_dir), force, name)
+            entry = lock.get(name) if lock is not None else {}
+            fingerprint = probe_archive(url, entry) if lock is not None else None
+            if incremental and lock is not None and fingerprint is None \
+                    and (output_dir / name).exists():
+                print(f"    ✓ {name} is up to date")
+                return True
+
+            with target_lock(output_dir / name):
+                download_from_archive(url, str(output_dir), force, name, store=store)
+
+            if lock is not None:
+                lock.set(name, {'type': 'archive', **(fingerprint or entry)})
 
         else:
             print(f"    ❌ Unknown source type: {source_type}")
@@ -131,50 +398,419 @@ def update_skill(
         return False
 
 
-def update_workflow(
+def update_github_repo(
+    repo_url: str,
+    jobs: list[SkillJob],
+    force: bool = True,
+    cache: RepoCache | None = None,
+    incremental: bool = True,
+    store: SkillStore | None = None,
+    ref: str | None = None
+) -> tuple[int, int]:
+    """
+    Update every skill that comes from one GitHub repository.
+
+    The repository is cloned once with a single sparse checkout covering
+    all requested paths, and each skill is copied out of that checkout.
+    Glob paths are expanded against the checkout into one skill per match.
+    With incremental, skills whose locked commit matches the remote HEAD
+    are skipped before cloning, and skills whose tree hash is unchanged
+    are skipped after it.
+
+    Returns:
+        Tuple of (success_count, fail_count)
+    """
+    print(f"\n  🔗 {repo_url}{f' @ {ref}' if ref else ''} ({len(jobs)} skills)")
+
+    success = 0
+    failed = 0
+
+    # Existing skills are kept as-is without --force, no need to fetch them
+    if not force:
+        pending = []
+        for job in jobs:
+            if job.installed():
+                print(f"  ⚠️  Skill '{job.name}' already exists at {job.target_dir}")
+                success += job.skill_count
+            else:
+                pending.append(job)
+        jobs = pending
+        if not jobs:
+            return success, failed
+
+    # Cheap check: nothing to do if the remote HEAD is the locked commit
+    if incremental:
+        head = remote_head(repo_url, ref)
+        pending = []
+        for job in jobs:
+            if head and job.locked().get('commit') == head and job.installed():
+                print(f"    ✓ {job.name} is up to date")
+                success += job.skill_count
+            else:
+                pending.append(job)
+        jobs = pending
+        if not jobs:
+            return success, failed
+
+    # Skipped skills are already counted; a failed fetch fails the rest
+    configured = {id(job) for job in jobs}
+    processed = 0
+    try:
+        # Check out among the skills so unique paths can be moved, not copied
+        work_dir = jobs[0].output_dir
+        bases = [glob_base(job.path) for job in jobs]
+        with checkout(repo_url, bases, cache, work_dir, ref) as repo_path:
+            commit = checkout_revision(repo_path)
+
+            # Globs become one job per matching skill directory
+            expanded: list[SkillJob] = []
+            globs: list[tuple[SkillJob, list[SkillJob]]] = []
+            for job in jobs:
+                if not job.is_glob:
+                    expanded.append(job)
+                    continue
+                processed += 1  # Its matches are counted one by one below
+                matches = job.expand(expand_skill_paths(repo_path, [job.path]))
+                print(f"  {job.name}: {job.path} matches {len(matches)} skills")
+                if not matches:
+                    print(f"    ❌ No skill matches {job.path}")
+                    failed += 1
+                    continue
+                expanded.extend(matches)
+                globs.append((job, matches))
+
+            paths = [job.path for job in expanded]
+            failures: set[int] = set()
+            for job, path in zip(expanded, paths):
+                print(f"  Updating: {job.name}...")
+                if id(job) in configured:
+                    processed += 1
+                try:
+                    source = find_skill_source(repo_path, path)
+                    tree = checkout_revision(repo_path, source.relative_to(repo_path).as_posix())
+                    entry = job.locked()
+
+                    if incremental and tree and entry.get('tree') == tree and job.target_dir.exists():
+                        print(f"    ✓ {job.name} is unchanged at {commit[:7] if commit else 'HEAD'}")
+                    else:
+                        move = paths.count(path) == 1
+                        with target_lock(job.target_dir):
+                            install_from_checkout(
+                                repo_path, path, str(job.output_dir), force, move,
+                                store, f"git-tree-{tree}" if tree else None
+                            )
+
+                    if job.lock is not None:
+                        job.lock.set(job.name, {
+                            'type': 'github',
+                            'repo': job.skill.get('repo'),
+                            'path': path,
+                            'ref': ref,
+                            'commit': commit,
+                            'tree': tree,
+                        })
+                    success += 1
+                except Exception as e:
+                    print(f"    ❌ Failed to update {job.name}: {e}")
+                    failures.add(id(job))
+                    failed += 1
+
+            # A glob is locked at this commit only if all its skills installed
+            for job, matches in globs:
+                if job.lock is not None and not any(id(m) in failures for m in matches):
+                    job.lock.set(job.name, {
+                        'type': 'github',
+                        'repo': job.skill.get('repo'),
+                        'path': job.path,
+                        'ref': ref,
+                        'commit': commit,
+                        'skills': [m.name for m in matches],
+                    })
+    except Exception as e:
+        print(f"    ❌ Failed to fetch {repo_url}: {e}")
+        failed += len(jobs) - processed
+
+    return success, failed
+
+
+def update_archive(
+    url: str,
+    jobs: list[SkillJob],
+    force: bool = True,
+    incremental: bool = True,
+    store: SkillStore | None = None
+) -> tuple[int, int]:
+    """
+    Update every skill that comes from one archive URL.
+
+    The archive is downloaded and opened once; each skill's subtree is
+    extracted from it into its workflow. A skill with a "path" picks that
+    skill directory from a multi-skill archive, and a glob path installs
+    every match; otherwise the shallowest skill is used.
+
+    Returns:
+        Tuple of (success_count, fail_count)
+    """
+    print(f"\n  📦 {url} ({len(jobs)} skills)")
+
+    success = 0
+    failed = 0
+    probes: dict[str, dict[str, Any] | None] = {}
+    fingerprints: dict[int, dict[str, Any]] = {}
+    pending = []
+
+    for job in jobs:
+        if not force and job.installed():
+            print(f"  ⚠️  Skill '{job.name}' already exists at {job.target_dir}")
+            success += job.skill_count
+            continue
+
+        entry = job.lock.get(job.name) if job.lock is not None else {}
+        fingerprint = None
+        if job.lock is not None:
+            # Workflows locked at the same version share one probe request
+            key = json.dumps(entry, sort_keys=True)
+            if key not in probes:
+                probes[key] = probe_archive(url, entry)
+            fingerprint = probes[key]
+
+        if incremental and job.lock is not None and fingerprint is None and job.installed():
+            print(f"    ✓ {job.name} is up to date")
+            success += job.skill_count
+            continue
+
+        fingerprints[id(job)] = fingerprint or entry
+        pending.append(job)
+
+    if not pending:
+        return success, failed
+
+    processed = 0
+    try:
+        with open_archive(url) as archive:
+            roots = find_skill_roots(archive.names())
+            if not roots:
+                raise FileNotFoundError("SKILL.md not found in archive")
+
+            # Every matched skill of every job is extracted in one pass
+            installs, owners = [], []
+            for job in pending:
+                path = job.skill.get('path')
+                prefixes = match_skill_roots(roots, [path]) if path else roots[:1]
+                if not prefixes:
+                    print(f"    ❌ Failed to update {job.name}: No skill matches {path} in archive")
+                    failed += 1
+                    processed += 1
+                    continue
+                for prefix in prefixes:
+                    # A glob names each skill after its directory, as for GitHub
+                    name = (Path(prefix).name or None) if job.is_glob else job.name or None
+                    installs.append((prefix, job.output_dir, name))
+                owners.extend([job] * len(prefixes))
+
+            jobs_by_id = {id(job): job for job in owners}
+            if jobs_by_id:
+                print(f"  Updating: {', '.join(job.name for job in jobs_by_id.values())}...")
+            results = install_from_archive(archive, installs, True, store, target_lock)
+
+            for job in jobs_by_id.values():
+                processed += 1
+                job_results = [r for r, owner in zip(results, owners) if owner is job]
+                errors = [r.error for r in job_results if r.status == 'failed']
+                if errors:
+                    print(f"    ❌ Failed to update {job.name}: {'; '.join(errors)}")
+                    failed += 1
+                    continue
+
+                names = [r.name for r in job_results]
+                if job.lock is not None:
+                    entry = {'type': 'archive', **fingerprints[id(job)]}
+                    if job.is_glob:
+                        entry['skills'] = names
+                    job.lock.set(job.name, entry)
+                success += len(names)
+    except Exception as e:
+        print(f"    ❌ Failed to fetch {url}: {e}")
+        failed += len(pending) - processed
+
+    return success, failed
+
+
+def collect_jobs(
     workflow_path: Path,
     skill_name: str | None = None,
+    lock: SkillLock | None = None
+) -> list[SkillJob]:
+    """Collect the skills to update from a workflow's skill-source.json."""
+    workflow_name = workflow_path.name
+    print(f"\n📦 Workflow: {workflow_name}")
+
+    config = load_skill_source(workflow_path)
+    output_dir = workflow_path / '.claude' / 'skills'
+
+    jobs = [
+        SkillJob(skill, output_dir, lock)
+        for skill in config.get('skills', [])
+        # Filter by skill name if specified
+        if not skill_name or skill.get('name') == skill_name
+    ]
+
+    if skill_name and not jobs:
+        print(f"  ⚠️  Skill '{skill_name}' not found in {workflow_name}")
+
+    return jobs
+
+
+def update_workflows(
+    workflow_paths: list[Path],
+    skill_name: str | None = None,
     force: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    cache: RepoCache | None = None,
+    jobs: int = 1,
+    incremental: bool = True,
+    store: SkillStore | None = None
 ) -> tuple[int, int]:
     """
-    Update skills in a workflow.
+    Update skills across one or more workflows.
+
+    All skill-source.json files are loaded first and planned into
+    de-duplicated fetches (see plan_fetches), so each repository and
+    archive is fetched once per run, no matter how many skills or workflows
+    use it. Installed sources are recorded in each workflow's
+    skill-lock.json.
 
     Args:
-        workflow_path: Path to workflow directory
+        workflow_paths: Workflow directories to update
         skill_name: Specific skill to update (None = all)
         force: Overwrite existing
-        dry_run: Just print what would happen
+        dry_run: Just print the fetch plan
+        cache: Optional mirror cache for GitHub sources
+        jobs: Number of repositories/archives to fetch in parallel
+        incremental: Skip skills whose upstream source has not changed
+        store: Optional content-addressed store; known skill trees are
+            installed from it without re-hashing
 
     Returns:
         Tuple of (success_count, fail_count)
     """
-    workflow_name = workflow_path.name
-    print(f"\n📦 Workflow: {workflow_name}")
+    locks: list[SkillLock] = []
+    skill_jobs: list[SkillJob] = []
+    for workflow_path in workflow_paths:
+        # Read in dry runs too (glob entries count their locked matches)
+        lock = SkillLock(workflow_path)
+        if not dry_run:
+            locks.append(lock)
+            # Clean up staging/replaced directories left by interrupted runs
+            collect_garbage(workflow_path / '.claude' / 'skills')
+        skill_jobs.extend(collect_jobs(workflow_path, skill_name, lock))
+
+    plan = plan_fetches(skill_jobs)
+    if dry_run:
+        plan.print()
+        return plan.skills, 0
+
+    tasks: list[tuple[int, Callable[[], tuple[int, int]]]] = []
+    for job in plan.others:
+        def run_skill(job=job) -> tuple[int, int]:
+            ok = update_skill(
+                job.skill, job.output_dir, force, dry_run, cache, job.lock, incremental, store
+            )
+            return (1, 0) if ok else (0, 1)
+        tasks.append((1, run_skill))
+
+    for url, archive_jobs in plan.archives.items():
+        def run_archive(url=url, archive_jobs=archive_jobs) -> tuple[int, int]:
+            return update_archive(url, archive_jobs, force, incremental, store)
+        tasks.append((sum(job.skill_count for job in archive_jobs), run_archive))
+
+    for (repo_url, ref), repo_jobs in plan.repos.items():
+        def run_repo(repo_url=repo_url, repo_jobs=repo_jobs, ref=ref) -> tuple[int, int]:
+            return update_github_repo(repo_url, repo_jobs, force, cache, incremental, store, ref)
+        tasks.append((sum(job.skill_count for job in repo_jobs), run_repo))
 
-    config = load_skill_source(workflow_path)
-    skills = config.get('skills', [])
-    output_dir = workflow_path / '.claude' / 'skills'
+    try:
+        return run_tasks(tasks, jobs)
+    finally:
+        for lock in locks:
+            lock.save()
+
+
+def run_tasks(
+    tasks: list[tuple[int, Callable[[], tuple[int, int]]]],
+    jobs: int = 1
+) -> tuple[int, int]:
+    """
+    Run update tasks, optionally on a bounded thread pool.
+
+    Args:
+        tasks: (skill_count, task) pairs; each task returns (success, failed),
+            and a task that raises counts all of its skills as failed
+        jobs: Maximum number of tasks to run at once
 
+    Returns:
+        Tuple of (success_count, fail_count)
+    """
     success = 0
     failed = 0
 
-    for skill in skills:
-        name = skill.get('name')
+    if jobs <= 1 or len(tasks) <= 1:
+        for count, task in tasks:
+            try:
+                s, f = task()
+            except Exception as e:
+                print(f"    ❌ Update task failed: {e}")
+                s, f = 0, count
+            success += s
+            failed += f
+        return success, failed
+
+    with BufferedStdout(sys.stdout) as out, ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(out.run, task): count
+            for count, task in tasks
+        }
+        for future in as_completed(futures):
+            try:
+                s, f = future.result()
+            except Exception as e:
+                print(f"    ❌ Update task failed: {e}")
+                s, f = 0, futures[future]
+            success += s
+            failed += f
 
-        # Filter by skill name if specified
-        if skill_name and name != skill_name:
-            continue
+    return success, failed
 
-        if update_skill(skill, output_dir, force, dry_run):
-            success += 1
-        else:
-            failed += 1
 
-    if skill_name and success == 0 and failed == 0:
-        print(f"  ⚠️  Skill '{skill_name}' not found in {workflow_name}")
+def update_workflow(
+    workflow_path: Path,
+    skill_name: str | None = None,
+    force: bool = True,
+    dry_run: bool = False,
+    cache: RepoCache | None = None,
+    jobs: int = 1,
+    incremental: bool = True,
+    store: SkillStore | None = None
+) -> tuple[int, int]:
+    """
+    Update skills in a workflow.
 
-    return success, failed
+    Args:
+        workflow_path: Path to workflow directory
+        skill_name: Specific skill to update (None = all)
+        force: Overwrite existing
+        dry_run: Just print what would happen
+        cache: Optional mirror cache for GitHub sources
+        jobs: Number of repositories/archives to fetch in parallel
+        incremental: Skip skills whose upstream source has not changed
+        store: Optional content-addressed store to install through
+
+    Returns:
+        Tuple of (success_count, fail_count)
+    """
+    return update_workflows(
+        [workflow_path], skill_name, force, dry_run, cache, jobs, incremental, store
+    )
 
 
 def main():
@@ -221,29 +857,65 @@ def main():
     parser.add_argument(
         '--dry-run', '-n',
         action='store_true',
-        help="Show what would be updated without making changes"
+        help="Show the fetch plan without making changes"
     )
     parser.add_argument(
         '--list', '-l',
         action='store_true',
         help="List available workflows and skills"
     )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help="Reinstall skills even if skill-lock.json says they are up to date"
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help="Number of repositories/archives to fetch in parallel (default: 1)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Clone repositories directly instead of using the local mirror cache"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        help="Mirror cache directory (default: ~/.cache/ai-workflow/repos)"
+    )
+    parser.add_argument(
+        '--store',
+        action='store_true',
+        help="Install through the shared content-addressed store, so identical "
+             "files share disk blocks via reflinks (btrfs, xfs); ignored on "
+             "filesystems without reflink support"
+    )
+    parser.add_argument(
+        '--store-dir',
+        type=Path,
+        help="Content-addressed store directory (default: ~/.cache/ai-workflow/store)"
+    )
 
     args = parser.parse_args()
 
     root = get_workflows_root()
 
-    # List mode
+    # List mode (reads the incrementally refreshed catalog)
     if args.list:
+        catalog = load_catalog(root)
         print("\n📋 Available Workflows:\n")
-        for workflow_path in get_workflows():
-            workflow_name = workflow_path.name.replace('-workflow', '')
-            config = load_skill_source(workflow_path)
-            skills = config.get('skills', [])
+        for name, workflow in catalog.workflows.items():
+            workflow_name = name.replace('-workflow', '')
+            skills = workflow['skills']
             print(f"  {workflow_name} ({len(skills)} skills)")
-            for skill in skills:
-                stype = skill.get('type', 'github')
-                print(f"    - {skill.get('name')} [{stype}]")
+            for skill_name, entry in skills.items():
+                if entry.get('description'):
+                    status = f" - {textwrap.shorten(entry['description'], 70)}"
+                else:
+                    status = "" if entry.get('installed') else " (not installed)"
+                print(f"    - {skill_name} [{entry['type']}]{status}")
             print()
         return
 
@@ -254,9 +926,6 @@ def main():
     if args.workflow and not args.skill and not args.all_skills:
         parser.error("Specify --skill or --all for the workflow")
 
-    total_success = 0
-    total_failed = 0
-
     # Determine which workflows to update
     if args.all_workflows:
         workflows = get_workflows()
@@ -274,17 +943,24 @@ def main():
 
         workflows = [workflow_path]
 
-    # Update workflows
-    for workflow_path in workflows:
-        skill_name = args.skill if not args.all_skills else None
-        success, failed = update_workflow(
-            workflow_path,
-            skill_name=skill_name,
-            force=args.force,
-            dry_run=args.dry_run
-        )
-        total_success += success
-        total_failed += failed
+    # Update workflows together so shared repositories are cloned once
+    skill_name = args.skill if not args.all_skills else None
+    cache = None if args.no_cache else RepoCache(args.cache_dir)
+    store = SkillStore(args.store_dir) if args.store else None
+    if store is not None and not store.supports_reflinks(get_workflows_root()):
+        # Without reflinks the store would only add a second copy of every file
+        print("⚠️  No reflink support between the store and the workflows, installing directly")
+        store = None
+    total_success, total_failed = update_workflows(
+        workflows,
+        skill_name=skill_name,
+        force=args.force,
+        dry_run=args.dry_run,
+        cache=cache,
+        jobs=args.jobs,
+        incremental=not args.full,
+        store=store
+    )
 
     # Summary
     print(f"\n{'=' * 40}")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Validate SKILL.md files and workflow structure in one pass.
+
+The tree is walked once with os.scandir (symlinks are not followed, and
+.git / node_modules are skipped). Every SKILL.md frontmatter is parsed
+in-process with the shared parser from skill_metadata.py; large trees are
+split across a process pool. Workflow structure (README.md, .claude/skills
+and the skill count) is derived from the same walk.
+
+Checks:
+- SKILL.md: frontmatter present and parseable, non-empty name and
+  description (errors); name differs from the skill directory (warning)
+- Workflows: missing README.md or .claude/skills (warnings)
+
+Usage:
+    python scripts/validate_skills.py              # Validate the repository
+    python scripts/validate_skills.py workflows/   # Validate a subtree
+    python scripts/validate_skills.py --json       # Machine-readable results
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from skill_metadata import SKILL_FILENAME, FrontmatterError, load_skill_metadata
+
+
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
+PARALLEL_THRESHOLD = 200  # Below this many files a process pool costs more than it saves
+WORKFLOW_SUFFIX = '-workflow'
+
+
+@dataclass
+class SkillResult:
+    """Validation result for one SKILL.md."""
+    path: str
+    name: str | None = None
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class WorkflowResult:
+    """Structure check result for one workflow directory."""
+    path: str
+    skills: int = 0
+    warnings: list[str] = field(default_factory=list)
+
+
+def scan_tree(root: Path) -> tuple[list[str], list[str]]:
+    """
+    Walk root once.
+
+    Returns:
+        (SKILL.md paths, workflow directory paths), both sorted
+    """
+    skill_files = []
+    workflows = []
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS:
+                        continue
+                    if entry.name.endswith(WORKFLOW_SUFFIX) and os.path.basename(directory) == 'workflows':
+                        workflows.append(entry.path)
+                    stack.append(entry.path)
+                elif entry.name == SKILL_FILENAME and entry.is_file(follow_symlinks=False):
+                    skill_files.append(entry.path)
+    return sorted(skill_files), sorted(workflows)
+
+
+def check_skill(path: str) -> SkillResult:
+    """Validate one SKILL.md (runs in worker processes for large trees)."""
+    result = SkillResult(path)
+    try:
+        meta = load_skill_metadata(path)
+    except FrontmatterError as e:
+        result.errors.append(str(e))
+        return result
+    except OSError as e:
+        result.errors.append(f"Cannot read SKILL.md: {e}")
+        return result
+
+    result.name = meta.name
+    directory = os.path.basename(os.path.dirname(path))
+    if meta.name != directory:
+        result.warnings.append(f"name '{meta.name}' differs from directory '{directory}'")
+    return result
+
+
+def check_skills(paths: list[str], jobs: int | None = None) -> list[SkillResult]:
+    """Validate SKILL.md files, in a process pool when there are many."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(paths) < PARALLEL_THRESHOLD:
+        return [check_skill(path) for path in paths]
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(check_skill, paths, chunksize=chunksize))
+
+
+def check_workflows(workflows: list[str], skill_files: list[str]) -> list[WorkflowResult]:
+    """Check workflow structure, counting skills from the already scanned SKILL.md list."""
+    results = []
+    for workflow in workflows:
+        result = WorkflowResult(workflow)
+        if not os.path.isfile(os.path.join(workflow, 'README.md')):
+            result.warnings.append("Missing README.md")
+
+        skills_dir = os.path.join(workflow, '.claude', 'skills')
+        if not os.path.isdir(skills_dir):
+            result.warnings.append("Missing .claude/skills directory")
+        else:
+            prefix = skills_dir + os.sep
+            result.skills = sum(1 for path in skill_files if path.startswith(prefix))
+        results.append(result)
+    return results
+
+
+def validate_tree(root: Path, jobs: int | None = None) -> dict[str, Any]:
+    """
+    Validate all skills and workflows under root.
+
+    Returns:
+        {"skills": [...], "workflows": [...], "errors": n, "warnings": n}
+    """
+    skill_files, workflows = scan_tree(root)
+    skills = check_skills(skill_files, jobs)
+    workflow_results = check_workflows(workflows, skill_files)
+    return {
+        'skills': skills,
+        'workflows': workflow_results,
+        'errors': sum(len(s.errors) for s in skills),
+        'warnings': sum(len(s.warnings) for s in skills) + sum(len(w.warnings) for w in workflow_results),
+    }
+
+
+def relative(path: str, root: Path) -> str:
+    return os.path.relpath(path, root)
+
+
+def print_report(report: dict[str, Any], root: Path, verbose: bool = False) -> None:
+    print("Validating SKILL.md files...")
+    for skill in report['skills']:
+        if skill.errors:
+            print(f"  ❌ {relative(skill.path, root)}")
+            for error in skill.errors:
+                print(f"     {error}")
+        elif skill.warnings or verbose:
+            print(f"  ✅ {relative(skill.path, root)}")
+        for warning in skill.warnings:
+            print(f"     ⚠️ {warning}")
+    print(f"Found {len(report['skills'])} SKILL.md files")
+
+    print("\nChecking workflow structures...")
+    for workflow in report['workflows']:
+        print(f"  {relative(workflow.path, root)}: 📦 Skills: {workflow.skills}")
+        for warning in workflow.warnings:
+            print(f"     ⚠️ {warning}")
+
+    print()
+    if report['errors']:
+        print(f"❌ {report['errors']} errors found")
+    else:
+        print("✅ All files valid")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate SKILL.md files and workflow structure"
+    )
+    parser.add_argument(
+        'root',
+        nargs='?',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Directory to validate (default: repository root)"
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help="Worker processes for large trees (default: CPU count)"
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help="List valid skills too"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Output results as JSON"
+    )
+
+    args = parser.parse_args()
+    root = args.root.resolve()
+    report = validate_tree(root, args.jobs)
+
+    if args.json:
+        output = {
+            'skills': [
+                {**asdict(s), 'path': relative(s.path, root), 'valid': s.valid}
+                for s in report['skills']
+            ],
+            'workflows': [
+                {**asdict(w), 'path': relative(w.path, root)}
+                for w in report['workflows']
+            ],
+            'errors': report['errors'],
+            'warnings': report['warnings'],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print_report(report, root, args.verbose)
+
+    sys.exit(1 if report['errors'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,61 @@
 Validate skill sources without downloading.
 
 Checks:
-- GitHub repos: Uses git ls-remote to verify repo exists
-- GitHub paths: Uses GitHub API to verify path exists in repo
+- GitHub repos: Uses git ls-remote (once per repo and ref) to verify the
+  repo exists and resolve the skill's "ref" (HEAD if unset)
+- GitHub paths: Fetches each repo's file tree once per ref (GitHub Trees
+  API, or a blobless clone when rate limited) and checks every path, or
+  glob, against it
 - Archive URLs: Uses HEAD request to verify URL is reachable
 
+All workflows are validated together on one asyncio event loop, with a
+separate concurrency limit for github.com, api.github.com and each archive
+host (see HOST_LIMITS).
+
+Results are cached in ~/.cache/ai-workflow/validation.json. By default
+every source is still checked on each run: archive results are revalidated
+with a conditional HEAD, and path checks are keyed by the commit the skill's
+ref resolves to, so they are only repeated when that ref moves. With
+--max-age, results younger than that are trusted without any request.
+
 Usage:
     python scripts/validate_sources.py                     # Validate all
     python scripts/validate_sources.py -w content-creator  # Validate one workflow
     python scripts/validate_sources.py --verbose           # Show details
+    python scripts/validate_sources.py --max-age 3600      # Trust results up to an hour old
 """
 
 import argparse
+import asyncio
+import glob
 import json
+import os
 import subprocess
 import sys
-import urllib.request
+import tempfile
+import time
 import urllib.error
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
+from urllib.parse import urlparse
 from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+from http_client import request as http_request
+from repo_cache import normalize_repo_url
+
+
+T = TypeVar('T')
+
+# Concurrent checks allowed per host; archive hosts use DEFAULT_HOST_LIMIT each
+HOST_LIMITS = {
+    'github.com': 8,       # git ls-remote and blobless clones
+    'api.github.com': 4,   # REST API, rate limited
+}
+DEFAULT_HOST_LIMIT = 4
+LOCAL_HOST = 'local'
+
+DEFAULT_MAX_AGE = 0  # Seconds a cached result is trusted without any request
 
 
 @dataclass
@@ -35,6 +70,55 @@ class ValidationResult:
     message: str
     repo: str = ""
     path: str = ""
+    head: str = ""  # Commit the skill's ref (or HEAD) resolved to, for GitHub sources
+
+
+def default_results_path() -> Path:
+    """Get the validation result cache file, honouring XDG_CACHE_HOME."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'ai-workflow' / 'validation.json'
+
+
+class ResultCache:
+    """
+    On-disk cache of validation results, keyed by source.
+
+    Keys:
+        repo:<url>                 HEAD commit of a repo that exists
+        path:<url>@<sha>:<path>    whether path exists at that commit
+        archive:<url>              a reachable archive, with its ETag and
+                                   Last-Modified for conditional requests
+    """
+
+    def __init__(self, path: Path | None = None, max_age: float = DEFAULT_MAX_AGE):
+        self.path = Path(path) if path else default_results_path()
+        self.max_age = max_age
+        self._dirty = False
+        try:
+            self._entries: dict[str, dict[str, Any]] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Cached entry for key, whatever its age."""
+        return self._entries.get(key)
+
+    def fresh(self, entry: dict[str, Any] | None) -> bool:
+        """Check whether an entry is young enough to reuse without a request."""
+        return entry is not None and time.time() - entry.get('checked_at', 0) < self.max_age
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        self._entries[key] = {**entry, 'checked_at': time.time()}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._entries, sort_keys=True))
+        os.replace(tmp, self.path)
+        self._dirty = False
 
 
 def get_project_root() -> Path:
@@ -68,80 +152,195 @@ def load_skill_source(workflow_path: Path) -> dict[str, Any]:
         return json.load(f)
 
 
-def check_github_repo(repo_url: str) -> tuple[bool, str]:
+async def ls_remote_head(repo_url: str, ref: str | None = None) -> tuple[bool, str, str]:
     """
-    Check if a GitHub repo exists using git ls-remote.
+    Resolve a repo's HEAD commit (or a branch/tag's) using git ls-remote.
 
     Returns:
-        Tuple of (exists, message)
+        Tuple of (exists, message, head_sha)
     """
     # Normalize URL
     if not repo_url.endswith('.git'):
         repo_url = repo_url + '.git'
 
+    # '<ref>^{}' makes annotated tags also list the commit they point to
+    patterns = [ref, f'{ref}^{{}}'] if ref else ['HEAD']
+
     try:
-        result = subprocess.run(
-            ['git', 'ls-remote', '--exit-code', '-h', repo_url],
-            capture_output=True,
-            text=True,
-            timeout=30
+        process = await asyncio.create_subprocess_exec(
+            'git', 'ls-remote', '--exit-code', repo_url, *patterns,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            stdin=asyncio.subprocess.DEVNULL,
+            # Never wait on a credential prompt for a missing/private repo
+            env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
         )
-        if result.returncode == 0:
-            return True, "Repo exists"
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False, "Timeout checking repo", ""
+
+        lines = [line.split() for line in stdout.decode().splitlines() if line.strip()]
+        if process.returncode == 0 and lines:
+            # Annotated tags list the tag object, then the commit as <tag>^{}
+            peeled = [sha for sha, name in lines if name.endswith('^{}')]
+            return True, "Repo exists", peeled[0] if peeled else lines[0][0]
+        elif ref:
+            return False, f"Repo or ref '{ref}' not found or not accessible", ""
         else:
-            return False, f"Repo not found or not accessible"
-    except subprocess.TimeoutExpired:
-        return False, "Timeout checking repo"
+            return False, "Repo not found or not accessible", ""
     except Exception as e:
-        return False, f"Error: {e}"
+        return False, f"Error: {e}", ""
 
 
-def check_github_path(repo_url: str, path: str) -> tuple[bool, str]:
+def github_owner_repo(repo_url: str) -> tuple[str, str] | None:
     """
-    Check if a path exists in a GitHub repo using GitHub API.
+    Extract (owner, repo) from a GitHub URL.
 
-    Returns:
-        Tuple of (exists, message)
+    https://github.com/owner/repo -> ('owner', 'repo')
     """
-    # Extract owner/repo from URL
-    # https://github.com/owner/repo -> owner/repo
     repo_url = repo_url.rstrip('/')
     if repo_url.endswith('.git'):
         repo_url = repo_url[:-4]
 
+    if not repo_url.startswith('https://github.com/'):
+        return None
+
     parts = repo_url.replace('https://github.com/', '').split('/')
     if len(parts) < 2:
-        return False, "Invalid GitHub URL"
+        return None
+
+    return parts[0], parts[1]
+
+
+def fetch_tree_api(owner: str, repo: str, sha: str = 'HEAD') -> set[str] | None:
+    """
+    List every path in a GitHub repo with one Git Trees API call.
+
+    Set GITHUB_TOKEN to raise the API rate limit.
+
+    Returns:
+        Set of file and directory paths, or None if the API could not
+        provide a complete tree (rate limited, private, truncated, ...)
+    """
+    api_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{sha}?recursive=1"
+    headers = {
+        'User-Agent': 'skill-validator',
+        'Accept': 'application/vnd.github.v3+json'
+    }
+    if os.environ.get('GITHUB_TOKEN'):
+        headers['Authorization'] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+    try:
+        with http_request('GET', api_url, headers=headers, timeout=30) as response:
+            data = json.load(response)
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+    if data.get('truncated'):
+        return None  # Very large repo, the API only returns part of the tree
+    return {entry['path'] for entry in data.get('tree', [])}
+
+
+def fetch_tree_git(repo_url: str, ref: str | None = None) -> set[str] | None:
+    """
+    List every path in a repo from a blobless, depth-1 bare clone.
+
+    ref selects a branch or tag; the default branch is used if None.
+
+    Only commit and tree objects are transferred, and git clones do not
+    count against the GitHub API rate limit.
+
+    Returns:
+        Set of file and directory paths, or None on failure
+    """
+    with tempfile.TemporaryDirectory(prefix='skill-validator-') as temp_dir:
+        try:
+            branch = ['--branch', ref] if ref else []
+            subprocess.run(
+                ['git', 'clone', '--quiet', '--bare', '--depth', '1',
+                 '--filter=blob:none', *branch, repo_url, temp_dir],
+                capture_output=True,
+                check=True,
+                timeout=120
+            )
+            result = subprocess.run(
+                ['git', 'ls-tree', '-r', '-t', '-z', '--name-only', 'HEAD'],
+                cwd=temp_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=60
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return None
+    return {path for path in result.stdout.split('\0') if path}
+
 
-    owner, repo = parts[0], parts[1]
+def glob_skill_dirs(tree: set[str], pattern: str) -> list[str]:
+    """
+    Skill directories in a repo tree that match a glob path like 'skills/*'.
+
+    Components match one by one as with glob.glob: '*' does not cross '/',
+    and hidden names only match patterns that start with '.'.
+
+    Returns:
+        Sorted matching directories that contain a SKILL.md
+    """
+    parts = pattern.strip('/').split('/')
+    matches = []
+    for path in tree:
+        names = path.split('/')
+        if len(names) != len(parts) or f"{path}/SKILL.md" not in tree:
+            continue
+        if all(
+            fnmatchcase(name, part) and (not name.startswith('.') or part.startswith('.'))
+            for name, part in zip(names, parts)
+        ):
+            matches.append(path)
+    return sorted(matches)
+
+
+def head_archive_url(
+    url: str,
+    cached: dict[str, Any] | None = None
+) -> tuple[bool | None, str, dict[str, str]]:
+    """
+    Check if an archive URL is reachable using HEAD request.
+
+    With a cached entry the request is conditional (If-None-Match /
+    If-Modified-Since).
 
-    # Use GitHub API to check contents
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
+    Returns:
+        Tuple of (reachable, message, validators); reachable is None if the
+        server answered 304 Not Modified. validators holds the response's
+        etag/last_modified.
+    """
+    headers = {'User-Agent': 'skill-validator'}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
 
     try:
-        request = urllib.request.Request(
-            api_url,
-            headers={
-                'User-Agent': 'skill-validator',
-                'Accept': 'application/vnd.github.v3+json'
+        with http_request('HEAD', url, headers=headers, timeout=15) as response:
+            content_length = response.headers.get('Content-Length', 'unknown')
+            validators = {
+                'etag': response.headers.get('ETag') or '',
+                'last_modified': response.headers.get('Last-Modified') or '',
             }
-        )
-        with urllib.request.urlopen(request, timeout=15) as response:
-            if response.status == 200:
-                return True, "Path exists"
+            return True, f"Reachable (size: {content_length})", validators
     except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return False, f"Path not found: {path}"
-        elif e.code == 403:
-            return None, "Rate limited (path not verified)"  # None = unknown
-        else:
-            return False, f"HTTP {e.code}"
+        if e.code == 304:
+            return None, "Not modified", {}
+        return False, f"HTTP {e.code}", {}
     except urllib.error.URLError as e:
-        return False, f"URL error: {e.reason}"
+        return False, f"URL error: {e.reason}", {}
     except Exception as e:
-        return False, f"Error: {e}"
-
-    return False, "Unknown error"
+        return False, f"Error: {e}", {}
 
 
 def check_archive_url(url: str) -> tuple[bool, str]:
@@ -159,21 +358,297 @@ def check_archive_url(url: str) -> tuple[bool, str]:
         else:
             return False, "Local file not found"
 
-    try:
-        request = urllib.request.Request(
-            url,
-            method='HEAD',
-            headers={'User-Agent': 'skill-validator'}
+    reachable, message, _ = head_archive_url(url)
+    return bool(reachable), message
+
+
+def url_host(url: str) -> str:
+    """Host a URL's checks are limited under (LOCAL_HOST for local paths)."""
+    return urlparse(url).hostname or LOCAL_HOST
+
+
+class Validator:
+    """
+    Validates skill sources for any number of workflows on one event loop.
+
+    Checks run concurrently, bounded per host by HOST_LIMITS. Each repo is
+    probed with ls-remote and listed at most once per run, however many
+    skills and workflows share it: concurrent callers await the same task.
+    Blocking HTTP/git calls run in worker threads.
+
+    With a ResultCache, fresh results are reused without any request.
+    """
+
+    def __init__(
+        self,
+        check_paths: bool = True,
+        host_limits: dict[str, int] | None = None,
+        max_concurrency: int | None = None,
+        cache: ResultCache | None = None
+    ):
+        self.check_paths = check_paths
+        self.cache = cache
+        self.host_limits = {**HOST_LIMITS, **(host_limits or {})}
+        self.max_concurrency = max_concurrency
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._tasks: dict[str, asyncio.Future] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            if self.max_concurrency:
+                # One shared limit, e.g. --no-parallel
+                host = '*'
+                limit = self.max_concurrency
+            else:
+                limit = self.host_limits.get(host, DEFAULT_HOST_LIMIT)
+            self._semaphores.setdefault(host, asyncio.Semaphore(limit))
+        return self._semaphores[host]
+
+    def _once(self, key: str, factory: Callable[[], Awaitable[T]]) -> Awaitable[T]:
+        """Start factory() for key unless it already ran or is running."""
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.ensure_future(factory())
+        return self._tasks[key]
+
+    async def _run(self, host: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking check in a worker thread, within host's limit."""
+        async with self._semaphore(host):
+            return await asyncio.to_thread(fn, *args)
+
+    async def check_repo(self, repo_url: str, ref: str | None = None) -> tuple[bool, str, str]:
+        """
+        Check if a GitHub repo (and ref) exists, probing each once per run.
+
+        Args:
+            repo_url: Repository URL
+            ref: Branch or tag the skill is pinned to (None = HEAD)
+
+        Returns:
+            Tuple of (exists, message, commit the ref resolves to)
+        """
+        key = f"repo:{normalize_repo_url(repo_url)}"
+        if ref:
+            key += f"@{ref}"
+
+        async def probe() -> tuple[bool, str, str]:
+            entry = self.cache.get(key) if self.cache else None
+            if self.cache and self.cache.fresh(entry):
+                return True, "Repo exists", entry['head']
+
+            async with self._semaphore(url_host(repo_url)):
+                result = await ls_remote_head(repo_url, ref)
+            if result[0] and self.cache:
+                self.cache.set(key, {'head': result[2]})
+            return result
+
+        return await self._once(key, probe)
+
+    async def repo_tree(
+        self,
+        repo_url: str,
+        sha: str = 'HEAD',
+        ref: str | None = None
+    ) -> set[str] | None:
+        """
+        Get the set of paths in a repo, fetching it at most once per run.
+
+        Tries the GitHub Trees API first and falls back to a blobless clone
+        of ref. sha is the commit ref resolved to ('HEAD' if unknown).
+
+        Returns:
+            Set of paths, or None if the tree could not be listed
+        """
+        async def fetch() -> set[str] | None:
+            owner_repo = github_owner_repo(repo_url)
+            tree = None
+            if owner_repo:
+                tree_sha = ref if sha == 'HEAD' and ref else sha
+                tree = await self._run('api.github.com', fetch_tree_api, *owner_repo, tree_sha)
+            if tree is None:
+                tree = await self._run(url_host(repo_url), fetch_tree_git, repo_url, ref)
+            return tree
+
+        key = f"tree:{normalize_repo_url(repo_url)}@{ref or 'HEAD'}:{sha}"
+        return await self._once(key, fetch)
+
+    async def check_path(
+        self,
+        repo_url: str,
+        path: str,
+        sha: str = 'HEAD',
+        ref: str | None = None
+    ) -> tuple[bool | None, str]:
+        """
+        Check if a path exists in a GitHub repo against its cached file tree.
+
+        A glob path (e.g. 'skills/*') passes if it matches at least one
+        directory containing a SKILL.md.
+
+        Returns:
+            Tuple of (exists, message); exists is None if the tree could not
+            be listed
+        """
+        # A path's existence at a given commit never changes
+        key = f"path:{normalize_repo_url(repo_url)}@{ref or 'HEAD'}:{sha}:{path.strip('/')}"
+        entry = self.cache.get(key) if self.cache and sha != 'HEAD' else None
+        if entry is not None:
+            exists = entry['exists']
+        else:
+            tree = await self.repo_tree(repo_url, sha, ref)
+            if tree is None:
+                return None, "Repo tree unavailable (path not verified)"  # None = unknown
+            if glob.has_magic(path):
+                exists = bool(glob_skill_dirs(tree, path))
+            else:
+                exists = path.strip('/') in tree
+            if self.cache and sha != 'HEAD':
+                self.cache.set(key, {'exists': exists})
+
+        if exists:
+            return True, "Path exists"
+        if glob.has_magic(path):
+            return False, f"No skill matches: {path}"
+        return False, f"Path not found: {path}"
+
+    async def check_archive(self, url: str) -> tuple[bool, str]:
+        if not url.startswith('http') or self.cache is None:
+            host = url_host(url) if url.startswith('http') else LOCAL_HOST
+            return await self._run(host, check_archive_url, url)
+
+        key = f"archive:{url}"
+        entry = self.cache.get(key)
+        if self.cache.fresh(entry):
+            return True, entry['message']
+
+        reachable, message, validators = await self._run(
+            url_host(url), head_archive_url, url, entry
         )
-        with urllib.request.urlopen(request, timeout=15) as response:
-            content_length = response.headers.get('Content-Length', 'unknown')
-            return True, f"Reachable (size: {content_length})"
-    except urllib.error.HTTPError as e:
-        return False, f"HTTP {e.code}"
-    except urllib.error.URLError as e:
-        return False, f"URL error: {e.reason}"
-    except Exception as e:
-        return False, f"Error: {e}"
+        if reachable is None:  # 304, the cached result still holds
+            self.cache.set(key, entry)
+            return True, entry['message']
+        if reachable:
+            self.cache.set(key, {'message': message, **validators})
+        return reachable, message
+
+    async def validate_skill(self, skill: dict[str, Any], workflow_name: str) -> ValidationResult:
+        """
+        Validate a single skill source.
+
+        Args:
+            skill: Skill configuration
+            workflow_name: Name of the workflow
+
+        Returns:
+            ValidationResult
+        """
+        name = skill.get('name', 'unknown')
+        source_type = skill.get('type', 'github')
+
+        if source_type == 'github':
+            repo = skill.get('repo', '')
+            path = skill.get('path', name)
+            ref = skill.get('ref') or None
+
+            # First check if repo (and the pinned ref) exists
+            repo_valid, repo_msg, head = await self.check_repo(repo, ref)
+
+            if not repo_valid:
+                return ValidationResult(
+                    skill_name=name,
+                    workflow=workflow_name,
+                    source_type=source_type,
+                    valid=False,
+                    message=repo_msg,
+                    repo=repo,
+                    path=path
+                )
+
+            # Optionally check if path exists
+            if self.check_paths:
+                path_valid, path_msg = await self.check_path(repo, path, head or 'HEAD', ref)
+                if path_valid is None:  # Tree unavailable
+                    return ValidationResult(
+                        skill_name=name,
+                        workflow=workflow_name,
+                        source_type=source_type,
+                        valid=True,  # Repo valid, path unknown
+                        message=f"Repo OK, {path_msg}",
+                        repo=repo,
+                        path=path,
+                        head=head
+                    )
+                elif not path_valid:
+                    return ValidationResult(
+                        skill_name=name,
+                        workflow=workflow_name,
+                        source_type=source_type,
+                        valid=False,
+                        message=path_msg,
+                        repo=repo,
+                        path=path,
+                        head=head
+                    )
+
+            return ValidationResult(
+                skill_name=name,
+                workflow=workflow_name,
+                source_type=source_type,
+                valid=True,
+                message="OK",
+                repo=repo,
+                path=path,
+                head=head
+            )
+
+        elif source_type == 'archive':
+            url = skill.get('url', '')
+
+            url_valid, url_msg = await self.check_archive(url)
+
+            return ValidationResult(
+                skill_name=name,
+                workflow=workflow_name,
+                source_type=source_type,
+                valid=url_valid,
+                message=url_msg,
+                repo=url
+            )
+
+        else:
+            return ValidationResult(
+                skill_name=name,
+                workflow=workflow_name,
+                source_type=source_type,
+                valid=False,
+                message=f"Unknown source type: {source_type}"
+            )
+
+    async def validate(
+        self,
+        skills: list[tuple[str, dict[str, Any]]],
+        on_result: Callable[[ValidationResult], None] | None = None
+    ) -> list[ValidationResult]:
+        """
+        Validate (workflow_name, skill) pairs concurrently.
+
+        Args:
+            skills: Skills to validate with the workflow each belongs to
+            on_result: Called with each result as soon as it is ready
+
+        Returns:
+            List of ValidationResults, in completion order
+        """
+        tasks = [
+            asyncio.ensure_future(self.validate_skill(skill, workflow_name))
+            for workflow_name, skill in skills
+        ]
+        results = []
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
 
 
 def validate_skill(
@@ -187,88 +662,50 @@ def validate_skill(
     Args:
         skill: Skill configuration
         workflow_name: Name of the workflow
-        check_paths: Whether to check paths (uses GitHub API, may rate limit)
+        check_paths: Whether to check paths (lists the repo tree)
 
     Returns:
         ValidationResult
     """
-    name = skill.get('name', 'unknown')
-    source_type = skill.get('type', 'github')
-
-    if source_type == 'github':
-        repo = skill.get('repo', '')
-        path = skill.get('path', name)
-
-        # First check if repo exists
-        repo_valid, repo_msg = check_github_repo(repo)
-
-        if not repo_valid:
-            return ValidationResult(
-                skill_name=name,
-                workflow=workflow_name,
-                source_type=source_type,
-                valid=False,
-                message=repo_msg,
-                repo=repo,
-                path=path
-            )
+    return asyncio.run(Validator(check_paths).validate_skill(skill, workflow_name))
 
-        # Optionally check if path exists
-        if check_paths:
-            path_valid, path_msg = check_github_path(repo, path)
-            if path_valid is None:  # Rate limited
-                return ValidationResult(
-                    skill_name=name,
-                    workflow=workflow_name,
-                    source_type=source_type,
-                    valid=True,  # Repo valid, path unknown
-                    message=f"Repo OK, {path_msg}",
-                    repo=repo,
-                    path=path
-                )
-            elif not path_valid:
-                return ValidationResult(
-                    skill_name=name,
-                    workflow=workflow_name,
-                    source_type=source_type,
-                    valid=False,
-                    message=path_msg,
-                    repo=repo,
-                    path=path
-                )
 
-        return ValidationResult(
-            skill_name=name,
-            workflow=workflow_name,
-            source_type=source_type,
-            valid=True,
-            message="OK",
-            repo=repo,
-            path=path
-        )
+def validate_workflows(
+    workflow_paths: list[Path],
+    check_paths: bool = True,
+    verbose: bool = False,
+    parallel: bool = True,
+    cache: ResultCache | None = None
+) -> list[ValidationResult]:
+    """
+    Validate all skills in one or more workflows in a single run.
 
-    elif source_type == 'archive':
-        url = skill.get('url', '')
+    Args:
+        workflow_paths: Paths to workflow directories
+        check_paths: Whether to check paths in repos
+        verbose: Print each result as it completes
+        parallel: Run checks concurrently (per-host limits apply)
+        cache: Optional result cache to reuse and record results in
 
-        url_valid, url_msg = check_archive_url(url)
+    Returns:
+        List of ValidationResults
+    """
+    skills = []
+    for workflow_path in workflow_paths:
+        workflow_name = workflow_path.name.replace('-workflow', '')
+        config = load_skill_source(workflow_path)
+        skills.extend((workflow_name, skill) for skill in config.get('skills', []))
 
-        return ValidationResult(
-            skill_name=name,
-            workflow=workflow_name,
-            source_type=source_type,
-            valid=url_valid,
-            message=url_msg,
-            repo=url
-        )
+    def report(result: ValidationResult) -> None:
+        status = "✓" if result.valid else "✗"
+        print(f"  {status} {result.workflow}/{result.skill_name}: {result.message}")
 
-    else:
-        return ValidationResult(
-            skill_name=name,
-            workflow=workflow_name,
-            source_type=source_type,
-            valid=False,
-            message=f"Unknown source type: {source_type}"
-        )
+    validator = Validator(check_paths, max_concurrency=None if parallel else 1, cache=cache)
+    try:
+        return asyncio.run(validator.validate(skills, report if verbose else None))
+    finally:
+        if cache is not None:
+            cache.save()
 
 
 def validate_workflow(
@@ -289,33 +726,7 @@ def validate_workflow(
     Returns:
         List of ValidationResults
     """
-    workflow_name = workflow_path.name.replace('-workflow', '')
-    config = load_skill_source(workflow_path)
-    skills = config.get('skills', [])
-
-    results = []
-
-    if parallel:
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(validate_skill, skill, workflow_name, check_paths): skill
-                for skill in skills
-            }
-            for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
-                if verbose:
-                    status = "✓" if result.valid else "✗"
-                    print(f"  {status} {result.skill_name}: {result.message}")
-    else:
-        for skill in skills:
-            result = validate_skill(skill, workflow_name, check_paths)
-            results.append(result)
-            if verbose:
-                status = "✓" if result.valid else "✗"
-                print(f"  {status} {result.skill_name}: {result.message}")
-
-    return results
+    return validate_workflows([workflow_path], check_paths, verbose, parallel)
 
 
 def print_summary(results: list[ValidationResult], verbose: bool = False):
@@ -372,7 +783,7 @@ def main():
     parser.add_argument(
         '--no-paths',
         action='store_true',
-        help="Skip path validation (faster, avoids rate limits)"
+        help="Skip path validation (no repo tree listing)"
     )
     parser.add_argument(
         '--verbose', '-v',
@@ -384,6 +795,18 @@ def main():
         action='store_true',
         help="Disable parallel validation"
     )
+    parser.add_argument(
+        '--max-age',
+        type=float,
+        default=DEFAULT_MAX_AGE,
+        help=f"Trust cached results younger than this many seconds without any request "
+             f"(default: {DEFAULT_MAX_AGE}, always revalidate with conditional requests)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Ignore and don't update the validation result cache"
+    )
     parser.add_argument(
         '--json',
         action='store_true',
@@ -409,21 +832,17 @@ def main():
     else:
         workflows = get_workflows()
 
-    all_results = []
+    if args.verbose:
+        names = ', '.join(w.name.replace('-workflow', '') for w in workflows)
+        print(f"\n📦 Validating: {names}")
 
-    for workflow_path in workflows:
-        workflow_name = workflow_path.name.replace('-workflow', '')
-
-        if args.verbose:
-            print(f"\n📦 Validating: {workflow_name}")
-
-        results = validate_workflow(
-            workflow_path,
-            check_paths=not args.no_paths,
-            verbose=args.verbose,
-            parallel=not args.no_parallel
-        )
-        all_results.extend(results)
+    all_results = validate_workflows(
+        workflows,
+        check_paths=not args.no_paths,
+        verbose=args.verbose,
+        parallel=not args.no_parallel,
+        cache=None if args.no_cache else ResultCache(max_age=args.max_age)
+    )
 
     if args.json:
         import json
@@ -435,7 +854,8 @@ def main():
                 'valid': r.valid,
                 'message': r.message,
                 'repo': r.repo,
-                'path': r.path
+                'path': r.path,
+                'head': r.head
             }
             for r in all_results
         ]